@@ -0,0 +1,156 @@
+import argparse
+import time
+import tracemalloc
+
+
+import numpy as np
+
+from engine.leaf_evaluators import LinearLeafEvaluator
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.rollout_policies import ROLLOUT_POLICIES
+from games.game_components.random_service import RandomService, set_random_service
+from games.synthetic_game.synthetic_game import SyntheticGame
+
+
+def parseArguments():
+    # Create argument parser
+    parser = argparse.ArgumentParser()
+
+    # Optional arguments
+    parser.add_argument("-s", help="Simulation counts to benchmark", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("-b", help="Branching factor", type=int, default=8)
+    parser.add_argument("-d", help="Game depth in plies", type=int, default=20)
+    parser.add_argument("-p", help="Number of player_count", type=int, default=2)
+    parser.add_argument("-t", help="Transposition rate", type=float, default=0.0)
+    parser.add_argument("-c", help="Rollout cost (extra hash rounds per move)", type=int, default=0)
+    parser.add_argument(
+        "-z",
+        help=f"Score distribution {list(SyntheticGame.score_distributions)}",
+        type=str,
+        default="win_loss",
+    )
+    parser.add_argument(
+        "-r",
+        help=f"rollout policy {list(ROLLOUT_POLICIES)}",
+        type=str,
+        choices=list(ROLLOUT_POLICIES),
+        default="uniform",
+    )
+    parser.add_argument("-m", help="maximum rollout depth in plies before static evaluation", type=int, default=None)
+    parser.add_argument("-n", help="maximum tree nodes before cold subtrees are pruned", type=int, default=None)
+    parser.add_argument(
+        "-e", help="leaf evaluator batch size, scoring leaves with a random linear evaluator", type=int, default=None
+    )
+    parser.add_argument("--seed", help="Seed for the game tree and the engine", type=int, default=0)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    return args
+
+
+def run_search(
+    game: SyntheticGame,
+    sims: int,
+    rollout_policy: str,
+    max_rollout_depth: int = None,
+    max_nodes: int = None,
+    evaluation_batch_size: int = None,
+) -> MonteCarloEngine:
+    leaf_evaluator = None
+    if evaluation_batch_size is not None:
+        weights = np.random.default_rng(game.seed).normal(size=(game.encode_state().size, game.player_count))
+        leaf_evaluator = LinearLeafEvaluator(weights)
+    montecarlo = MonteCarloEngine(
+        start_player=game.get_current_player(),
+        verbose=False,
+        rollout_policy=ROLLOUT_POLICIES[rollout_policy](),
+        max_rollout_depth=max_rollout_depth,
+        max_nodes=max_nodes,
+        leaf_evaluator=leaf_evaluator,
+        evaluation_batch_size=evaluation_batch_size or 1,
+    )
+    montecarlo.select_and_return_best_real_action(
+        num_sims=sims,
+        game=game,
+        node_player=game.get_current_player(),
+        parent=montecarlo.root,
+    )
+    return montecarlo
+
+
+def benchmark(
+    game_kwargs: dict,
+    sims: int,
+    seed: int,
+    rollout_policy: str = "uniform",
+    max_rollout_depth: int = None,
+    max_nodes: int = None,
+    evaluation_batch_size: int = None,
+) -> dict:
+    """Times one search from the initial position, then repeats it under tracemalloc
+    for the peak memory, so tracing does not distort the timing."""
+    set_random_service(RandomService(seed))
+    game = SyntheticGame(**game_kwargs)
+    start_time = time.perf_counter()
+    montecarlo = run_search(game, sims, rollout_policy, max_rollout_depth, max_nodes, evaluation_batch_size)
+    elapsed = time.perf_counter() - start_time
+    nodes = montecarlo.root.count_subtree_nodes()
+    peak_nodes = montecarlo.peak_node_count
+    gc_pause_ms = montecarlo.gc_pause_seconds * 1000
+    del montecarlo
+
+    set_random_service(RandomService(seed))
+    game = SyntheticGame(**game_kwargs)
+    tracemalloc.start()
+    run_search(game, sims, rollout_policy, max_rollout_depth, max_nodes, evaluation_batch_size)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "sims": sims,
+        "seconds": round(elapsed, 3),
+        "sims_per_sec": round(sims / elapsed, 1),
+        "nodes": nodes,
+        "peak_nodes": peak_nodes,
+        "gc_ms": round(gc_pause_ms, 1),
+        "peak_mb": round(peak_bytes / 2**20, 2),
+        "bytes_per_node": round(peak_bytes / peak_nodes),
+    }
+
+
+if __name__ == "__main__":
+    """
+    -s = simulation counts (default 100 1000 10000)
+    -b = branching factor (default 8)
+    -d = depth (default 20)
+    -p = # of player_count (default 2)
+    -t = transposition rate (default 0)
+    -c = rollout cost (default 0)
+    -z = score distribution (default win_loss)
+    -r = rollout policy (default uniform)
+    -m = max rollout depth (default none)
+    -n = max tree nodes (default none)
+    -e = leaf evaluator batch size (default none, rollouts)
+    --seed = seed (default 0)
+    """
+
+    # Parse the arguments
+    args = parseArguments()
+
+    game_kwargs = {
+        "branching_factor": args.b,
+        "depth": args.d,
+        "player_count": args.p,
+        "transposition_rate": args.t,
+        "rollout_cost": args.c,
+        "score_distribution": args.z,
+        "seed": args.seed,
+    }
+    print(f"Benchmarking synthetic game: {game_kwargs}")
+
+    results = [benchmark(game_kwargs, sims, args.seed, args.r, args.m, args.n, args.e) for sims in args.s]
+
+    print()
+    for result in results:
+        print("  ".join(f"{key}: {value}" for key, value in result.items()))
@@ -0,0 +1,58 @@
+import argparse
+import glob
+import importlib
+import os
+
+from engine.policy_tables import check_table_action_type, distill_turn_logs, policy_table_path, save_policy_table
+from games_config import GAMES_MAP
+
+
+def parseArguments():
+    # Create argument parser
+    parser = argparse.ArgumentParser()
+
+    # Positional mandatory arguments
+    parser.add_argument("game", help="Game name", type=str)
+
+    # Optional arguments
+    parser.add_argument("-p", help="Number of player_count in the logged games", type=int, default=2)
+    parser.add_argument("-l", help="directory of the tournament turn logs", type=str, default="logs")
+    parser.add_argument("-o", help="directory the table is saved to", type=str, default="policy_tables")
+    parser.add_argument("--pooled", help="one row for every player instead of a row per player", action="store_true")
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    return args
+
+
+if __name__ == "__main__":
+    """
+    game = game name, as for main.py
+    -p = # of player_count (default 2)
+    -l = turn log directory (default logs)
+    -o = table directory (default policy_tables)
+    --pooled = do not key the table by player (default keyed)
+
+    The table is read by the "table" rollout policy (-r table).
+    """
+
+    # Parse the arguments
+    args = parseArguments()
+
+    game_name = args.game
+    game_class_name = GAMES_MAP[game_name]
+    game_module = importlib.import_module(f".{game_name}.{game_name}", package="games")
+    # Read from a game as main.py builds it, as some games size their actions per instance
+    action_type = getattr(game_module, game_class_name)(player_count=args.p).action_type
+    check_table_action_type(action_type)
+    action_space_size = action_type.ACTION_SPACE_SIZE if action_type is not None else None
+
+    log_paths = sorted(glob.glob(os.path.join(args.l, f"{game_name}_turn_log_*.csv")))
+    if not log_paths:
+        raise SystemExit(f"No {game_name} turn logs in {args.l}")
+
+    table = distill_turn_logs(log_paths, by_player=not args.pooled, action_space_size=action_space_size)
+    output_path = policy_table_path(game_class_name, args.o)
+    save_policy_table(table, output_path)
+    print(f"Distilled {len(log_paths)} logs into a {table.shape} table: {output_path}")
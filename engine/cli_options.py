@@ -0,0 +1,103 @@
+import argparse
+
+from engine.gc_control import GC_MODES
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.monte_carlo_node import NodePool
+from engine.rollout_policies import ROLLOUT_POLICIES
+from engine.selection_policies import SELECTION_POLICIES
+
+# The engine's own UCB1, then the registered policies
+SELECTION_CHOICES = ["ucb1", *SELECTION_POLICIES]
+
+
+def add_search_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the rollout and search options shared by main.py and single_game.py.
+    Choices are read from the engine's tables, so new policies and modes show up here."""
+    parser.add_argument(
+        "-r",
+        help=f"rollout policy {list(ROLLOUT_POLICIES)}",
+        type=str,
+        choices=list(ROLLOUT_POLICIES),
+        default="uniform",
+    )
+    parser.add_argument("-m", help="maximum rollout depth before static evaluation", type=int, default=None)
+    parser.add_argument(
+        "-u",
+        help=f"rollout depth unit {list(MonteCarloEngine.rollout_depth_units)}",
+        type=str,
+        choices=MonteCarloEngine.rollout_depth_units,
+        default="plies",
+    )
+    parser.add_argument("-k", help="rollouts per selected leaf (default: the game's own)", type=int, default=None)
+    parser.add_argument(
+        "-w", help="worker processes for leaf rollouts (0 runs them in turn); single_game.py only", type=int, default=0
+    )
+    parser.add_argument("-n", help="maximum tree nodes before cold subtrees are pruned", type=int, default=None)
+    parser.add_argument(
+        "--gc-mode",
+        help=f"garbage collector handling during search {list(GC_MODES)}",
+        type=str,
+        choices=GC_MODES,
+        default="disable",
+    )
+    parser.add_argument(
+        "-e", help="moves left at which the endgame is solved exactly (default never)", type=int, default=None
+    )
+    parser.add_argument(
+        "--state-cache", help="game states cached on tree nodes to shorten path replays", type=int, default=None
+    )
+    parser.add_argument(
+        "--dense",
+        help=f"keep each node's children in a row indexed by action id (fixed action spaces up to {NodePool.MAX_DENSE_WIDTH} wide)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--selection",
+        help=f"child selection rule {SELECTION_CHOICES}",
+        type=str,
+        choices=SELECTION_CHOICES,
+        default="ucb1",
+    )
+    parser.add_argument(
+        "--progressive-bias", help="weight of the game's move priors in selection", type=float, default=0.0
+    )
+    parser.add_argument(
+        "--root-policy",
+        help=f"how the root's simulations are spread {list(MonteCarloEngine.root_policies)}",
+        type=str,
+        choices=MonteCarloEngine.root_policies,
+        default="ucb",
+    )
+    parser.add_argument("--seed", help="seed for the engine and game randomness", type=int, default=None)
+    parser.add_argument("--no-solver", help="do not prove won, lost and drawn positions", action="store_true")
+    parser.add_argument(
+        "--ponder", help="keep each player's tree and search it while the others think", action="store_true"
+    )
+    parser.add_argument(
+        "--rollout-backup",
+        help=f"back up the mean of a leaf's rollouts, or every rollout {list(MonteCarloEngine.rollout_backups)}",
+        type=str,
+        choices=MonteCarloEngine.rollout_backups,
+        default="mean",
+    )
+
+
+def search_options_from_args(args: argparse.Namespace) -> dict:
+    """GameEngine search_options from the arguments added by add_search_arguments"""
+    return {
+        "max_rollout_depth": args.m,
+        "rollout_depth_unit": args.u,
+        "rollouts_per_leaf": args.k,
+        "rollout_processes": args.w,
+        "rollout_backup": args.rollout_backup,
+        "max_nodes": args.n,
+        "gc_mode": args.gc_mode,
+        "solver": not args.no_solver,
+        "endgame_moves": args.e,
+        "state_cache_size": args.state_cache,
+        "dense_children": args.dense,
+        "selection": args.selection,
+        "progressive_bias": args.progressive_bias,
+        "root_policy": args.root_policy,
+        "ponder": args.ponder,
+    }
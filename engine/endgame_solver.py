@@ -0,0 +1,149 @@
+import time
+
+import numpy as np
+
+from games.game_components.base_game_object import BaseGameObject
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchLimitReached(Exception):
+    """Raised inside a solve when it runs out of nodes or time"""
+
+
+class EndgameSolver:
+    """Exact search of the rest of a deterministic game, through the same hooks the
+    engine uses.
+
+    Two player games are searched by negamax with alpha-beta pruning over the score
+    margin of the player to move; games with more players by max^n, where each player
+    takes the move best for their own score. Positions are remembered by the game's
+    get_state_hash, when it has one, so transpositions are solved once. States are
+    walked with get_state_snapshot/restore_state_snapshot, which leave the search
+    root's save slot alone.
+    """
+
+    def __init__(self, max_nodes: int = 200_000, time_limit: float = 1.0):
+        """
+        Args:
+            max_nodes (int, optional): most moves the solver plays before giving up. Defaults to 200,000.
+            time_limit (float, optional): seconds before the solver gives up. Defaults to 1.0.
+        """
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.node_count = 0
+
+    def solve(self, game: BaseGameObject) -> tuple[int, float]:
+        """
+        Solves the game from its current position, which is left as it was.
+
+        Returns:
+            (action, value) (tuple): the best action for the player to move and its value,
+                the player's final score margin over the opponent in two player games and
+                the player's final score otherwise. None if the node or time limit was reached.
+        """
+        self.node_count = 0
+        self.deadline = time.perf_counter() + self.time_limit
+        self.table = {}
+        self.win_score = game.win_score
+        player = game.get_current_player()
+        snapshot = game.get_state_snapshot()
+        try:
+            if game.player_count == 2:
+                value, action = self._negamax(game, -np.inf, np.inf)
+            else:
+                scores, action = self._max_n(game)
+                value = scores[player]
+        except SearchLimitReached:
+            game.restore_state_snapshot(snapshot)
+            return None
+        return action, value
+
+    def _play(self, game: BaseGameObject, action: int, player: int):
+        self.node_count += 1
+        if self.node_count > self.max_nodes:
+            raise SearchLimitReached
+        if self.node_count % 1024 == 0 and time.perf_counter() > self.deadline:
+            raise SearchLimitReached
+        game.update_game_with_action(int(action), player)
+
+    def _ordered_actions(self, game: BaseGameObject, first_action: int) -> list[int]:
+        actions = game.get_legal_actions().tolist()
+        if first_action is not None and first_action in actions:
+            actions.remove(first_action)
+            actions.insert(0, first_action)
+        return actions
+
+    def _negamax(self, game: BaseGameObject, alpha: float, beta: float) -> tuple[float, int]:
+        """Value of the position for the player to move, and the move that reaches it"""
+        key = game.get_state_hash()
+        entry = self.table.get(key) if key is not None else None
+        best_action = None
+        if entry is not None:
+            value, bound, best_action = entry
+            if bound == EXACT:
+                return value, best_action
+            if bound == LOWER_BOUND:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, best_action
+
+        original_alpha = alpha
+        player = game.get_current_player()
+        snapshot = game.get_state_snapshot()
+        best_value = -np.inf
+        for action in self._ordered_actions(game, best_action):
+            self._play(game, action, player)
+            if game.is_game_over():
+                scores = game.get_game_scores()
+                opponent = next(other for other in scores if other != player)
+                value = scores[player] - scores[opponent]
+            elif game.get_current_player() == player:
+                value = self._negamax(game, alpha, beta)[0]
+            else:
+                value = -self._negamax(game, -beta, -alpha)[0]
+            game.restore_state_snapshot(snapshot)
+
+            if value > best_value:
+                best_value, best_action = value, action
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if key is not None:
+            if best_value <= original_alpha:
+                bound = UPPER_BOUND
+            elif best_value >= beta:
+                bound = LOWER_BOUND
+            else:
+                bound = EXACT
+            self.table[key] = (best_value, bound, best_action)
+        return best_value, best_action
+
+    def _max_n(self, game: BaseGameObject) -> tuple[dict, int]:
+        """Final scores under max^n play from the position, and the move that reaches them"""
+        key = game.get_state_hash()
+        if key is not None and key in self.table:
+            return self.table[key]
+
+        player = game.get_current_player()
+        snapshot = game.get_state_snapshot()
+        best_scores, best_action = None, None
+        for action in game.get_legal_actions().tolist():
+            self._play(game, action, player)
+            if game.is_game_over():
+                scores = dict(game.get_game_scores())
+            else:
+                scores = self._max_n(game)[0]
+            game.restore_state_snapshot(snapshot)
+
+            if best_scores is None or scores[player] > best_scores[player]:
+                best_scores, best_action = scores, action
+                if self.win_score is not None and scores[player] >= self.win_score:
+                    break
+
+        if key is not None:
+            self.table[key] = (best_scores, best_action)
+        return best_scores, best_action
@@ -7,25 +7,66 @@ import importlib
 import sys
 from icecream import ic
 import multiprocessing as mp
+from multiprocessing.pool import Pool
 import time
+import copy
 from datetime import datetime
 
+from engine import rollout_workers
 from engine.monte_carlo_engine import MonteCarloEngine
+from engine.monte_carlo_node import MonteCarloNode, NodePool
+from engine.ponderer import Ponderer
+from engine.rollout_policies import ROLLOUT_POLICIES
 from games_config import GAMES_MAP
 from games.game_components.base_game_object import BaseGameObject
+from games.game_components.random_service import RandomService, get_random_service, set_random_service
 
 
 class GameEngine:
-    def __init__(self, game_name, sims=100, player_count: int = 2, verbose: bool = False, decay: str = None):
+    def __init__(
+        self,
+        game_name,
+        sims=100,
+        player_count: int = 2,
+        verbose: bool = False,
+        decay: str = None,
+        rollout_policy: str = "uniform",
+        search_options: dict = None,
+        seed=None,
+    ):
         self.number_of_sims = sims
+        if seed is not None:
+            # Seeds the process-wide random service before the game deals its first random setup
+            set_random_service(RandomService(seed))
         self.verbose = verbose
         self.game_name = GAMES_MAP[game_name]
         self.player_count = player_count
         self.game = self.load_game_engine(game_name)
         self.turn = 0  # Set the initial turn as 0
         self.decay = decay
+        self.rollout_policy = ROLLOUT_POLICIES[rollout_policy]()
+        # Extra MonteCarloEngine keyword arguments, such as max_rollout_depth
+        self.search_options = dict(search_options or {})
+        # dense_children is a node pool setting: the pool hands out nodes with child rows
+        # as wide as the game's action space, at most NodePool.MAX_DENSE_WIDTH
+        dense_children = self.search_options.pop("dense_children", False)
+        # ponder keeps each player's tree from turn to turn and searches it in the
+        # background while the other players think
+        self.ponder = self.search_options.pop("ponder", False)
+        if self.ponder and not self.game.deterministic:
+            raise ValueError(f"{self.game_name} has random moves, which cannot be pondered")
+        self.peak_node_count = 0
+        self.gc_pause_seconds = 0.0
+        # Nodes of each finished turn's tree are reused by the next turn's search
+        if dense_children:
+            self.node_pool = NodePool.dense(self.game.action_type)
+        else:
+            self.node_pool = NodePool()
 
         self.deep_game_log = []
+        self.rollout_pool = None
+        # One {"Turn", "Player", "Action"} entry per turn played, for the tournament logs
+        self.game_log = []
 
     def load_game_engine(self, game_name: str) -> BaseGameObject:
         game_module = importlib.import_module(f".{game_name}.{game_name}", package="games")
@@ -46,33 +87,87 @@ class GameEngine:
         """
 
         start_time = time.time()
-
-        while not self.game.is_game_over():
-            montecarlo = MonteCarloEngine(
-                start_player=self.game.get_current_player(), verbose=self.verbose
-            )  # initialize the monte carlo engine
-
-            self.turn += 1  # increments the game turn
-            current_player = self.game.get_current_player()
-
-            print(f"\n\nTurn {self.turn}\nGame gets {sims} simulations for this turn. Player {current_player}'s turn.")
-
-            chosen_action = montecarlo.select_and_return_best_real_action(  # , deep_game_log
-                num_sims=sims,
-                game=self.game,
-                node_player=current_player,
-                parent=montecarlo.root,
-            )
-            
-            
-            # self.deep_game_log += deep_game_log
-
-            self.game.update_game_with_action(action=chosen_action, player=current_player)
-
-            sims = self.update_num_of_sims_for_turn(sims)
-
-            self.game.draw_board()
-
+        # When pondering, each player's tree rooted at the current position
+        trees: dict[int, MonteCarloNode] = {}
+        # The thread searching one of the trees, and the player the tree belongs to
+        ponderer = None
+        pondering_player = None
+
+        # Leaf rollout workers are started once for the whole game
+        self.rollout_pool = self._start_rollout_pool()
+        try:
+            while not self.game.is_game_over():
+                montecarlo = MonteCarloEngine(
+                    start_player=self.game.get_current_player(),
+                    verbose=self.verbose,
+                    rollout_policy=self.rollout_policy,
+                    node_pool=self.node_pool,
+                    rollout_pool=self.rollout_pool,
+                    **self.search_options,
+                )  # initialize the monte carlo engine
+
+                self.turn += 1  # increments the game turn
+                current_player = self.game.get_current_player()
+                if ponderer is not None and pondering_player == current_player:
+                    # The player moves again, so their tree is searched here, not by the thread
+                    self._stop_pondering(ponderer)
+                    ponderer = None
+                tree = trees.pop(current_player, None)
+                if tree is not None:
+                    # Repointed before the release, so the engine never refers to a pooled node
+                    unused_root, montecarlo.root = montecarlo.root, tree
+                    self.node_pool.release_subtree(unused_root)
+
+                print(f"\n\nTurn {self.turn}\nGame gets {sims} simulations for this turn. Player {current_player}'s turn.")
+
+                chosen_action = montecarlo.select_and_return_best_real_action(  # , deep_game_log
+                    num_sims=sims,
+                    game=self.game,
+                    node_player=current_player,
+                    parent=montecarlo.root,
+                )
+                # Stopped before any tree is moved down or released
+                if ponderer is not None:
+                    self._stop_pondering(ponderer)
+                    ponderer = None
+
+                # self.deep_game_log += deep_game_log
+                self.peak_node_count = max(self.peak_node_count, montecarlo.peak_node_count)
+                self.gc_pause_seconds += montecarlo.gc_pause_seconds
+
+                self.game.update_game_with_action(action=chosen_action, player=current_player)
+                self.game_log.append({"Turn": self.turn, "Player": current_player, "Action": chosen_action})
+
+                if self.ponder:
+                    trees[current_player], montecarlo.root = montecarlo.root, None
+                    trees = {
+                        player: advanced
+                        for player, tree in trees.items()
+                        if (advanced := self._advance_tree(tree, chosen_action)) is not None
+                    }
+                    if current_player in trees and not self.game.is_game_over():
+                        ponderer = self._start_pondering(trees[current_player])
+                        pondering_player = current_player
+                else:
+                    self.node_pool.release_subtree(montecarlo.root)
+
+                sims = self.update_num_of_sims_for_turn(sims)
+
+                self.game.draw_board()
+
+        finally:
+            if ponderer is not None:
+                ponderer.stop()
+            if self.rollout_pool is not None:
+                self.rollout_pool.close()
+                self.rollout_pool.join()
+                self.rollout_pool = None
+
+        for tree in trees.values():
+            self.node_pool.release_subtree(tree)
+
+        print(f"Peak tree nodes: {self.peak_node_count}")
+        print(f"Total GC pause: {self.gc_pause_seconds * 1000:.2f} ms")
         print(f"Total time: {time.time()-start_time}\n{self.game.get_game_scores()}")
 
         # pd.DataFrame(self.deep_game_log).to_csv(
@@ -80,6 +175,56 @@ class GameEngine:
         #     index=False,
         # )
 
+    def _start_rollout_pool(self) -> Pool:
+        """The rollout worker pool of the game's searches, or None if they run leaf rollouts in turn"""
+        rollout_processes = self.search_options.get("rollout_processes", 0)
+        leaf_rollouts = self.search_options.get("rollouts_per_leaf") or self.game.rollouts_per_leaf
+        if rollout_processes == 0 or leaf_rollouts == 1 or self.search_options.get("leaf_evaluator") is not None:
+            return None
+        rollout_options = {
+            "rollout_policy": self.rollout_policy,
+            "max_rollout_depth": self.search_options.get("max_rollout_depth"),
+            "rollout_depth_unit": self.search_options.get("rollout_depth_unit", "plies"),
+        }
+        return rollout_workers.start_pool(rollout_processes, self.game, rollout_options)
+
+    def _advance_tree(self, tree: MonteCarloNode, action: int) -> MonteCarloNode:
+        """The tree moved down to the action's child, which keeps its statistics, or None
+        if the action was never expanded"""
+        child = tree.get_child(action)
+        if child is None:
+            self.node_pool.release_subtree(tree)
+            return None
+        return self.node_pool.reroot(tree, child)
+
+    def _start_pondering(self, tree: MonteCarloNode) -> Ponderer:
+        # A learning rollout policy is copied, as the main thread's search updates the shared one
+        rollout_policy = self.rollout_policy
+        if rollout_policy.learns_from_results:
+            rollout_policy = copy.deepcopy(rollout_policy)
+        montecarlo = MonteCarloEngine(
+            start_player=self.game.get_current_player(),
+            verbose=False,
+            rollout_policy=rollout_policy,
+            node_pool=self.node_pool,
+            rollout_pool=self.rollout_pool,
+            random_service=get_random_service().spawn(1)[0],
+            **self.search_options,
+        )
+        unused_root, montecarlo.root = montecarlo.root, tree
+        self.node_pool.release_subtree(unused_root)
+        ponderer = Ponderer(montecarlo)
+        ponderer.start(self.game, tree)
+        return ponderer
+
+    def _stop_pondering(self, ponderer: Ponderer):
+        simulations = ponderer.stop()
+        if self.verbose:
+            print(f"Pondered {simulations} simulations")
+
+    def get_game_scores(self) -> dict:
+        return self.game.get_game_scores()
+
     def update_num_of_sims_for_turn(self, sims):
         if self.decay:
             if self.decay == "halving":
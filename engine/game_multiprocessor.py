@@ -5,17 +5,24 @@ import time
 from datetime import datetime
 
 from engine.game_engine import GameEngine
+from games.game_components.random_service import RandomService, set_random_service
 from itertools import repeat
 
 
 class GameMultiprocessor:
-    def __init__(self, game_name, sims, player_count, verbose, num_games, decay):
+    def __init__(self, game_name, sims, player_count, verbose, num_games, decay, rollout_policy="uniform", search_options=None, seed=None):
+        if search_options and search_options.get("rollout_processes", 0) > 0:
+            # Each game runs in a daemonic pool worker, which cannot start rollout workers
+            raise ValueError("Leaf rollout processes (-w) cannot run inside a series of games; use single_game.py")
         self.game_name = game_name
         self.sims = sims
         self.player_count = player_count
         self.verbose = verbose
         self.num_games = num_games
         self.decay = decay
+        self.rollout_policy = rollout_policy
+        self.search_options = search_options
+        self.seed = seed
         self.timestamp = datetime.now().strftime("%m%d%Y_%H%M%S")
 
     def playout_simulations(self):
@@ -29,7 +36,9 @@ class GameMultiprocessor:
         self.block = int(np.ceil(self.end / processes))
         self.values = np.arange(0, self.end, self.block)
         pool = mp.Pool(processes=processes)
-        scores = pool.starmap(GameMultiprocessor.process_block, zip(repeat(self), self.values))
+        # One independent seed per block, so a seeded series is reproducible
+        block_seeds = [service.seed_sequence for service in RandomService(self.seed).spawn(len(self.values))]
+        scores = pool.starmap(GameMultiprocessor.process_block, zip(repeat(self), self.values, block_seeds))
         pool.close()
         time_end = round(time.time() - time_start, 3)
         time_per_game = round(time_end / self.num_games, 2)
@@ -59,8 +68,9 @@ class GameMultiprocessor:
             index=False,
         )
 
-    def process_block(self, values):
+    def process_block(self, values, block_seed):
         block_games = {}
+        set_random_service(RandomService(block_seed))
 
         end = values + self.block
 
@@ -75,6 +85,8 @@ class GameMultiprocessor:
                 player_count=self.player_count,
                 verbose=self.verbose,
                 decay=self.decay,
+                rollout_policy=self.rollout_policy,
+                search_options=self.search_options,
             )
             game.play_game_by_turns(self.sims)
 
@@ -0,0 +1,58 @@
+import gc
+import time
+from contextlib import contextmanager
+
+GC_MODES = ("default", "disable", "freeze")
+
+
+class GCPauseTimer:
+    """Counts the garbage collections run while it is active and the time they take"""
+
+    def __init__(self):
+        self.collections = 0
+        self.pause_seconds = 0.0
+        self._collection_start = None
+
+    def _on_collection(self, phase: str, info: dict):
+        if phase == "start":
+            self._collection_start = time.perf_counter()
+        elif self._collection_start is not None:
+            self.pause_seconds += time.perf_counter() - self._collection_start
+            self.collections += 1
+            self._collection_start = None
+
+    def __enter__(self) -> "GCPauseTimer":
+        gc.callbacks.append(self._on_collection)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self._on_collection)
+
+
+@contextmanager
+def search_gc_mode(mode: str):
+    """
+    Runs a search block under one of the GC_MODES:
+    default leaves the collector alone, disable pauses automatic collection, and freeze
+    moves every object that exists beforehand (the game, earlier trees) out of the
+    collector's reach, so collections during the search only scan new objects.
+    The collector is put back as it was afterward.
+    """
+    if mode not in GC_MODES:
+        raise ValueError(f"gc mode must be one of {GC_MODES}")
+    if mode == "disable":
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            yield
+        finally:
+            if was_enabled:
+                gc.enable()
+    elif mode == "freeze":
+        gc.freeze()
+        try:
+            yield
+        finally:
+            gc.unfreeze()
+    else:
+        yield
@@ -0,0 +1,40 @@
+import numpy as np
+
+
+class LeafEvaluator:
+    """Scores batches of leaf positions in place of rollouts.
+
+    The engine selects up to evaluation_batch_size leaves, stacks their game's
+    encode_state vectors into one (batch, features) array and calls evaluate once for
+    the whole batch. Row i of the result holds the estimated final scores of leaf i,
+    one column per player ID, on the same scale as get_game_scores.
+    """
+
+    def evaluate(self, batch: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+
+class LinearLeafEvaluator(LeafEvaluator):
+    """A one layer value function, scale * tanh(batch @ weights + bias), in plain NumPy.
+
+    Fits games scored ±scale for a win or loss. Weights are learned offline, for
+    instance by regressing final scores on the encoded positions of logged games.
+    """
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray = None, scale: float = 1.0):
+        """
+        Args:
+            weights (np.ndarray): (features, players) weights.
+            bias (np.ndarray, optional): (players,) bias. Defaults to zeros.
+            scale (float, optional): score of a certain win. Defaults to 1.0.
+        """
+        self.weights = np.asarray(weights, dtype=np.float32)
+        if self.weights.ndim != 2:
+            raise ValueError("weights must be a (features, players) array")
+        if bias is None:
+            bias = np.zeros(self.weights.shape[1])
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.scale = scale
+
+    def evaluate(self, batch: np.ndarray) -> np.ndarray:
+        return self.scale * np.tanh(batch @ self.weights + self.bias)
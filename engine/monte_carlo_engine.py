@@ -1,23 +1,181 @@
+import sys
+import threading
+from multiprocessing.pool import Pool
+
 import numpy as np
 
-from engine.monte_carlo_node import MonteCarloNode
+from engine import rollout_workers
+from engine.endgame_solver import EndgameSolver
+from engine.gc_control import GC_MODES, GCPauseTimer, search_gc_mode
+from engine.monte_carlo_node import MonteCarloNode, NodePool
 from games.game_components.base_game_object import BaseGameObject
 from engine.game_logger import GameLogger
-from games.game_components.action import GameAction
+from engine.leaf_evaluators import LeafEvaluator
+from engine.rollout_policies import RolloutPolicy, UniformRolloutPolicy
+from engine.selection_policies import SELECTION_POLICIES
+from engine.state_cache import StateCache
+from games.game_components.random_service import RandomService, get_random_service, set_random_service
 
 
 class MonteCarloEngine:
-    def __init__(self, start_player: int, verbose: bool):  # , legal_actions=None, player=None
+    rollout_depth_units = ("plies", "rounds")
+    root_policies = ("ucb", "sequential_halving")
+    rollout_backups = ("mean", "all")
+    # Share of max_nodes the tree is pruned back to, so pruning runs once per many expansions
+    prune_to_fraction = 0.75
+
+    def __init__(
+        self,
+        start_player: int,
+        verbose: bool,
+        rollout_policy: RolloutPolicy = None,
+        max_rollout_depth: int = None,
+        rollout_depth_unit: str = "plies",
+        rollouts_per_leaf: int = None,
+        rollout_backup: str = "mean",
+        rollout_processes: int = 0,
+        rollout_pool: Pool = None,
+        max_nodes: int = None,
+        node_pool: NodePool = None,
+        gc_mode: str = "disable",
+        random_service: RandomService = None,
+        solver: bool = True,
+        endgame_moves: int = None,
+        endgame_max_nodes: int = 200_000,
+        endgame_time_limit: float = 1.0,
+        state_cache_size: int = None,
+        state_cache_interval: int = 4,
+        selection: str = "ucb1",
+        explore_param: float = 1.414,
+        progressive_bias: float = 0.0,
+        root_policy: str = "ucb",
+        max_chance_outcomes: int = 8,
+        leaf_evaluator: LeafEvaluator = None,
+        evaluation_batch_size: int = 16,
+        virtual_loss: float = 1.0,
+    ):  # , legal_actions=None, player=None
         """
         Instantiates root monte carlo node
         Assigns starting player to root node
 
         Args:
             node_player (int): Current player id
+            rollout_policy (RolloutPolicy, optional): chooses the rollout moves. Defaults to uniform random.
+            max_rollout_depth (int, optional): rollouts stop after this many plies or rounds and
+                score the position with the game's evaluate hook. Defaults to None, playing to the end.
+            rollout_depth_unit (str, optional): "plies" or "rounds". Counting rounds reads the
+                game's current_round. Defaults to "plies".
+            rollouts_per_leaf (int, optional): rollouts run from each selected leaf. Defaults to
+                None, using the game's rollouts_per_leaf.
+            rollout_backup (str, optional): "mean" backs up the mean of a leaf's rollouts as one
+                visit, "all" backs up every rollout as its own visit. Defaults to "mean".
+            rollout_processes (int, optional): size of a process pool that runs a leaf's rollouts
+                in parallel. Defaults to 0, running them in turn from the restored leaf state.
+            rollout_pool (Pool, optional): a pool of rollout_processes workers from
+                rollout_workers.start_pool, shared by the searches of a whole game and left
+                open. Defaults to None, starting a pool for each search that needs one.
+            max_nodes (int, optional): node budget for the tree. Past it, the coldest subtrees are
+                collapsed into their root node. Defaults to None, unbounded.
+            node_pool (NodePool, optional): pool the tree's nodes are taken from, and pruned
+                nodes returned to. Defaults to a new pool for this engine.
+            gc_mode (str, optional): garbage collector handling during search, one of
+                "default", "disable" (automatic collection paused) or "freeze" (objects
+                from before the search frozen). Defaults to "disable".
+            random_service (RandomService, optional): random numbers for rollouts. Defaults to
+                the process-wide service.
+            solver (bool, optional): prove the game values of terminal nodes and back them up
+                by minimax, skipping proven subtrees and ending the search once the root is
+                proven. Only used for deterministic games. Defaults to True.
+            endgame_moves (int, optional): positions of a deterministic game with at most this
+                many moves left (get_remaining_moves) are solved exactly by the EndgameSolver
+                instead of searched. Defaults to None, never.
+            endgame_max_nodes (int, optional): moves the endgame solver may play before it gives
+                up and the search runs as usual. Defaults to 200,000.
+            endgame_time_limit (float, optional): seconds the endgame solver may take before it
+                gives up. Defaults to 1.0.
+            state_cache_size (int, optional): most game state snapshots kept on tree nodes, so
+                selection restores the deepest cached node of its path instead of replaying it
+                from the root. Only used for deterministic games. Defaults to None, no cache.
+            state_cache_interval (int, optional): plies between cached nodes. Defaults to 4.
+            selection (str, optional): child selection rule, "ucb1" on raw scores or one of
+                SELECTION_POLICIES, which work on scores normalized per player from the
+                running minimum and maximum ("ucb1_normalized", "ucb_tuned", "ucb_v").
+                Defaults to "ucb1".
+            explore_param (float, optional): UCB1 exploration constant. Defaults to 1.414.
+            progressive_bias (float, optional): weight of the game's action priors
+                (get_action_priors) in selection, fading as 1 / (visits + 1). Defaults to 0,
+                priors unused.
+            root_policy (str, optional): how simulations are spread over the root's children.
+                "ucb" selects them like any other node; "sequential_halving" splits the budget
+                into rounds, gives every remaining child an equal share of each round and
+                drops the worse half after it, with the usual selection below the root.
+                Defaults to "ucb".
+            max_chance_outcomes (int, optional): in games that are not deterministic, a tree
+                move with a random result (get_chance_outcome_key) leads to one child per
+                outcome, each replayed from its own seed. Past this many outcomes, existing
+                ones are revisited in proportion to their visits. Defaults to 8.
+            leaf_evaluator (LeafEvaluator, optional): scores selected leaves from the game's
+                encode_state instead of rolling them out, evaluation_batch_size leaves per
+                call. Defaults to None, rollouts.
+            evaluation_batch_size (int, optional): leaves selected before each leaf evaluator
+                call. Defaults to 16.
+            virtual_loss (float, optional): score held against every node on the path of a
+                leaf waiting for its evaluation, so the rest of the batch selects other
+                leaves. On the scale of the game's scores. Defaults to 1.0.
         """
-        self.root = MonteCarloNode(player=start_player)
+        if rollout_depth_unit not in MonteCarloEngine.rollout_depth_units:
+            raise ValueError(f"rollout_depth_unit must be one of {MonteCarloEngine.rollout_depth_units}")
+        if rollout_backup not in MonteCarloEngine.rollout_backups:
+            raise ValueError(f"rollout_backup must be one of {MonteCarloEngine.rollout_backups}")
+        if gc_mode not in GC_MODES:
+            raise ValueError(f"gc_mode must be one of {GC_MODES}")
+        if root_policy not in MonteCarloEngine.root_policies:
+            raise ValueError(f"root_policy must be one of {MonteCarloEngine.root_policies}")
+        if selection != "ucb1" and selection not in SELECTION_POLICIES:
+            raise ValueError(f"selection must be ucb1 or one of {tuple(SELECTION_POLICIES)}")
+        if evaluation_batch_size < 1:
+            raise ValueError("evaluation_batch_size must be at least 1")
+        self.node_pool = node_pool if node_pool is not None else NodePool()
+        self.root = self.node_pool.acquire(player=start_player)
         self.game_logger = GameLogger()
         self.verbose = verbose
+        self.rollout_policy = rollout_policy if rollout_policy is not None else UniformRolloutPolicy()
+        self.max_rollout_depth = max_rollout_depth
+        self.rollout_depth_unit = rollout_depth_unit
+        self.rollouts_per_leaf = rollouts_per_leaf
+        self.rollout_backup = rollout_backup
+        self.rollout_processes = rollout_processes
+        self.shared_rollout_pool = rollout_pool
+        self.max_nodes = max_nodes
+        self.node_count = 1
+        self.peak_node_count = 1
+        self.gc_mode = gc_mode
+        self.random_service = random_service if random_service is not None else get_random_service()
+        self.gc_collections = 0
+        self.gc_pause_seconds = 0.0
+        self.solver = solver
+        self.simulations_run = 0
+        self.endgame_moves = endgame_moves
+        self.endgame_max_nodes = endgame_max_nodes
+        self.endgame_time_limit = endgame_time_limit
+        self.explore_param = explore_param
+        self.progressive_bias = progressive_bias
+        self.root_policy = root_policy
+        self.max_chance_outcomes = max_chance_outcomes
+        self.leaf_evaluator = leaf_evaluator
+        self.evaluation_batch_size = evaluation_batch_size
+        self.virtual_loss = virtual_loss
+        # Moves of the tree path above the current rollout, for rollout policies that learn
+        self.path_moves = []
+        # Set while pondering, to stop the search from another thread
+        self.stop_event = None
+        self.halving_candidates = None
+        self.selection_policy = None
+        if selection != "ucb1":
+            self.selection_policy = SELECTION_POLICIES[selection](explore_param)
+        self.state_cache = None
+        if state_cache_size is not None:
+            self.state_cache = StateCache(state_cache_size, state_cache_interval)
 
     def select_and_return_best_real_action(
         self,
@@ -25,7 +183,7 @@ class MonteCarloEngine:
         game: BaseGameObject,
         node_player: int,
         parent: MonteCarloNode,
-    ) -> GameAction:
+    ) -> int:
         """
         Receives a specific game state from which to make a move
 
@@ -35,7 +193,7 @@ class MonteCarloEngine:
         3. Simulate game to terminus (_rollout_from_selected_node)
         4. Back-update scores starting with rollout node (_backpropogate_node_scores)
 
-        Returns the chosen turn action for the game state it was provided
+        Returns the chosen turn action id for the game state it was provided
 
         Args:update_action_log_start
             num_sims (int): number of simulations to run for turn
@@ -55,7 +213,130 @@ class MonteCarloEngine:
 
         self.game_copy.save_game_state()
 
-        for i in range(num_sims):
+        endgame_action = self._solve_endgame()
+        if endgame_action is not None:
+            print(f"Action taken: Player {node_player}, Action {endgame_action} (endgame solved)")
+            return endgame_action
+
+        self._start_search(parent)
+        with GCPauseTimer() as gc_timer, search_gc_mode(self.gc_mode):
+            self.halving_budget = num_sims
+            self.halving_candidates = None
+            self._search(num_sims, parent, node_player)
+        self.gc_collections = gc_timer.collections
+        self.gc_pause_seconds = gc_timer.pause_seconds
+        self._finish_search()
+
+        if self.halving_candidates is not None:
+            selected_child = max(self.halving_candidates, key=self._halving_value)
+        else:
+            selected_child = parent.best_child(real_move=True)
+
+        print(
+            f"Chosen Node: {id(selected_child)} Visits: {selected_child.number_of_visits} Score: {selected_child.total_score} "
+        )
+        print(f"Action taken: Player {node_player}, Action {selected_child.node_action}")
+        if self.verbose:
+            print(self._search_summary(parent))
+
+        return selected_child.node_action  # , deep_game_log
+
+    def _search_summary(self, parent: MonteCarloNode) -> str:
+        """One line of search statistics, printed after each verbose search"""
+        summary = [
+            f"Tree nodes: {self.node_count} (peak {self.peak_node_count})",
+            f"GC pauses: {self.gc_collections} collections, {self.gc_pause_seconds * 1000:.2f} ms",
+        ]
+        if self.caching:
+            summary.append(f"State cache hits: {self.state_cache.hits}")
+        if parent.proven_scores is not None:
+            summary.append(f"Solved after {self.simulations_run} simulations: {parent.proven_scores}")
+        return " | ".join(summary)
+
+    def ponder(self, game: BaseGameObject, node_player: int, parent: MonteCarloNode, stop_event: threading.Event) -> int:
+        """
+        Searches from parent until stop_event is set or the position is solved, without
+        choosing a move, so the tree's statistics are ready for a later search from the
+        same node. Meant to run in a background thread while another player thinks; the
+        game must be a copy that no other thread touches, and the engine a separate one
+        with its own random service. The simulation running when the event is set is
+        finished first and the game restored.
+
+        The root is selected by UCB whatever the root policy, as there is no budget to
+        split. The garbage collector is left alone, as the process's other thread owns it.
+
+        Returns:
+            simulations (int): simulations run
+        """
+        self.turn_player = node_player
+        self.game_copy = game
+        self.game_copy.save_game_state()
+        self.stop_event = stop_event
+        root_policy, self.root_policy = self.root_policy, "ucb"
+        self._start_search(parent)
+        try:
+            self._search(sys.maxsize, parent, node_player)
+        finally:
+            self._finish_search()
+            self.root_policy = root_policy
+            self.stop_event = None
+        return self.simulations_run
+
+    def _start_search(self, parent: MonteCarloNode):
+        self.search_root = parent
+        self.node_count = parent.count_subtree_nodes()
+        self.peak_node_count = max(self.peak_node_count, self.node_count)
+        self.solving = self.solver and self.game_copy.deterministic
+        # Replaying a path in a game with chance draws new outcomes, which a snapshot would freeze
+        self.caching = self.state_cache is not None and self.game_copy.deterministic
+
+        self.leaf_rollouts = self.rollouts_per_leaf or self.game_copy.rollouts_per_leaf
+        self.rollout_pool = None
+        if self.leaf_rollouts > 1 and self.rollout_processes > 0 and self.leaf_evaluator is None:
+            self.rollout_pool = self.shared_rollout_pool
+            if self.rollout_pool is None:
+                self.rollout_pool = rollout_workers.start_pool(
+                    self.rollout_processes, self.game_copy, self.rollout_options()
+                )
+
+    def _search(self, num_sims: int, parent: MonteCarloNode, node_player: int):
+        if self.leaf_evaluator is not None:
+            self._run_batched_evaluations(num_sims, parent, node_player)
+        else:
+            self._run_simulations(num_sims, parent, node_player)
+
+    def _finish_search(self):
+        if self.rollout_pool is not None and self.rollout_pool is not self.shared_rollout_pool:
+            self.rollout_pool.close()
+            self.rollout_pool.join()
+        if self.caching:
+            self.state_cache.clear()
+
+    def _stopped(self) -> bool:
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _solve_endgame(self) -> int:
+        """The exactly solved best action, if the game is close enough to its end and the
+        solver finishes within its limits. None otherwise."""
+        if self.endgame_moves is None or not self.game_copy.deterministic:
+            return None
+        remaining_moves = self.game_copy.get_remaining_moves()
+        if remaining_moves is None or remaining_moves > self.endgame_moves:
+            return None
+        solver = EndgameSolver(max_nodes=self.endgame_max_nodes, time_limit=self.endgame_time_limit)
+        solved = solver.solve(self.game_copy)
+        if solved is None:
+            return None
+        action, value = solved
+        if self.verbose:
+            print(f"Endgame solved in {solver.node_count} moves, value {value}")
+        return action
+
+    def _run_simulations(self, num_sims: int, parent: MonteCarloNode, node_player: int):
+        """Runs the simulations of one search from the saved root state, stopping early once
+        the solver proves the root"""
+        self.simulations_run = 0
+        for self.simulation in range(1, num_sims + 1):
             # self.game_logger.create_turn_action_log()
             # self.game_logger.update_action_log_start(parent, i, node_player)
             # self.game_logger.update_action_log_node(parent, "Starting")
@@ -64,27 +345,109 @@ class MonteCarloEngine:
 
             # self.game_logger.update_action_log_node(rollout_node, "Rollout")
 
-            self._rollout_from_selected_node()
-
-            self.scores = self.game_copy.get_game_scores()
+            terminal_scores = None
+            if self.solving and self.game_copy.is_game_over():
+                terminal_scores = dict(self.game_copy.get_game_scores())
+
+            if self.rollout_policy.learns_from_results:
+                self.path_moves = self._path_moves(rollout_node)
+
+            if self.leaf_rollouts == 1:
+                self.scores = self._rollout_from_selected_node()
+                self.score_squares = {player: score * score for player, score in self.scores.items()}
+                visits = 1
+                if self.selection_policy is not None:
+                    self.selection_policy.normalizer.update(self.scores)
+            else:
+                self.scores, self.score_squares, visits = self._run_leaf_rollouts()
             # self.game_logger.update_action_log_end(scores=self.scores)
 
-            self._backpropogate_node_scores(rollout_node)
+            self._backpropogate_node_scores(rollout_node, visits)
+            self.simulations_run = self.simulation
+
+            if terminal_scores is not None:
+                self._backpropogate_proof(rollout_node, terminal_scores)
+
+            if self.max_nodes is not None and self.node_count > self.max_nodes:
+                self._prune_cold_subtrees()
 
             # self.game_logger.update_action_log_node(rollout_node, "Rollout After", all=False)
 
             # deep_game_log.append(self.game_logger.send_turn_action_log())
 
-            self.game_copy.load_save_game_state()
+            if not self.caching:
+                self.game_copy.load_save_game_state()
 
-        selected_child = parent.best_child(real_move=True)
+            if parent.proven_scores is not None or self._stopped():
+                break
 
-        print(
-            f"Chosen Node: {id(selected_child)} Visits: {selected_child.number_of_visits} Score: {selected_child.total_score} "
-        )
-        print(f"Action taken: Player {node_player}, Action {selected_child.node_action}")
+        if self.caching:
+            self.game_copy.load_save_game_state()
 
-        return selected_child.node_action  # , deep_game_log
+    def _run_batched_evaluations(self, num_sims: int, parent: MonteCarloNode, node_player: int):
+        """
+        Runs the simulations of one search in batches, scoring leaves with the leaf evaluator
+        instead of rollouts. Up to evaluation_batch_size leaves are selected before any is
+        scored; meanwhile a virtual loss is held on each selected path, so the following
+        selections of the batch spread to other leaves. The batch's encode_state vectors go
+        to the evaluator in one call and its scores are backed up leaf by leaf. Terminal
+        leaves are backed up, and proven, from the game's own scores at once.
+        """
+        self.simulations_run = 0
+        self.simulation = 0
+        while self.simulation < num_sims and parent.proven_scores is None and not self._stopped():
+            pending_leaves = []
+            encoded_states = []
+            while len(pending_leaves) < self.evaluation_batch_size and self.simulation < num_sims:
+                self.simulation += 1
+                leaf = self._select_rollout_node(parent, node_player)
+                if self.game_copy.is_game_over():
+                    terminal_scores = dict(self.game_copy.get_game_scores())
+                    self._backpropogate_evaluation(leaf, terminal_scores)
+                    if self.solving:
+                        self._backpropogate_proof(leaf, terminal_scores)
+                else:
+                    encoded_state = self.game_copy.encode_state()
+                    if encoded_state is None:
+                        raise ValueError("A leaf evaluator needs a game with the encode_state hook")
+                    encoded_states.append(encoded_state)
+                    pending_leaves.append(leaf)
+                    self._add_virtual_loss(leaf, 1)
+
+                if not self.caching:
+                    self.game_copy.load_save_game_state()
+                if parent.proven_scores is not None:
+                    break
+
+            if pending_leaves:
+                evaluations = np.asarray(self.leaf_evaluator.evaluate(np.stack(encoded_states)), dtype=float)
+                for leaf, leaf_scores in zip(pending_leaves, evaluations.tolist()):
+                    self._add_virtual_loss(leaf, -1)
+                    self._backpropogate_evaluation(leaf, dict(enumerate(leaf_scores)))
+            self.simulations_run = self.simulation
+
+            if self.max_nodes is not None and self.node_count > self.max_nodes:
+                self._prune_cold_subtrees()
+
+        if self.caching:
+            self.game_copy.load_save_game_state()
+
+    def _add_virtual_loss(self, leaf: MonteCarloNode, sign: int):
+        """Adds (sign 1) or takes back (sign -1) one visit scoring -virtual_loss to every
+        node on the leaf's path"""
+        loss = self.virtual_loss
+        node = leaf
+        while node is not None:
+            node.record_visit(sign, -sign * loss, sign * loss * loss, self.simulation)
+            node = node.parent
+
+    def _backpropogate_evaluation(self, leaf: MonteCarloNode, scores: dict):
+        """Backs up one visit with the leaf's evaluated or final scores"""
+        self.scores = scores
+        self.score_squares = {player: score * score for player, score in scores.items()}
+        if self.selection_policy is not None:
+            self.selection_policy.normalizer.update(scores)
+        self._backpropogate_node_scores(leaf)
 
     def _select_rollout_node(self, node: MonteCarloNode, node_player: int) -> MonteCarloNode:
         """
@@ -94,6 +457,13 @@ class MonteCarloEngine:
             current_node (object instance): MonteCarloNode object instance
         """
 
+        if self.caching:
+            node = self._descend_from_cached_state(node)
+            if node is not self.search_root:
+                if self.game_copy.is_game_over():
+                    return node
+                node_player = self.game_copy.get_current_player()
+
         while len(node.children) > 0 and node.number_of_visits > 0:
             # HAS CHILDREN, IS VISITED, CHECK GAME END AFTER LOOP
             node = self._move_to_best_child_node(node, node_player)
@@ -102,23 +472,23 @@ class MonteCarloEngine:
             node_player = self.game_copy.get_current_player()
             # loop and check again if we hit a leaf; this branch may move more than one node down to find a new expansion point
 
-        if len(self.game_copy.get_available_actions()) == 0:
+        if len(self.game_copy.get_legal_actions()) == 0:
             # NO CHILDREN, IS VISITED, means game is over
             return node
 
-        elif node.number_of_visits == 0 and not node == self.root:
-            # NO CHILDREN, NOT VISITED, NOT ROOT
+        elif len(node.children) == 0 and node is self.search_root:
+            # NO CHILDREN, IS SEARCH ROOT: new, or a collapsed node kept as the root of a later turn
             node = self._expand_new_nodes(node)
+            node = self._move_to_best_child_node(node, node_player)
             return node
 
-        elif len(node.children) == 0 and node.number_of_visits > 0 and not node == self.root:
-            # NO CHILDREN, IS VISITED, NOT ROOT
+        elif node.number_of_visits == 0:
+            # NO CHILDREN, NOT VISITED, NOT ROOT
             node = self._expand_new_nodes(node)
-            node = self._move_to_best_child_node(node, node_player)
             return node
 
-        elif node.number_of_visits == 0 and node == self.root:
-            # NO CHILDREN, NOT VISITED, IS ROOT
+        elif len(node.children) == 0:
+            # NO CHILDREN, IS VISITED, NOT ROOT
             node = self._expand_new_nodes(node)
             node = self._move_to_best_child_node(node, node_player)
             return node
@@ -126,15 +496,152 @@ class MonteCarloEngine:
         else:
             return node
 
+    def _descend_from_cached_state(self, node: MonteCarloNode) -> MonteCarloNode:
+        """
+        Walks the tree down the selection path without touching the game, then puts the
+        game in the state of the last node: restored from the deepest cached node on the
+        path, or the search root, and replayed from there. Nodes replayed through are
+        offered to the state cache.
+
+        Terminal nodes are never expanded, so the path stops at the same node as the
+        move-by-move selection loop.
+        """
+        path = []
+        while len(node.children) > 0 and node.number_of_visits > 0:
+            node = self._best_child(node)
+            path.append(node)
+
+        replay_from = 0
+        for position in range(len(path) - 1, -1, -1):
+            snapshot = self.state_cache.get(path[position])
+            if snapshot is not None:
+                self.game_copy.restore_state_snapshot(snapshot)
+                replay_from = position + 1
+                break
+        else:
+            self.game_copy.load_save_game_state()
+
+        for child in path[replay_from:]:
+            self.game_copy.update_game_with_action(child.node_action, child.player_owner)
+            self.state_cache.offer(child, self.game_copy)
+        return node
+
     def _move_to_best_child_node(self, parent: MonteCarloNode, player: int) -> MonteCarloNode:
-        best_child = parent.best_child()
+        best_child = self._best_child(parent)
+        if not self.game_copy.deterministic:
+            return self._move_to_chance_outcome(best_child, player)
         self.game_copy.update_game_with_action(best_child.node_action, player)
         return best_child
 
-    def _choose_random_action(self, potential_actions: list):
-        # pops off node actions randomly so that the order of try-stuff isn't as deterministic
+    def _move_to_chance_outcome(self, node: MonteCarloNode, player: int) -> MonteCarloNode:
+        """
+        Plays the node's action under a seeded random service. If the move has a random
+        result the node is a chance node: returns its child for the outcome, added if new.
+        Below max_chance_outcomes each pass draws a new seed, so new outcomes are sampled;
+        after that an existing outcome is picked, in proportion to its visits, and replayed
+        from its seed.
 
-        return potential_actions[np.random.randint(len(potential_actions))]
+        Returns:
+            (object instance): the outcome node, or the node itself for moves without a random result
+        """
+        if node.children and node.children[0].outcome_key is None:
+            # Expanded with actions, so a move without a random result
+            self.game_copy.update_game_with_action(node.node_action, player)
+            return node
+        outcomes = node.children
+        if len(outcomes) >= self.max_chance_outcomes:
+            seed = self._sample_outcome(outcomes).outcome_seed
+        else:
+            seed = int(self.random_service.random() * 2**32)
+
+        game_random_service = get_random_service()
+        set_random_service(RandomService(seed, buffer_size=64))
+        try:
+            self.game_copy.update_game_with_action(node.node_action, player)
+        finally:
+            set_random_service(game_random_service)
+
+        outcome_key = self.game_copy.get_chance_outcome_key()
+        if outcome_key is None:
+            return node
+        for outcome in outcomes:
+            if outcome.outcome_key == outcome_key:
+                return outcome
+        outcome = self.node_pool.acquire(
+            parent=node, node_action=None, depth=node.depth + 1, player=node.player_owner, label=None
+        )
+        outcome.outcome_key = outcome_key
+        outcome.outcome_seed = seed
+        node.add_child(outcome)
+        self.node_count += 1
+        self.peak_node_count = max(self.peak_node_count, self.node_count)
+        return outcome
+
+    def _sample_outcome(self, outcomes: list[MonteCarloNode]) -> MonteCarloNode:
+        total_visits = sum(outcome.number_of_visits for outcome in outcomes)
+        if total_visits == 0:
+            return self.random_service.choice(outcomes)
+        pick = self.random_service.random() * total_visits
+        for outcome in outcomes:
+            pick -= outcome.number_of_visits
+            if pick < 0:
+                return outcome
+        return outcomes[-1]
+
+    def _best_child(self, parent: MonteCarloNode) -> MonteCarloNode:
+        if self.root_policy == "sequential_halving" and parent is self.search_root:
+            child = self._next_halving_child()
+            if child is not None:
+                return child
+        return parent.best_child(
+            self.explore_param,
+            skip_proven=self.solving,
+            selection=self.selection_policy,
+            progressive_bias=self.progressive_bias,
+        )
+
+    def _next_halving_child(self) -> MonteCarloNode:
+        """
+        The root child to simulate next under sequential halving. Each round gives every
+        remaining child round_visits simulations in turn; then the children are ranked by
+        _halving_value and the better half kept. Proven children need no simulations and
+        are passed over; None once every remaining child is proven.
+        """
+        root = self.search_root
+        if self.halving_candidates is None:
+            self.halving_candidates = list(root.children)
+            self.halving_rounds = max(1, int(np.ceil(np.log2(len(self.halving_candidates)))))
+            self._start_halving_round()
+
+        while True:
+            for child in self.halving_candidates:
+                if child.proven_scores is None and self.halving_round_counts[child] < self.halving_round_visits:
+                    self.halving_round_counts[child] += 1
+                    return child
+            if len(self.halving_candidates) == 1 or all(
+                child.proven_scores is not None for child in self.halving_candidates
+            ):
+                if self.halving_candidates[0].proven_scores is not None:
+                    return None
+                # One child left: it takes the rest of the budget
+                self._start_halving_round()
+                continue
+            self.halving_candidates.sort(key=self._halving_value, reverse=True)
+            del self.halving_candidates[(len(self.halving_candidates) + 1) // 2 :]
+            self._start_halving_round()
+
+    def _start_halving_round(self):
+        round_budget = self.halving_budget // self.halving_rounds
+        self.halving_round_visits = max(1, round_budget // len(self.halving_candidates))
+        self.halving_round_counts = {child: 0 for child in self.halving_candidates}
+
+    def _halving_value(self, child: MonteCarloNode) -> float:
+        """A root child's value for its owner: proven score, else mean score"""
+        if child.proven_scores is not None:
+            return child.proven_scores[child.player_owner]
+        if child.number_of_visits == 0:
+            return -np.inf
+        return child.total_score / child.number_of_visits
 
     def _expand_new_nodes(self, parent_node: MonteCarloNode, gui_reporting: bool = False):
         """
@@ -147,46 +654,192 @@ class MonteCarloEngine:
         As we pop items off the list and apply them to the
         """
         
-        actions_to_pop: list[GameAction] = self.game_copy.get_available_actions()
+        actions_to_pop: np.ndarray = self.game_copy.get_legal_actions()
         current_player = self.game_copy.get_current_player()
+        priors = self.game_copy.get_action_priors() if self.progressive_bias else None
     
-        for action in actions_to_pop:
+        for action in actions_to_pop.tolist():
             # make the child node for the popped action:
             label = None
             if gui_reporting:
                 label = f"Action {action}"
-            child_node = MonteCarloNode(
+            child_node = self.node_pool.acquire(
                 parent=parent_node,
                 node_action=action,
                 label=label,
                 depth=(parent_node.depth + 1),
                 player=current_player,
             )
+            if priors is not None:
+                child_node.prior = float(priors[action])
 
-            parent_node.children.append(
-                child_node
-            )  # appends this new child node to the current node's list of children
+            parent_node.add_child(child_node)  # appends this new child node to the current node's list of children
+        self.node_count += len(parent_node.children)
+        self.peak_node_count = max(self.peak_node_count, self.node_count)
         return parent_node
 
-    def _rollout_from_selected_node(self):
+    def _rollout_from_selected_node(self) -> dict:
         """
         On _rollout_from_selected_node call, the entire game is simulated to terminus and the outcome of the game is returned
+        Moves are chosen by the engine's rollout policy
+
+        With a max_rollout_depth, the rollout stops after that many plies or rounds and
+        returns the game's evaluate estimate instead. Games without an estimate are played out.
 
         Returns:
             scores (dict): dictionary of scores with player ID as keys
         """
 
-        rollout = 1
+        rollout = 0
+        moves = list(self.path_moves) if self.rollout_policy.learns_from_results else None
+        depth_limited = self.max_rollout_depth is not None
+        if depth_limited and self.rollout_depth_unit == "rounds":
+            start_round = self.game_copy.current_round
         while not self.game_copy.is_game_over():
-            legal_actions = self.game_copy.get_available_actions(special_policy=False)
+            if depth_limited:
+                if self.rollout_depth_unit == "plies":
+                    depth = rollout
+                else:
+                    depth = self.game_copy.current_round - start_round
+                if depth >= self.max_rollout_depth:
+                    estimate = self.game_copy.evaluate()
+                    if estimate is not None:
+                        if moves is not None:
+                            self.rollout_policy.record_result(moves, estimate)
+                        return estimate
+                    depth_limited = False
+
+            legal_actions = self.game_copy.get_legal_actions()
             current_player = self.game_copy.get_current_player()
 
-            random_action = self._choose_random_action(potential_actions=legal_actions)
+            rollout_action = self.rollout_policy.choose_action(self.game_copy, legal_actions, self.random_service)
 
-            self.game_copy.update_game_with_action(random_action, current_player)  # takes action just pulled at random
+            self.game_copy.update_game_with_action(rollout_action, current_player)  # takes the rollout policy's action
+            if moves is not None:
+                moves.append((current_player, rollout_action))
             rollout += 1
 
-    def _backpropogate_node_scores(self, child_node: MonteCarloNode):
+        scores = self.game_copy.get_game_scores()
+        if moves is not None:
+            self.rollout_policy.record_result(moves, scores)
+        return scores
+
+    def _path_moves(self, node: MonteCarloNode) -> list[tuple[int, int]]:
+        """(player ID, action id) of the moves from the search root down to the node"""
+        moves = []
+        while node is not self.search_root:
+            if node.outcome_key is None:
+                moves.append((node.player_owner, node.node_action))
+            node = node.parent
+        moves.reverse()
+        return moves
+
+    def rollout_options(self) -> dict:
+        """The settings a rollout worker's engine is built with"""
+        return {
+            "rollout_policy": self.rollout_policy,
+            "max_rollout_depth": self.max_rollout_depth,
+            "rollout_depth_unit": self.rollout_depth_unit,
+        }
+
+    def _run_leaf_rollouts(self) -> tuple[dict, dict, int]:
+        """
+        Runs leaf_rollouts rollouts from the selected leaf, either in turn from a snapshot of
+        the leaf state or split across the process pool, and combines their scores.
+
+        Returns:
+            scores (dict): mean scores, or summed scores when backing up every rollout
+            score_squares (dict): squared mean scores, or summed squared scores
+            visits (int): visits to back up with the scores
+        """
+        leaf_state = self.game_copy.get_state_snapshot()
+        if self.rollout_pool is None:
+            samples = []
+            for rollout in range(self.leaf_rollouts):
+                if rollout > 0:
+                    self.game_copy.restore_state_snapshot(leaf_state)
+                samples.append(self._rollout_from_selected_node())
+        else:
+            counts = np.diff(np.linspace(0, self.leaf_rollouts, self.rollout_processes + 1).astype(int))
+            seeds = [service.seed_sequence for service in self.random_service.spawn(len(counts))]
+            tasks = [(leaf_state, int(count), seed) for count, seed in zip(counts, seeds) if count > 0]
+            samples = [
+                scores for worker_samples in self.rollout_pool.starmap(rollout_workers.run_rollouts, tasks)
+                for scores in worker_samples
+            ]
+
+        if self.selection_policy is not None:
+            for scores in samples:
+                self.selection_policy.normalizer.update(scores)
+        totals = {player: sum(scores[player] for scores in samples) for player in samples[0]}
+        if self.rollout_backup == "all":
+            squares = {player: sum(scores[player] ** 2 for scores in samples) for player in samples[0]}
+            return totals, squares, len(samples)
+        means = {player: total / len(samples) for player, total in totals.items()}
+        return means, {player: mean * mean for player, mean in means.items()}, 1
+
+    def _prune_cold_subtrees(self):
+        """
+        Collapses the least visited, least recently visited subtrees until the tree is back
+        to prune_to_fraction of max_nodes. A collapsed node drops its children but keeps its
+        visits and total score, which already aggregate its whole subtree, and is expanded
+        again if selection returns to it. The search root is never collapsed.
+        """
+        target = int(self.max_nodes * MonteCarloEngine.prune_to_fraction)
+
+        subtree_sizes = {}
+        expanded = []
+        stack = [(self.search_root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                subtree_sizes[node] = 1 + sum(subtree_sizes[child] for child in node.children)
+                continue
+            if node.children:
+                if node is not self.search_root:
+                    expanded.append(node)
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+            else:
+                subtree_sizes[node] = 1
+
+        # A node never has more visits, a later visit or a smaller depth than its parent,
+        # so descendants come before their ancestors
+        expanded.sort(key=lambda node: (node.number_of_visits, node.last_visit, -node.depth))
+        for node in expanded:
+            if self.node_count <= target:
+                break
+            removed = subtree_sizes[node] - 1
+            if removed == 0:
+                continue
+            self.node_pool.release_subtree(node, include_root=False)
+            self.node_count -= removed
+            ancestor = node
+            while ancestor is not None and ancestor in subtree_sizes:
+                subtree_sizes[ancestor] -= removed
+                ancestor = ancestor.parent
+
+        if self.caching:
+            self.state_cache.forget_released()
+
+    def _backpropogate_proof(self, terminal_node: MonteCarloNode, scores: dict):
+        """
+        Marks a terminal node proven with its final scores, then proves its ancestors up to
+        the search root for as long as their children settle their value (see
+        MonteCarloNode.prove_from_children).
+
+        Args:
+            terminal_node (object instance): MonteCarloNode where the game ended
+            scores (dict): final scores of the game, with player ID as keys
+        """
+        terminal_node.prove(scores)
+        node = terminal_node
+        while node is not self.search_root:
+            node = node.parent
+            if node.proven_scores is not None or not node.prove_from_children(self.game_copy.win_score):
+                break
+
+    def _backpropogate_node_scores(self, child_node: MonteCarloNode, visits: int = 1):
         """
         Node statistics are updated starting with rollout node and moving up, until the parent node is reached.
 
@@ -195,9 +848,11 @@ class MonteCarloEngine:
         Args:
             scores (dict): dictionary of scores with player ID as keys
             node (object instance): MonteCarloNode object instance
+            visits (int): number of rollouts the scores add up
         """
 
         # if self.turn_action_log == node.player_owner:
         for ancestor in child_node.get_ancestors():
-            ancestor.number_of_visits += 1
-            ancestor.total_score += self.scores[ancestor.player_owner]
\ No newline at end of file
+            ancestor.record_visit(
+                visits, self.scores[ancestor.player_owner], self.score_squares[ancestor.player_owner], self.simulation
+            )
\ No newline at end of file
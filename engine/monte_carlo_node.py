@@ -1,8 +1,38 @@
 from __future__ import annotations
+import weakref
+from typing import TYPE_CHECKING
+
 import numpy as np
 
+from games.game_components.action import InternedGameAction
+
+if TYPE_CHECKING:
+    from games.game_components.action import GameAction
+    from engine.selection_policies import SelectionPolicy
+
 
 class MonteCarloNode:
+    # Parents are held by weak reference, so a tree has no reference cycles and is freed
+    # by refcount as soon as its root is dropped
+    __slots__ = (
+        "_parent",
+        "node_action",
+        "children",
+        "number_of_visits",
+        "total_score",
+        "sum_of_squares",
+        "prior",
+        "label",
+        "depth",
+        "player_owner",
+        "last_visit",
+        "proven_scores",
+        "state_snapshot",
+        "outcome_key",
+        "outcome_seed",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         parent: MonteCarloNode = None,
@@ -16,22 +46,82 @@ class MonteCarloNode:
 
         Args:
             parent (object instance, optional): Node object that spawned this node. Defaults to None.
-            node_action (int or str, optional): Action this node returns to game state when node is activated. Defaults to None.
+            node_action (int, optional): Action id this node returns to game state when node is activated. Defaults to None.
             label (str, optional): Node label for GUI reporting. Defaults to 'Root Node'.
             depth (int, optional): Depth of node in tree. Defaults to 0.
             player (int, optional): Player ID of node owner. Defaults to None.
         """
+        self.reset(parent, node_action, label, depth, player)
 
+    def reset(
+        self,
+        parent: MonteCarloNode = None,
+        node_action=None,
+        label: str = "Root Node",
+        depth=0,
+        player=None,
+    ):
+        """Sets every field as for a new node, so a pooled node can be reused (see NodePool)"""
         self.parent = parent  # the node that spawned this node. Root is None.
-        self.node_action = node_action  # the action being taken at this node
+        self.node_action = node_action  # the action id being taken at this node
         self.children: list[
             MonteCarloNode
         ] = []  # the storage for the children of this node
         self.number_of_visits = 0  # number of times current node is visited
         self.total_score = 0  # total score for this node ONLY for its owner
+        self.sum_of_squares = 0  # sum of the squared rollout scores for its owner, for variance-aware selection
+        self.prior = 0.0  # the game's prior weight for this node's action, for progressive bias
         self.label = label  # label for the node, is used in GUI reporting
         self.depth = depth  # depth of the node
         self.player_owner = player  # the player who owns/plays this node layer. Should be same player at any given depth.
+        self.last_visit = 0  # simulation number of the latest visit, used to prune cold subtrees
+        self.proven_scores = None  # final scores under best play once the solver proves them
+        self.state_snapshot = None  # game state at this node, when held by the engine's StateCache
+        self.outcome_key = None  # chance outcome this node stands for, under a move with a random result
+        self.outcome_seed = None  # seed that replays that outcome
+
+    @property
+    def parent(self) -> MonteCarloNode:
+        return self._parent() if self._parent is not None else None
+
+    @parent.setter
+    def parent(self, parent: MonteCarloNode):
+        self._parent = weakref.ref(parent) if parent is not None else None
+
+    def add_child(self, child: MonteCarloNode):
+        self.children.append(child)
+
+    def clear_children(self):
+        self.children = []
+
+    def get_child(self, action: int) -> MonteCarloNode:
+        """The child reached by the action id, or None if it is not expanded"""
+        for child in self.children:
+            if child.node_action == action:
+                return child
+        return None
+
+    def record_visit(self, visits: int, score: float, score_square: float, simulation: int):
+        """Adds a backed up result: visits rollouts worth score in total for this node's
+        owner, and score_square in total squared score"""
+        self.last_visit = simulation
+        self.number_of_visits += visits
+        self.total_score += score
+        self.sum_of_squares += score_square
+
+    def prove(self, scores: dict):
+        """Marks the node's final scores under best play as known"""
+        self.proven_scores = scores
+
+    def count_subtree_nodes(self) -> int:
+        """Number of nodes in the subtree rooted here, this node included"""
+        count = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children)
+        return count
 
     def get_ancestors(self) -> set[MonteCarloNode]:
         ancestor_list: list[MonteCarloNode] = [self]
@@ -39,23 +129,73 @@ class MonteCarloNode:
             ancestor_list += self.parent.get_ancestors()
         return set(ancestor_list)
 
-    def best_child(self, explore_param=1.414, real_move=False) -> MonteCarloNode:
+    def prove_from_children(self, win_score: float = None) -> bool:
+        """
+        Proves this node from its children by max^n (minimax for two players): the player
+        to move here picks the proven child best for them. That choice is known once any
+        child is proven to give them win_score, or once every child is proven.
+
+        Args:
+            win_score (float, optional): the game's win score. Defaults to None, waiting
+                for every child to be proven.
+
+        Returns:
+            bool: whether the node is proven now
+        """
+        best = None
+        for child in self.children:
+            if child.proven_scores is None:
+                if win_score is None:
+                    return False
+                continue
+            child_score = child.proven_scores[child.player_owner]
+            if win_score is not None and child_score >= win_score:
+                self.prove(child.proven_scores)
+                return True
+            if best is None or child_score > best.proven_scores[best.player_owner]:
+                best = child
+        if best is None or any(child.proven_scores is None for child in self.children):
+            return False
+        self.prove(best.proven_scores)
+        return True
+
+    def best_child(
+        self,
+        explore_param=1.414,
+        real_move=False,
+        skip_proven=False,
+        selection: SelectionPolicy = None,
+        progressive_bias: float = 0.0,
+    ) -> MonteCarloNode:
         """
         Evaluates all available children for highest scoring child node
         first param is exploitation and second is exploration
 
         Args:
             explore_param (int, optional): Exploration term. Defaults to root 2.
+            real_move (bool, optional): choose the move to play rather than the node to
+                search. Proven children are then valued at their proven score.
+            skip_proven (bool, optional): pass over proven children, whose result is known,
+                unless all children are proven. Defaults to False.
+            selection (SelectionPolicy, optional): scores the children when searching.
+                Defaults to None, UCB1 on raw scores.
+            progressive_bias (float, optional): weight of the children's priors when
+                searching, added as progressive_bias * prior / (visits + 1). Defaults to 0.
 
         Returns:
             child node (object instance): MonteCarloNode object instance
         """
-        return self.children[
+        candidates = self.children
+        if skip_proven:
+            candidates = [child for child in self.children if child.proven_scores is None] or self.children
+        if selection is not None and not real_move:
+            return candidates[np.argmax(selection.child_scores(self, candidates, progressive_bias))]
+        return candidates[
             np.argmax(
                 np.array(
                     [
-                        self._calculate_score(child, explore_param, real_move)
-                        for child in self.children
+                        self._calculate_score(child, explore_param, real_move, progressive_bias)
+                        for child in candidates
                     ]
                 )
             )
@@ -66,10 +206,18 @@ class MonteCarloNode:
         node: MonteCarloNode,
         explore_param: float = 1.414,
         real_move: bool = False,
+        progressive_bias: float = 0.0,
     ) -> float:
+        if real_move:
+            if node.proven_scores is not None:
+                return node.proven_scores[node.player_owner]
+            if node.number_of_visits == 0:
+                # searches stopped by the solver can leave children unvisited
+                return -np.inf
+        bias = progressive_bias * node.prior / (node.number_of_visits + 1)
         # if calculation runs into a divide by 0 error because child has never been visted
         if node.number_of_visits == 0:
-            return 1000
+            return 1000 + bias
         # get scores of all child nodes
         score = node.total_score / node.number_of_visits
         if real_move:
@@ -77,4 +225,212 @@ class MonteCarloNode:
         score += explore_param * (
             np.sqrt(np.log(self.number_of_visits) / node.number_of_visits)
         )
-        return score
+        return score + bias
+
+
+class DenseMonteCarloNode(MonteCarloNode):
+    """MonteCarloNode whose children also fill a fixed-width row indexed by action id,
+    for games with a small ACTION_SPACE_SIZE.
+
+    The row holds each child's position in children and a copy of its visits, total
+    score and proven score, kept up to date as results are backed up. Finding an
+    action's child is an index, and best_child scores the whole row in one numpy pass.
+    Action ids without a child hold -1 and NaN. Every node of a dense tree must be
+    dense, as a child updates its parent's row.
+    """
+
+    __slots__ = ("child_index", "child_visits", "child_totals", "child_proven", "child_priors")
+
+    def __init__(
+        self,
+        action_space_size: int,
+        parent: MonteCarloNode = None,
+        node_action=None,
+        label: str = "Root Node",
+        depth=0,
+        player=None,
+    ):
+        """
+        Args:
+            action_space_size (int): width of the child rows, the game's ACTION_SPACE_SIZE.
+            Others as for MonteCarloNode.
+        """
+        self.child_index = np.empty(action_space_size, dtype=np.int32)
+        self.child_visits = np.empty(action_space_size)
+        self.child_totals = np.empty(action_space_size)
+        self.child_proven = np.empty(action_space_size)
+        self.child_priors = np.empty(action_space_size)
+        super().__init__(parent, node_action, label, depth, player)
+
+    def reset(self, *args, **kwargs):
+        super().reset(*args, **kwargs)
+        self._clear_rows()
+
+    def _clear_rows(self):
+        self.child_index.fill(-1)
+        self.child_visits.fill(np.nan)
+        self.child_totals.fill(np.nan)
+        self.child_proven.fill(np.nan)
+        self.child_priors.fill(0.0)
+
+    def add_child(self, child: DenseMonteCarloNode):
+        action = child.node_action
+        if action is None:
+            # Chance outcomes have no action id, and are not chosen by best_child
+            self.children.append(child)
+            return
+        self.child_index[action] = len(self.children)
+        self.child_visits[action] = child.number_of_visits
+        self.child_totals[action] = child.total_score
+        self.child_priors[action] = child.prior
+        if child.proven_scores is not None:
+            self.child_proven[action] = child.proven_scores[child.player_owner]
+        self.children.append(child)
+
+    def clear_children(self):
+        super().clear_children()
+        self._clear_rows()
+
+    def get_child(self, action: int) -> DenseMonteCarloNode:
+        index = self.child_index[action]
+        return self.children[index] if index >= 0 else None
+
+    def record_visit(self, visits: int, score: float, score_square: float, simulation: int):
+        super().record_visit(visits, score, score_square, simulation)
+        parent = self.parent
+        if parent is not None and self.node_action is not None:
+            parent.child_visits[self.node_action] += visits
+            parent.child_totals[self.node_action] += score
+
+    def prove(self, scores: dict):
+        super().prove(scores)
+        parent = self.parent
+        if parent is not None and self.node_action is not None:
+            parent.child_proven[self.node_action] = scores[self.player_owner]
+
+    def best_child(
+        self,
+        explore_param=1.414,
+        real_move=False,
+        skip_proven=False,
+        selection: SelectionPolicy = None,
+        progressive_bias: float = 0.0,
+    ) -> DenseMonteCarloNode:
+        """
+        Same choice as MonteCarloNode.best_child, scored over the child rows. Ties go to
+        the lowest action id, which is the first child for games listing actions in order.
+        Selection policies score the children list.
+        """
+        if selection is not None and not real_move:
+            return super().best_child(explore_param, real_move, skip_proven, selection, progressive_bias)
+        visits = self.child_visits
+        proven = ~np.isnan(self.child_proven)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = self.child_totals / visits
+            if real_move:
+                scores = np.where(proven, self.child_proven, np.where(visits > 0, means, -np.inf))
+            else:
+                scores = means + explore_param * np.sqrt(np.log(self.number_of_visits) / visits)
+                scores[visits == 0] = 1000
+                if progressive_bias:
+                    scores += progressive_bias * self.child_priors / (visits + 1)
+        scores[self.child_index < 0] = -np.inf
+        if not real_move and skip_proven:
+            open_children = (self.child_index >= 0) & ~proven
+            if open_children.any():
+                scores[~open_children] = -np.inf
+        return self.children[self.child_index[np.argmax(scores)]]
+
+
+class NodePool:
+    """Free list of MonteCarloNode objects, reused across searches and turns.
+
+    Trees handed back with release_subtree are taken apart and their nodes reset on
+    reuse, so a long game allocates nodes only while the tree is larger than any
+    tree released before it.
+    """
+
+    # Widest child rows handed out. A dense node holds five float-sized rows, about
+    # 40 bytes per action id, so a node 256 wide carries 10 KB of rows.
+    MAX_DENSE_WIDTH = 256
+
+    def __init__(self, max_free_nodes: int = 1_000_000, action_space_size: int = None):
+        """
+        Args:
+            max_free_nodes (int, optional): most nodes kept for reuse; any more are left
+                to be freed. Defaults to 1,000,000.
+            action_space_size (int, optional): hand out DenseMonteCarloNode objects with
+                rows this wide, the game's ACTION_SPACE_SIZE. Defaults to None, plain nodes.
+
+        Raises:
+            ValueError: action_space_size is wider than MAX_DENSE_WIDTH.
+        """
+        if action_space_size is not None and action_space_size > NodePool.MAX_DENSE_WIDTH:
+            raise ValueError(
+                f"Dense child rows {action_space_size} wide exceed the limit of {NodePool.MAX_DENSE_WIDTH}"
+            )
+        self.max_free_nodes = max_free_nodes
+        self.action_space_size = action_space_size
+        self.free_nodes: list[MonteCarloNode] = []
+
+    @classmethod
+    def dense(cls, action_type: type[GameAction], **kwargs) -> NodePool:
+        """Pool of dense nodes with rows as wide as a game's action ids.
+
+        Raises:
+            ValueError: the game has no action_type, or its ids are interned, so there is
+                no fixed action space to index.
+        """
+        if action_type is None:
+            raise ValueError("Dense child rows need a game with an action_type")
+        if issubclass(action_type, InternedGameAction):
+            raise ValueError(
+                f"{action_type.__name__} ids are interned as actions are seen, so they have no fixed width for dense child rows"
+            )
+        return cls(action_space_size=action_type.id_count(), **kwargs)
+
+    def acquire(
+        self,
+        parent: MonteCarloNode = None,
+        node_action=None,
+        label: str = "Root Node",
+        depth=0,
+        player=None,
+    ) -> MonteCarloNode:
+        # A single pop, so a pondering search in another thread cannot empty the list in between
+        try:
+            node = self.free_nodes.pop()
+        except IndexError:
+            pass
+        else:
+            node.reset(parent, node_action, label, depth, player)
+            return node
+        if self.action_space_size is not None:
+            return DenseMonteCarloNode(self.action_space_size, parent, node_action, label, depth, player)
+        return MonteCarloNode(parent, node_action, label, depth, player)
+
+    def reroot(self, root: MonteCarloNode, child: MonteCarloNode) -> MonteCarloNode:
+        """Releases the tree but for the child's subtree, and returns the child, detached
+        from its parent, as the root of a tree of its own"""
+        root.children.remove(child)
+        self.release_subtree(root)
+        child.parent = None
+        return child
+
+    def release_subtree(self, node: MonteCarloNode, include_root: bool = True):
+        """
+        Returns a subtree's nodes to the pool. The caller must drop its own references
+        to them. With include_root False only the node's descendants are released, and
+        the node is left as a leaf. Released nodes drop their state snapshots.
+        """
+        stack = list(node.children)
+        node.clear_children()
+        if include_root:
+            stack.append(node)
+        while stack:
+            released = stack.pop()
+            stack.extend(released.children)
+            released.children = []
+            released.state_snapshot = None
+            if len(self.free_nodes) < self.max_free_nodes:
+                self.free_nodes.append(released)
@@ -0,0 +1,99 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from games.game_components.action import GameAction, InternedGameAction
+
+# Turn columns of the tournament logs written by GameMultiprocessor.playout_simulations
+TURN_COLUMN = re.compile(r"T(\d+) P(\d+)")
+PLAYER_COLUMN = re.compile(r"Player (\d+)")
+
+
+def policy_table_path(game_class_name: str, directory: str = "policy_tables") -> str:
+    """Where the distilled table of a game is saved, and looked for by TableRolloutPolicy"""
+    return os.path.join(directory, f"{game_class_name}.npy")
+
+
+def check_table_action_type(action_type: type[GameAction]) -> None:
+    """Raises ValueError for interned action types: their ids are only the order in which
+    each process first saw an action, so the same id in two logs can be different moves."""
+    if action_type is not None and issubclass(action_type, InternedGameAction):
+        raise ValueError(
+            f"{action_type.__name__} ids are interned per process and differ between logged games, "
+            "so they cannot be distilled into a policy table"
+        )
+
+
+def _grown(table: np.ndarray, rows: int, columns: int) -> np.ndarray:
+    if table.shape[0] >= rows and table.shape[1] >= columns:
+        return table
+    grown = np.zeros((max(rows, table.shape[0]), max(columns, table.shape[1])))
+    grown[: table.shape[0], : table.shape[1]] = table
+    return grown
+
+
+def distill_turn_logs(
+    log_paths: list[str], by_player: bool = True, action_space_size: int = None, chunksize: int = 1000
+) -> np.ndarray:
+    """
+    Streams tournament logs into an action-value table: the mean final score of the
+    player who played each action id, over every logged turn. Actions never played
+    score the mean over all of the row's moves. The table is keyed by action id (and
+    player) only, not by any feature of the position the action was played in, and
+    needs ids that mean the same move in every process (see check_table_action_type).
+
+    Args:
+        log_paths (list[str]): turn log CSVs, one row per game with "Player <id>" final
+            scores and "T<turn> P<player>" action ids.
+        by_player (bool, optional): one row per player ID, as the player to move is often
+            worth telling apart; otherwise a single row for every player. Defaults to True.
+        action_space_size (int, optional): columns of the table, at least. Defaults to
+            None, up to the highest action id logged.
+        chunksize (int, optional): games read from a log at a time. Defaults to 1000.
+
+    Returns:
+        table (np.ndarray): float32 (rows, actions) mean scores
+    """
+    score_totals = np.zeros((1, action_space_size or 0))
+    move_counts = np.zeros((1, action_space_size or 0))
+    for log_path in log_paths:
+        for games in pd.read_csv(log_path, chunksize=chunksize):
+            score_columns = {}
+            for column in games.columns:
+                player = PLAYER_COLUMN.fullmatch(column)
+                if player is not None:
+                    score_columns[int(player[1])] = column
+            for column in games.columns:
+                turn = TURN_COLUMN.fullmatch(column)
+                if turn is None:
+                    continue
+                player_num = int(turn[2])
+                played = games[column].notna().to_numpy()
+                if not played.any():
+                    continue
+                actions = games[column].to_numpy()[played].astype(int)
+                scores = games[score_columns[player_num]].to_numpy(dtype=float)[played]
+                row = player_num if by_player else 0
+                score_totals = _grown(score_totals, row + 1, actions.max() + 1)
+                move_counts = _grown(move_counts, row + 1, actions.max() + 1)
+                columns = score_totals.shape[1]
+                score_totals[row] += np.bincount(actions, scores, columns)
+                move_counts[row] += np.bincount(actions, minlength=columns)
+
+    row_means = score_totals.sum(axis=1, keepdims=True) / np.maximum(move_counts.sum(axis=1, keepdims=True), 1)
+    table = np.where(move_counts > 0, score_totals / np.maximum(move_counts, 1), row_means)
+    return table.astype(np.float32)
+
+
+def save_policy_table(table: np.ndarray, path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.save(path, table)
+
+
+def load_policy_table(path: str) -> np.ndarray:
+    """The saved table, memory-mapped read only, so every process shares the same pages"""
+    return np.load(path, mmap_mode="r")
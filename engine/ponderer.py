@@ -0,0 +1,56 @@
+import copy
+import threading
+
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.monte_carlo_node import MonteCarloNode
+from games.game_components.base_game_object import BaseGameObject
+
+
+class Ponderer:
+    """Keeps searching a tree in a background thread while another player thinks.
+
+    start hands the thread a copy of the game and the tree's root, the position after
+    the engine's own move; stop sets the cancellation event, waits for the simulation
+    in progress and returns how many ran. The tree can then be moved down to the
+    opponent's reply (NodePool.reroot) and searched on from there, its statistics
+    kept. The main thread must leave the tree alone in between.
+
+    Only deterministic games are pondered: moves with random results draw from the
+    process-wide random service, which the two threads would share.
+    """
+
+    def __init__(self, montecarlo: MonteCarloEngine):
+        """
+        Args:
+            montecarlo (MonteCarloEngine): engine used by the thread, not shared with the
+                main thread's searches.
+        """
+        self.montecarlo = montecarlo
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.simulations = 0
+
+    def start(self, game: BaseGameObject, root: MonteCarloNode):
+        if not game.deterministic:
+            raise ValueError("Only deterministic games can be pondered")
+        self.stop_event.clear()
+        self.simulations = 0
+        self.thread = threading.Thread(
+            target=self._ponder, args=(copy.deepcopy(game), root), name="ponderer", daemon=True
+        )
+        self.thread.start()
+
+    def _ponder(self, game: BaseGameObject, root: MonteCarloNode):
+        self.simulations = self.montecarlo.ponder(game, game.get_current_player(), root, self.stop_event)
+
+    def stop(self) -> int:
+        """
+        Returns:
+            simulations (int): simulations run since start
+        """
+        if self.thread is None:
+            return 0
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        return self.simulations
@@ -0,0 +1,228 @@
+import numpy as np
+
+from engine.policy_tables import check_table_action_type, load_policy_table, policy_table_path
+from games.game_components.base_game_object import BaseGameObject
+from games.game_components.random_service import RandomService
+
+
+class RolloutPolicy:
+    """Chooses the moves played during a rollout.
+
+    The engine calls choose_action once per rollout ply with the legal action ids of
+    the current position and its random service.  Policies are registered by name in
+    ROLLOUT_POLICIES so they can be picked from the command line.
+
+    Policies that learn set learns_from_results; the engine then reports every
+    rollout's moves, those of the tree path above it included, to record_result.
+    """
+
+    learns_from_results = False
+
+    def choose_action(self, game: BaseGameObject, legal_actions: np.ndarray, random_service: RandomService) -> int:
+        raise NotImplementedError
+
+    def record_result(self, moves: list[tuple[int, int]], scores: dict) -> None:
+        """
+        Learns from one simulation.
+
+        Args:
+            moves (list): (player ID, action id) of every move from the search root to the end of the rollout
+            scores (dict): the rollout's scores, with player ID as keys
+        """
+
+
+class UniformRolloutPolicy(RolloutPolicy):
+    """Plays a uniformly random legal action.  The cheapest policy, and the default."""
+
+    def choose_action(self, game: BaseGameObject, legal_actions: np.ndarray, random_service: RandomService) -> int:
+        return random_service.choice(legal_actions)
+
+
+class WinBlockRolloutPolicy(RolloutPolicy):
+    """Plays a winning action if there is one, otherwise blocks the first opponent in
+    turn order that threatens to win, otherwise plays at random.
+
+    Reads the game's get_winning_actions hook, which games answer from incrementally
+    kept threat tables.  Games without the hook are played at random.
+    """
+
+    def choose_action(self, game: BaseGameObject, legal_actions: np.ndarray, random_service: RandomService) -> int:
+        player_num = game.get_current_player()
+        winning_actions = game.get_winning_actions(player_num)
+        if winning_actions is None:
+            return random_service.choice(legal_actions)
+        if len(winning_actions) > 0:
+            return random_service.choice(winning_actions)
+
+        for offset in range(1, game.player_count):
+            threats = game.get_winning_actions((player_num + offset) % game.player_count)
+            blocking_actions = threats[np.isin(threats, legal_actions)]
+            if len(blocking_actions) > 0:
+                return random_service.choice(blocking_actions)
+
+        return random_service.choice(legal_actions)
+
+
+class EpsilonGreedyRolloutPolicy(RolloutPolicy):
+    """Plays at random with probability epsilon, otherwise plays one of the actions
+    the game's special policy prefers (get_available_actions(special_policy=True)).
+
+    The special policy is game code and can cost much more per ply than the other
+    policies; epsilon sets how often that cost is skipped.
+    """
+
+    def __init__(self, epsilon: float = 0.1):
+        self.epsilon = epsilon
+
+    def choose_action(self, game: BaseGameObject, legal_actions: np.ndarray, random_service: RandomService) -> int:
+        if random_service.random() < self.epsilon:
+            return random_service.choice(legal_actions)
+        greedy_actions = game.get_available_actions(special_policy=True)
+        if len(greedy_actions) == 0:
+            return random_service.choice(legal_actions)
+        return random_service.choice(greedy_actions)
+
+
+class MastRolloutPolicy(RolloutPolicy):
+    """Move-Average Sampling Technique: plays actions in proportion to how well they have
+    done for the player, wherever they were played.
+
+    Keeps the mean score each player got after playing each action id, over every move
+    of every simulation reported to record_result. Moves are drawn from a Gibbs
+    distribution, exp(mean / temperature), or, with an epsilon, greedily on the mean and
+    at random with probability epsilon. Actions a player has not played yet score the
+    player's mean over all actions. The table lives on the policy, so it carries over
+    from turn to turn for as long as the same policy object is used.
+    """
+
+    learns_from_results = True
+
+    def __init__(self, temperature: float = 1.0, epsilon: float = None):
+        """
+        Args:
+            temperature (float, optional): Gibbs temperature, on the scale of the game's scores. Defaults to 1.0.
+            epsilon (float, optional): plays epsilon-greedy instead of Gibbs when set. Defaults to None.
+        """
+        self.temperature = temperature
+        self.epsilon = epsilon
+        # [player, action] sums of scores and move counts
+        self.score_totals = np.zeros((0, 0))
+        self.move_counts = np.zeros((0, 0))
+        # [player, action] mean scores and Gibbs weights, refreshed on every result so a
+        # rollout ply only reads them
+        self.action_means = np.zeros((0, 0))
+        self.action_weights = np.zeros((0, 0))
+
+    def _grow(self, player_count: int, action_count: int):
+        rows = max(player_count, self.move_counts.shape[0])
+        columns = max(action_count, self.move_counts.shape[1])
+        if (rows, columns) == self.move_counts.shape:
+            return
+        score_totals = np.zeros((rows, columns))
+        move_counts = np.zeros((rows, columns))
+        score_totals[: self.score_totals.shape[0], : self.score_totals.shape[1]] = self.score_totals
+        move_counts[: self.move_counts.shape[0], : self.move_counts.shape[1]] = self.move_counts
+        self.score_totals, self.move_counts = score_totals, move_counts
+        self._refresh()
+
+    def _refresh(self):
+        player_moves = self.move_counts.sum(axis=1, keepdims=True)
+        player_means = self.score_totals.sum(axis=1, keepdims=True) / np.maximum(player_moves, 1)
+        # Actions not played yet score the player's mean over all actions
+        self.action_means = np.where(
+            self.move_counts > 0, self.score_totals / np.maximum(self.move_counts, 1), player_means
+        )
+        # Shifted by each player's best mean, which leaves the Gibbs odds alone and keeps exp in range
+        best_means = self.action_means.max(axis=1, keepdims=True)
+        self.action_weights = np.exp((self.action_means - best_means) / self.temperature)
+
+    def record_result(self, moves: list[tuple[int, int]], scores: dict) -> None:
+        if not moves:
+            return
+        players, actions = np.array(moves).T
+        player_scores = np.zeros(max(scores) + 1)
+        player_scores[list(scores)] = list(scores.values())
+        self._grow(len(player_scores), actions.max() + 1)
+        rows, columns = self.move_counts.shape
+        cells = players * columns + actions
+        self.score_totals += np.bincount(cells, player_scores[players], rows * columns).reshape(rows, columns)
+        self.move_counts += np.bincount(cells, minlength=rows * columns).reshape(rows, columns)
+        self._refresh()
+
+    def action_values(self, player_num: int, legal_actions: np.ndarray) -> np.ndarray:
+        """The player's mean score for each of the legal actions"""
+        self._grow(player_num + 1, legal_actions.max() + 1)
+        return self.action_means[player_num, legal_actions]
+
+    def choose_action(self, game: BaseGameObject, legal_actions: np.ndarray, random_service: RandomService) -> int:
+        player_num = game.get_current_player()
+        if self.epsilon is not None:
+            if random_service.random() < self.epsilon:
+                return random_service.choice(legal_actions)
+            values = self.action_values(player_num, legal_actions)
+            return random_service.choice(legal_actions[values == values.max()])
+        try:
+            weights = self.action_weights[player_num, legal_actions]
+        except IndexError:
+            # A player or action id the table has not seen yet
+            self._grow(player_num + 1, legal_actions.max() + 1)
+            weights = self.action_weights[player_num, legal_actions]
+        cumulative_weights = weights.cumsum()
+        if cumulative_weights[-1] == 0:
+            # Every legal action is far below the player's best one
+            return random_service.choice(legal_actions)
+        position = cumulative_weights.searchsorted(random_service.random() * cumulative_weights[-1], side="right")
+        return legal_actions[position]
+
+
+class TableRolloutPolicy(RolloutPolicy):
+    """Plays actions in proportion to exp(value / temperature), with values read from an
+    action-value table distilled offline from tournament logs (engine/policy_tables.py).
+
+    The table is keyed by player and action id only, so every position weighs an action
+    the same. It is memory-mapped the first time a process plays a move, so rollout
+    worker processes open it themselves instead of being sent a copy. Players beyond
+    the table's rows use its first row, and positions with actions beyond its columns
+    are played at random. Games with interned action ids are refused, as their ids
+    differ from process to process.
+    """
+
+    def __init__(self, table_path: str = None, temperature: float = 1.0):
+        """
+        Args:
+            table_path (str, optional): saved table. Defaults to None, the game's table in
+                policy_tables/ (policy_table_path).
+            temperature (float, optional): Gibbs temperature, on the scale of the game's scores. Defaults to 1.0.
+        """
+        self.table_path = table_path
+        self.temperature = temperature
+        self.table = None
+
+    def __getstate__(self) -> dict:
+        # Workers map the file again rather than unpickle a copy of it
+        return {**self.__dict__, "table": None}
+
+    def choose_action(self, game: BaseGameObject, legal_actions: np.ndarray, random_service: RandomService) -> int:
+        if self.table is None:
+            check_table_action_type(game.action_type)
+            if self.table_path is None:
+                self.table_path = policy_table_path(type(game).__name__)
+            self.table = load_policy_table(self.table_path)
+        player_num = game.get_current_player()
+        row = player_num if player_num < self.table.shape[0] else 0
+        try:
+            values = self.table[row, legal_actions]
+        except IndexError:
+            return random_service.choice(legal_actions)
+        cumulative_weights = np.exp((values - values.max()) / self.temperature).cumsum()
+        position = cumulative_weights.searchsorted(random_service.random() * cumulative_weights[-1], side="right")
+        return legal_actions[position]
+
+
+ROLLOUT_POLICIES: dict[str, type[RolloutPolicy]] = {
+    "uniform": UniformRolloutPolicy,
+    "win_block": WinBlockRolloutPolicy,
+    "epsilon_greedy": EpsilonGreedyRolloutPolicy,
+    "mast": MastRolloutPolicy,
+    "table": TableRolloutPolicy,
+}
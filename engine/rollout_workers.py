@@ -0,0 +1,50 @@
+# Process pool workers for leaf-parallel rollouts.
+# Each worker receives a copy of the game and the rollout settings once, when the pool
+# starts. Per leaf it is only sent a state snapshot (see BaseGameObject.get_state_snapshot),
+# so the game itself is pickled once per search.
+
+import multiprocessing as mp
+from multiprocessing.pool import Pool
+
+import numpy as np
+
+from games.game_components.base_game_object import BaseGameObject
+from games.game_components.random_service import RandomService, set_random_service
+
+_worker_engine = None
+
+
+def start_pool(processes: int, game: BaseGameObject, engine_options: dict) -> Pool:
+    """A pool of rollout workers, each set up with a copy of the game and the rollout settings.
+
+    Pool workers are daemonic and cannot start pools of their own, so this fails inside
+    one, as in the game workers of GameMultiprocessor.
+    """
+    if mp.current_process().daemon:
+        raise ValueError(
+            "Rollout worker processes cannot be started from a daemonic process, such as a "
+            "GameMultiprocessor game worker; run leaf rollouts in processes with single_game.py"
+        )
+    return mp.Pool(processes=processes, initializer=init_worker, initargs=(game, engine_options))
+
+
+def init_worker(game: BaseGameObject, engine_options: dict) -> None:
+    from engine.monte_carlo_engine import MonteCarloEngine
+
+    global _worker_engine
+    _worker_engine = MonteCarloEngine(start_player=game.get_current_player(), verbose=False, **engine_options)
+    _worker_engine.game_copy = game
+
+
+def run_rollouts(snapshot, count: int, seed: np.random.SeedSequence) -> list[dict]:
+    """Runs count rollouts from the snapshot state and returns their scores."""
+    random_service = RandomService(seed)
+    # Game draws (dice, tiles) use the process-wide service
+    set_random_service(random_service)
+    _worker_engine.random_service = random_service
+    game = _worker_engine.game_copy
+    samples = []
+    for _ in range(count):
+        game.restore_state_snapshot(snapshot)
+        samples.append(_worker_engine._rollout_from_selected_node())
+    return samples
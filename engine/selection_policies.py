@@ -0,0 +1,95 @@
+import numpy as np
+
+from engine.monte_carlo_node import MonteCarloNode
+
+
+class ScoreNormalizer:
+    """Running minimum and maximum of the backed up scores of each player, so selection
+    can work on scores scaled to [0, 1] whatever the game's scoring (±1 for a win,
+    points for Azul or Sagrada)."""
+
+    def __init__(self):
+        self.lowest: dict[int, float] = {}
+        self.highest: dict[int, float] = {}
+
+    def update(self, scores: dict):
+        for player, score in scores.items():
+            if player not in self.lowest:
+                self.lowest[player] = self.highest[player] = score
+            elif score < self.lowest[player]:
+                self.lowest[player] = score
+            elif score > self.highest[player]:
+                self.highest[player] = score
+
+    def scale(self, player: int) -> tuple[float, float]:
+        """The player's lowest score and score range. A range of 0 is reported as 1"""
+        lowest = self.lowest.get(player, 0.0)
+        score_range = self.highest.get(player, 0.0) - lowest
+        return lowest, score_range if score_range > 0 else 1.0
+
+
+class SelectionPolicy:
+    """Scores a node's children during selection, on scores normalized to [0, 1].
+
+    The engine keeps the normalizer up to date with every rollout result. The plain
+    UCB1 of MonteCarloNode.best_child, on raw scores, is used when the engine has no
+    selection policy. Policies are registered by name in SELECTION_POLICIES.
+    """
+
+    def __init__(self, explore_param: float = 1.414):
+        self.explore_param = explore_param
+        self.normalizer = ScoreNormalizer()
+
+    def child_scores(
+        self, parent: MonteCarloNode, children: list[MonteCarloNode], progressive_bias: float = 0.0
+    ) -> np.ndarray:
+        # A parent is unvisited only while all its children are
+        log_parent_visits = np.log(parent.number_of_visits) if parent.number_of_visits > 0 else 0.0
+        scores = np.empty(len(children))
+        for position, child in enumerate(children):
+            bias = progressive_bias * child.prior / (child.number_of_visits + 1)
+            if child.number_of_visits == 0:
+                scores[position] = 1000 + bias
+                continue
+            lowest, score_range = self.normalizer.scale(child.player_owner)
+            visits = child.number_of_visits
+            mean = child.total_score / visits
+            variance = max(child.sum_of_squares / visits - mean * mean, 0.0) / (score_range * score_range)
+            scores[position] = (
+                (mean - lowest) / score_range + self.exploration(variance, visits, log_parent_visits) + bias
+            )
+        return scores
+
+    def exploration(self, variance: float, visits: int, log_parent_visits: float) -> float:
+        raise NotImplementedError
+
+
+class UCB1SelectionPolicy(SelectionPolicy):
+    """UCB1 on normalized scores: explore_param * sqrt(ln N / n)"""
+
+    def exploration(self, variance: float, visits: int, log_parent_visits: float) -> float:
+        return self.explore_param * np.sqrt(log_parent_visits / visits)
+
+
+class UCBTunedSelectionPolicy(SelectionPolicy):
+    """UCB-Tuned (Auer et al. 2002): the UCB1 term with the child's own variance bound,
+    min(1/4, variance + sqrt(2 ln N / n)), in place of a tuned constant."""
+
+    def exploration(self, variance: float, visits: int, log_parent_visits: float) -> float:
+        variance_bound = variance + np.sqrt(2 * log_parent_visits / visits)
+        return np.sqrt(log_parent_visits / visits * min(0.25, variance_bound))
+
+
+class UCBVSelectionPolicy(SelectionPolicy):
+    """UCB-V (Audibert et al. 2009): sqrt(2 variance ln N / n) + 3 ln N / n, for
+    scores in [0, 1]. Low variance children are explored less than under UCB1."""
+
+    def exploration(self, variance: float, visits: int, log_parent_visits: float) -> float:
+        return np.sqrt(2 * variance * log_parent_visits / visits) + 3 * log_parent_visits / visits
+
+
+SELECTION_POLICIES: dict[str, type[SelectionPolicy]] = {
+    "ucb1_normalized": UCB1SelectionPolicy,
+    "ucb_tuned": UCBTunedSelectionPolicy,
+    "ucb_v": UCBVSelectionPolicy,
+}
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+from engine.monte_carlo_node import MonteCarloNode
+from games.game_components.base_game_object import BaseGameObject
+
+
+class StateCache:
+    """Game state snapshots kept on tree nodes, so selection can restore the deepest
+    cached node of its path instead of replaying every move from the search root.
+
+    Nodes every interval plies are cached as selection passes them. At most max_states
+    snapshots are held; past that the least recently used one is dropped. Snapshots
+    live on the nodes themselves (MonteCarloNode.state_snapshot), so a node reset for
+    reuse by the NodePool never carries another position's state.
+    """
+
+    def __init__(self, max_states: int, interval: int = 4):
+        """
+        Args:
+            max_states (int): most snapshots held at once.
+            interval (int, optional): plies between cached nodes. Defaults to 4.
+        """
+        if max_states < 1 or interval < 1:
+            raise ValueError("max_states and interval must be at least 1")
+        self.max_states = max_states
+        self.interval = interval
+        self.cached_nodes: OrderedDict[MonteCarloNode, None] = OrderedDict()
+        self.hits = 0
+
+    def get(self, node: MonteCarloNode):
+        """The node's snapshot, or None if it has none"""
+        snapshot = node.state_snapshot
+        if snapshot is not None:
+            self.cached_nodes.move_to_end(node)
+            self.hits += 1
+        return snapshot
+
+    def offer(self, node: MonteCarloNode, game: BaseGameObject):
+        """Caches the game's current state, the state at node, if the node is on the interval"""
+        if node.depth % self.interval != 0 or node.state_snapshot is not None:
+            return
+        node.state_snapshot = game.get_state_snapshot()
+        self.cached_nodes[node] = None
+        self.cached_nodes.move_to_end(node)
+        if len(self.cached_nodes) > self.max_states:
+            evicted, _ = self.cached_nodes.popitem(last=False)
+            evicted.state_snapshot = None
+
+    def forget_released(self):
+        """Drops the nodes whose snapshot was taken away by NodePool.release_subtree"""
+        for node in [node for node in self.cached_nodes if node.state_snapshot is None]:
+            del self.cached_nodes[node]
+
+    def clear(self):
+        for node in self.cached_nodes:
+            node.state_snapshot = None
+        self.cached_nodes.clear()
@@ -1,8 +1,13 @@
 from typing import ClassVar
-from games.game_components.action import GameAction
+from games.game_components.action import InternedGameAction
 import numpy as np
 
-class AzulAction(GameAction):
+class AzulAction(InternedGameAction):
+    """Azul action.  Azul actions are counts over 53 slots and can't be enumerated
+    up front, so each distinct action is interned and given an id when first seen.
+    MAX_ACTION_IDS leaves room over the distinct take, place, bonus and reserve
+    actions a game can offer."""
+
     PHASE_1_START: ClassVar[int] = 0
     PHASE_1_END: ClassVar[int] = 16
 
@@ -27,6 +32,7 @@ class AzulAction(GameAction):
     RESERVE_TILE_START: ClassVar[int] = 47
     RESERVE_TILE_END: ClassVar[int] = 53
     ACTION_SPACE_SIZE: ClassVar[int] = 53
+    MAX_ACTION_IDS: ClassVar[int] = 4096
 
     def __new__(cls):
         return np.zeros(cls.ACTION_SPACE_SIZE, dtype=int).view(cls)
@@ -16,8 +16,9 @@ from .tile_container import (
 from .action import AzulAction
 from pydantic import BaseModel, Field
 from typing import ClassVar, Union
+import numpy as np
 from .player import AzulPlayer
-from random import choice
+from games.game_components.random_service import get_random_service
 
 
 class AzulGame(BaseModel):
@@ -28,6 +29,10 @@ class AzulGame(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    action_type: ClassVar[type[AzulAction]] = AzulAction
+    # Bag draws refill the supply and the factory displays
+    deterministic: ClassVar[bool] = False
+
     player_count: int
     # Players are index by integers starting at 0
     players: dict[int, AzulPlayer] = None
@@ -47,6 +52,8 @@ class AzulGame(BaseModel):
     first_player_num: int = None
     current_player_num: int = 0
     training: bool = False
+    # Whether the last action drew tiles from the bag
+    drew_tiles: bool = False
 
     tiles_per_factory: ClassVar[int] = 4
     tiles_per_color: ClassVar[int] = 22
@@ -96,13 +103,13 @@ class AzulGame(BaseModel):
             }
         # Sets the first player
         if self.first_player_num is None:
-            self.first_player_num = choice(list(self.players.keys()))
+            self.first_player_num = get_random_service().choice(list(self.players.keys()))
 
     def draw_board(self):
         # Not implemented yet.
         pass
 
-    def get_available_actions(self, special_policy: bool = False) -> list[AzulAction]:
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
         """Actions available to the current player.
         This will depend on the phase of the game (tile taking or tile placement)
 
@@ -110,16 +117,16 @@ class AzulGame(BaseModel):
             special_policy (bool, optional):  Not used. Defaults to False.
 
         Returns:
-            list[AzulAction]: List of numpy arrays representing actions.
+            np.ndarray: Interned AzulAction ids of the available actions.
         """
         if self.phase == 1:
-            actions = self.factory.get_available_actions()
+            actions = self.factory.get_available_actions(self.wild_color)
         if self.phase == 2:
             if self.current_player.bonus_owed > 0:
                 actions = self.supply.get_available_actions(self.current_player.bonus_owed)
             else:
                 actions = self.current_player.get_available_actions(self.wild_color)
-        return actions
+        return np.array([AzulAction.intern(action) for action in actions], dtype=int)
 
     def _play_phase_one_action(self, action: AzulAction):
         """Plays a phase one action.  This includes taking tiles from a factory display
@@ -164,10 +171,12 @@ class AzulGame(BaseModel):
             self.current_player_num = self.first_player_num
             self.start_round()
 
-    def update_game_with_action(self, action: AzulAction, player: int):
-        """Plays the action.  The action is assumed to be valid.
+    def update_game_with_action(self, action: int, player: int):
+        """Plays the action id.  The action is assumed to be valid.
         Note the player number is not necessary, since to be valid
         the action must be available to the current player."""
+        action = AzulAction.from_id(action)
+        self.drew_tiles = False
         if self.phase == 1:
             self._play_phase_one_action(action)
         elif self.phase == 2:
@@ -179,6 +188,7 @@ class AzulGame(BaseModel):
         in phase two."""
 
         supply_count = self.supply.total()
+        self.drew_tiles = True
         self.supply.fill_supply(
             self.bag.randomly_choose_tiles(
                 AzulGame.supply_max - supply_count, self.tower
@@ -189,6 +199,7 @@ class AzulGame(BaseModel):
         self.wild_color = AzulGame.wild_list[self.current_round]
 
     def _fill_all_factory_displays(self):
+        self.drew_tiles = True
         for display in self.factory.factory_displays.values():
             display += self.bag.randomly_choose_tiles(
                 AzulGame.tiles_per_factory, self.tower
@@ -218,5 +229,23 @@ class AzulGame(BaseModel):
         for player in self.players.values():
             player.start_round_for_player()
 
+    def get_chance_outcome_key(self) -> tuple:
+        """Contents of the supply and factory displays, when the last action drew tiles."""
+        if not self.drew_tiles:
+            return None
+        colors = list(MASTER_TILE_CONTAINER.keys())
+        return (
+            tuple(self.supply[color] for color in colors),
+            tuple(tuple(display[color] for color in colors) for display in self.factory.factory_displays.values()),
+        )
+
     def is_game_over(self) -> bool:
         return self.game_over
+
+    def evaluate(self) -> dict[int, float]:
+        """Estimated final scores: each player's current score plus the star completion
+        and multistar bonus points projected from their player board."""
+        return {
+            player_num: player.player_score + player.player_board.projected_points()
+            for player_num, player in self.players.items()
+        }
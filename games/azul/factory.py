@@ -83,10 +83,10 @@ class Factory(BaseModel):
         """
         actions = []
         for display in self.factory_displays.values():
-            actions.append(
+            actions.extend(
                 display.get_available_actions(wild_color)
             )
-        actions.append(
+        actions.extend(
             self.center.get_available_actions(wild_color))
         return actions
 
@@ -74,8 +74,8 @@ class AzulPlayer(BasePlayer):
             _type_: _description_
         """
         actions = []
-        actions.append(self._get_placement_actions(wild_color))
-        actions.append(self._get_reserve_actions())
+        actions.extend(self._get_placement_actions(wild_color))
+        actions.extend(self._get_reserve_actions())
         return actions
 
     def start_round_for_player(self):
@@ -422,6 +422,27 @@ class PlayerBoard(BaseModel):
 
         return bonus_reward
 
+    def projected_points(self) -> float:
+        """Estimates the points still to come from the tiles already on the board.
+        Each star not yet completed is credited with its completion points in proportion
+        to its filled positions, and each multistar bonus (positions 1-4) in proportion
+        to the stars already holding a tile at that position.
+
+        Returns:
+            float: Projected points
+        """
+        points = 0.0
+        for star in self.stars.values():
+            if star.star_full_points_received:
+                continue
+            filled = sum(star.filled_positions.values())
+            points += Star.STAR_POINTS[star.color] * filled / Star.STAR_SIZE
+        for position in range(1, 5):
+            stars_filled = sum(star.filled_positions[position] for star in self.stars.values())
+            if stars_filled < len(self.stars):
+                points += position * PlayerBoard.FILL_ALL_POS_BONUS * stars_filled / len(self.stars)
+        return points
+
     def check_multistar_bonus(self, tile_placed_position: int) -> int:
         """This checks if a point bonus is received for placing all tiles of a particular
         number.  If every star on the board has a tile placed at the given position (given
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from collections import Counter
-from random import sample
+from games.game_components.random_service import get_random_service
 from games.azul.action import AzulAction
 from itertools import combinations
 
@@ -45,7 +45,7 @@ class TileContainer(Counter):
             raise ValueError(
                 f"Cannot choose {number_to_choose} from only {self.total()} tiles."
             )
-        chosen_tiles = TileContainer(sample(list(self.elements()), number_to_choose))
+        chosen_tiles = TileContainer(get_random_service().sample(list(self.elements()), number_to_choose))
         self.subtract(chosen_tiles)
         return chosen_tiles
 
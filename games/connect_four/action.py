@@ -0,0 +1,12 @@
+from games.game_components.action import GameAction
+from typing import ClassVar
+
+
+class ConnectFourAction(GameAction):
+    """Connect four action.  One slot per column to drop a piece into."""
+
+    ACTION_SPACE_SIZE: ClassVar[int] = 7
+
+    @property
+    def column(self) -> int:
+        return int(self.argmax())
@@ -0,0 +1,296 @@
+from typing import Any, ClassVar
+
+import numpy as np
+from pydantic import Field
+
+from games.game_components.base_game_object import BaseGameObject
+from games.game_components.live_lines import LiveLines, lines_through_cells
+from .action import ConnectFourAction
+from .player import ConnectFourPlayer
+
+
+def _win_conditions_by_position(win_conditions: dict[str, list[int]], num_positions: int) -> dict[int, list[list[int]]]:
+    return {
+        position: [condition for condition in win_conditions.values() if position in condition]
+        for position in range(num_positions)
+    }
+
+
+class ConnectFour(BaseGameObject):
+    """Basic game of connect four."""
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    action_type: ClassVar[type[ConnectFourAction]] = ConnectFourAction
+    win_score: ClassVar[int] = 1
+    empty_space: ClassVar[int] = -1
+    num_columns: ClassVar[int] = 7
+    num_positions: ClassVar[int] = 42
+    player_marks: ClassVar[dict[int, str]] = {0: "X", 1: "O"}
+    win_conditions: ClassVar[dict[str, list[int]]] = {
+        "00row": [0, 1, 2, 3],
+        "01row": [1, 2, 3, 4],
+        "02row": [2, 3, 4, 5],
+        "03row": [3, 4, 5, 6],
+        "10row": [7, 8, 9, 10],
+        "11row": [8, 9, 10, 11],
+        "12row": [9, 10, 11, 12],
+        "13row": [10, 11, 12, 13],
+        "20row": [14, 15, 16, 17],
+        "21row": [15, 16, 17, 18],
+        "22row": [16, 17, 18, 19],
+        "23row": [17, 18, 19, 20],
+        "30row": [21, 22, 23, 24],
+        "31row": [22, 23, 24, 25],
+        "32row": [23, 24, 25, 26],
+        "33row": [24, 25, 26, 27],
+        "40row": [28, 29, 30, 31],
+        "41row": [29, 30, 31, 32],
+        "42row": [30, 31, 32, 33],
+        "43row": [31, 32, 33, 34],
+        "50row": [35, 36, 37, 38],
+        "51row": [36, 37, 38, 39],
+        "52row": [37, 38, 39, 40],
+        "53row": [38, 39, 40, 41],
+        "00col": [0, 7, 14, 21],
+        "10col": [7, 14, 21, 28],
+        "20col": [14, 21, 28, 35],
+        "01col": [1, 8, 15, 22],
+        "11col": [8, 15, 22, 29],
+        "21col": [15, 22, 29, 36],
+        "02col": [2, 9, 16, 23],
+        "12col": [9, 16, 23, 30],
+        "22col": [16, 23, 30, 37],
+        "03col": [3, 10, 17, 24],
+        "13col": [10, 17, 24, 31],
+        "23col": [17, 24, 31, 38],
+        "04col": [4, 11, 18, 25],
+        "14col": [11, 18, 25, 32],
+        "24col": [18, 25, 32, 39],
+        "05col": [5, 12, 19, 26],
+        "15col": [12, 19, 26, 33],
+        "25col": [19, 26, 33, 40],
+        "06col": [6, 13, 20, 27],
+        "16col": [13, 20, 27, 34],
+        "26col": [20, 27, 34, 41],
+        "00diag": [0, 8, 16, 24],
+        "10diag": [7, 15, 23, 31],
+        "20diag": [14, 22, 30, 38],
+        "30diag": [21, 15, 9, 3],
+        "40diag": [28, 22, 16, 10],
+        "50diag": [35, 29, 23, 17],
+        "01diag": [1, 9, 17, 25],
+        "11diag": [8, 16, 24, 32],
+        "21diag": [15, 23, 31, 39],
+        "31diag": [22, 16, 10, 4],
+        "41diag": [29, 23, 17, 11],
+        "51diag": [36, 30, 24, 18],
+        "02diag": [2, 10, 18, 26],
+        "12diag": [9, 17, 25, 33],
+        "22diag": [16, 24, 32, 40],
+        "32diag": [23, 17, 11, 5],
+        "42diag": [30, 24, 18, 12],
+        "52diag": [37, 31, 25, 19],
+        "03diag": [3, 11, 19, 27],
+        "13diag": [10, 18, 26, 34],
+        "23diag": [17, 25, 33, 41],
+        "33diag": [24, 18, 12, 6],
+        "43diag": [31, 25, 19, 13],
+        "53diag": [38, 32, 26, 20],
+    }
+    win_lines: ClassVar[tuple[tuple[int, ...], ...]] = tuple(tuple(condition) for condition in win_conditions.values())
+    # Win conditions through each position, so a move only checks its own lines
+    win_conditions_by_position: ClassVar[dict[int, list[list[int]]]] = _win_conditions_by_position(
+        win_conditions, num_positions
+    )
+    win_line_ids_by_position: ClassVar[tuple[tuple[int, ...], ...]] = lines_through_cells(
+        win_conditions.values(), num_positions
+    )
+
+    player_count: int = 2
+    positions: list[int] = Field(default_factory=lambda: [ConnectFour.empty_space] * ConnectFour.num_positions)
+    players: dict[int, ConnectFourPlayer] = None
+    current_player_num: int = 0
+    # Legal action mask, kept up to date as columns fill
+    open_columns: np.ndarray = None
+    moves_remaining: int = num_positions
+    # Win lines each player can still complete, to call a draw early
+    live_lines: LiveLines = None
+    save_game: tuple = None
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.players is None:
+            self.players = {
+                player_num: ConnectFourPlayer(player_number=player_num, mark=self.player_marks[player_num])
+                for player_num in range(self.player_count)
+            }
+        if self.open_columns is None:
+            self.open_columns = np.array(self.positions[: self.num_columns]) == self.empty_space
+        if self.live_lines is None:
+            self.live_lines = LiveLines(
+                player_count=self.player_count, line_count=len(self.win_conditions), line_length=4
+            )
+            for position, player_num in enumerate(self.positions):
+                if player_num != self.empty_space:
+                    self.live_lines.place(player_num, self.win_line_ids_by_position[position])
+        if self.save_game is None:
+            self.save_game_state()
+
+    def get_current_player(self) -> int:
+        return self.current_player_num
+
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
+        """Checks which of the columns can have a piece added.
+
+        With special_policy, returns only the columns that win for the current player if
+        any, otherwise the columns that block the next player's win, if any.
+
+        Returns:
+            np.ndarray: action ids, which are the open columns
+        """
+        legal_actions = [column for column in range(self.num_columns) if self.positions[column] == self.empty_space]
+
+        if special_policy:
+            special_policy_actions = self.get_winning_actions(self.current_player_num)
+            if len(special_policy_actions) == 0:
+                next_player = (self.current_player_num + 1) % self.player_count
+                special_policy_actions = self.get_winning_actions(next_player)
+            if len(special_policy_actions) > 0:
+                return special_policy_actions
+
+        return np.array(legal_actions, dtype=int)
+
+    def legal_action_mask(self) -> np.ndarray:
+        return self.open_columns
+
+    def get_winning_actions(self, player_num: int) -> np.ndarray:
+        """Columns whose next piece completes a line for the player, read from the threat table."""
+        columns = set()
+        for line_id in self.live_lines.threats[player_num]:
+            for position in self.win_lines[line_id]:
+                below = position + self.num_columns
+                if self.positions[position] == self.empty_space and (
+                    below >= self.num_positions or self.positions[below] != self.empty_space
+                ):
+                    columns.add(position % self.num_columns)
+        return np.array(sorted(columns), dtype=int)
+
+    def update_game_with_action(self, action: int, player: int = None):
+        """Processes selected action
+
+        Args:
+            action (int): action id, which is the column to drop a piece into.  Ranges 0-6.
+        """
+        self.make_move(action, self.current_player_num)
+
+    def is_game_over(self):
+        return self.game_over
+
+    def check_game_over(self, position: int):
+        """Tests the four types of wins (row, column, and both diagonals) through the
+        position just played, and tests for a draw, either a full board or no line left
+        that any player can complete.  Sets game_over and the player scores when the
+        game ends.
+
+        Args:
+            position (int): board position of the last piece played
+        """
+        player_num = self.positions[position]
+        for win_condition in self.win_conditions_by_position[position]:
+            if all(self.positions[num] == player_num for num in win_condition):
+                for player in self.players.values():
+                    player.player_score = -1
+                self.players[player_num].player_score = 1
+                self.game_over = True
+                return
+
+        if self.moves_remaining == 0 or not self.live_lines.any_live():
+            for player in self.players.values():
+                player.player_score = 0
+            self.game_over = True
+
+    @property
+    def scores(self) -> dict[int, int]:
+        return {player_num: player.player_score for player_num, player in self.players.items()}
+
+    def get_game_scores(self) -> dict[int, int]:
+        return self.scores
+
+    def evaluate(self) -> dict[int, float]:
+        """Estimated scores from the lines each player still holds alone."""
+        if self.game_over:
+            return self.scores
+        return self.live_lines.estimate_scores()
+
+    def get_remaining_moves(self) -> int:
+        return self.moves_remaining
+
+    def get_state_hash(self) -> tuple:
+        return (tuple(self.positions), self.current_player_num)
+
+    def encode_state(self) -> np.ndarray:
+        """One occupancy plane per player, then the player to move one-hot."""
+        player_nums = np.arange(self.player_count)
+        planes = np.array(self.positions) == player_nums[:, None]
+        return np.concatenate((planes.ravel(), player_nums == self.current_player_num)).astype(np.float32)
+
+    def draw_board(self):
+        marks = [self.player_marks.get(position, " ") for position in self.positions]
+        board_rows = ["|".join(marks[i : i + self.num_columns]) for i in range(0, self.num_positions, self.num_columns)]
+        board = "\n_____________\n".join(board_rows)
+        print(board)
+
+    def play_game(self):
+        while not self.is_game_over():
+            pos = int(input("Select a move.  "))
+            self.make_move(pos, self.current_player_num)
+            self.draw_board()
+
+        for player_num, score in self.scores.items():
+            print(f"{self.player_marks[player_num]}:  {score}")
+
+        return self.scores
+
+    def save_game_state(self):
+        self.save_game = (
+            tuple(self.positions),
+            self.open_columns.copy(),
+            self.live_lines.save(),
+            tuple(player.player_score for player in self.players.values()),
+            self.current_player_num,
+            self.moves_remaining,
+            self.game_over,
+        )
+
+    def load_save_game_state(self):
+        positions, open_columns, live_lines, scores, *counters = self.save_game
+        self.current_player_num, self.moves_remaining, self.game_over = counters
+        self.positions = list(positions)
+        np.copyto(self.open_columns, open_columns)
+        self.live_lines.load(live_lines)
+        for player, score in zip(self.players.values(), scores):
+            player.player_score = score
+
+    def get_condition_state(self, win_condition):
+        return [self.positions[num] for num in win_condition]
+
+    def make_move(self, pos: int, current_player: int):
+        """Makes a move on the board and draws it"""
+        max_position = self.num_positions - (self.num_columns - pos)
+
+        while self.positions[max_position] != self.empty_space:
+            max_position -= self.num_columns
+
+        self.positions[max_position] = current_player
+        if max_position < self.num_columns:
+            self.open_columns[pos] = False
+        self.live_lines.place(current_player, self.win_line_ids_by_position[max_position])
+        self.moves_remaining -= 1
+        self.check_game_over(max_position)
+
+        self.current_player_num = (self.current_player_num + 1) % self.player_count
+
+
+if __name__ == "__main__":
+    game = ConnectFour(player_count=2)
+    game.play_game()
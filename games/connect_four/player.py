@@ -0,0 +1,5 @@
+from games.game_components.player import Player
+
+
+class ConnectFourPlayer(Player):
+    mark: str = None
@@ -1,5 +1,102 @@
+from __future__ import annotations
+import numpy as np
 from numpy import ndarray
 from typing import ClassVar
 
+
 class GameAction(ndarray):
-    ACTION_SPACE_SIZE: ClassVar[int]
\ No newline at end of file
+    """Decoded form of a game action.
+
+    Games pass actions to and from the engine as integer ids.  Each action class keeps
+    one read-only action table, holding the decoded array for every id, so decoding an
+    id never allocates.  By default action id i is the one-hot array with slot i set,
+    and ACTION_SPACE_SIZE is both the array width and the number of ids.  Arrays
+    indexed by action id (legal masks, priors, child rows) are id_count() wide.
+    """
+
+    ACTION_SPACE_SIZE: ClassVar[int]
+
+    @classmethod
+    def build_action_table(cls) -> ndarray:
+        """Decoded arrays for every action id, one row per id."""
+        return np.eye(cls.ACTION_SPACE_SIZE, dtype=np.int8)
+
+    @classmethod
+    def action_table(cls) -> GameAction:
+        """The read-only action table for this action class, built on first use."""
+        table = cls.__dict__.get("_action_table")
+        if table is None:
+            table = cls.build_action_table().view(cls)
+            table.flags.writeable = False
+            cls._action_table = table
+        return table
+
+    @classmethod
+    def id_count(cls) -> int:
+        """Exclusive upper bound of the action ids."""
+        return cls.ACTION_SPACE_SIZE
+
+    @classmethod
+    def from_id(cls, action_id: int) -> GameAction:
+        return cls.action_table()[action_id]
+
+    @classmethod
+    def to_id(cls, action: ndarray) -> int:
+        return int(action.argmax())
+
+
+class InternedGameAction(GameAction):
+    """Action class for games whose actions can't be enumerated up front.
+
+    Actions are assigned ids the first time they are seen, and the same decoded
+    array is shared by every later occurrence of that action.  An id is only the
+    order in which this process first saw its action, so ids mean nothing outside
+    the process, and ACTION_SPACE_SIZE is the array width, not the number of ids.
+    Subclasses set MAX_ACTION_IDS, a fixed bound on the distinct actions interned;
+    it is the id_count() of the class, and interning past it raises ValueError.
+    """
+
+    MAX_ACTION_IDS: ClassVar[int]
+
+    @classmethod
+    def _registry(cls) -> tuple[dict[bytes, int], list[InternedGameAction]]:
+        registry = cls.__dict__.get("_interned")
+        if registry is None:
+            registry = ({}, [])
+            cls._interned = registry
+        return registry
+
+    @classmethod
+    def intern(cls, action: ndarray) -> int:
+        ids, actions = cls._registry()
+        key = action.tobytes()
+        action_id = ids.get(key)
+        if action_id is None:
+            action_id = len(actions)
+            if action_id >= cls.MAX_ACTION_IDS:
+                raise ValueError(f"{cls.__name__} cannot intern more than {cls.MAX_ACTION_IDS} distinct actions")
+            interned_action = np.array(action).view(cls)
+            interned_action.flags.writeable = False
+            ids[key] = action_id
+            actions.append(interned_action)
+        return action_id
+
+    @classmethod
+    def action_table(cls) -> InternedGameAction:
+        """Read-only stack of every action interned so far."""
+        _, actions = cls._registry()
+        table = np.stack(actions).view(cls) if actions else np.zeros((0, cls.ACTION_SPACE_SIZE), dtype=int).view(cls)
+        table.flags.writeable = False
+        return table
+
+    @classmethod
+    def id_count(cls) -> int:
+        return cls.MAX_ACTION_IDS
+
+    @classmethod
+    def from_id(cls, action_id: int) -> InternedGameAction:
+        return cls._registry()[1][action_id]
+
+    @classmethod
+    def to_id(cls, action: ndarray) -> int:
+        return cls.intern(action)
@@ -1,10 +1,24 @@
 from abc import ABC, abstractmethod
+import numpy as np
+from typing import ClassVar
+from .action import GameAction
 from .player import Player as BasePlayer
 from pydantic import BaseModel
 
 
 class BaseGameObject(BaseModel):
 
+    # Action class used to decode the game's integer action ids
+    action_type: ClassVar[type[GameAction]] = None
+    # Rollouts the engine runs from each selected leaf, unless the search overrides it
+    rollouts_per_leaf: ClassVar[int] = 1
+    # False when moves have random results (dice, tile draws); the engine only proves
+    # game values of deterministic games
+    deterministic: ClassVar[bool] = True
+    # Score of a won game, the most a player can get. Lets the solver prove a position
+    # won as soon as one move wins it. None if the game has no such score
+    win_score: ClassVar[float] = None
+
     player_count: int
     players: dict[int, BasePlayer] = None
     game_over: bool = False
@@ -32,33 +46,159 @@ class BaseGameObject(BaseModel):
         pass
 
     @abstractmethod
-    def get_available_actions(self, special_policy: bool = False) -> list:
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
         """
         Hook #1
         Get currently available actions to take an action from the list
 
-        Format [list of legal actions]
+        Format: array of legal integer action ids
 
-        The engine does not care about the contents of the list of legal actions, and will return
-        a list item in exactly the same format it is passed. The game logic must manage the correct player turns. The Monte Carlo engine will assign the
+        Action ids index the game's action_type table (see GameAction), which holds the
+        decoded action for each id. The engine will return an id in exactly the same format
+        it is passed. The game logic must manage the correct player turns. The Monte Carlo engine will assign the
         next legal action to the player passed, with no safety checks.
         """
         pass
 
+    def legal_action_mask(self) -> np.ndarray:
+        """
+        Optional Hook
+        Boolean mask over the action ids (action_type.id_count() wide),
+        True for the currently legal actions.
+
+        Games that keep this mask up to date as moves are applied let the engine
+        expand nodes and sample rollout moves without building a list of actions.
+        The engine only reads the mask, so the game may return its own array.
+        Returns None if the game does not keep a mask; the engine then uses
+        get_available_actions.
+        """
+        return None
+
+    def get_legal_actions(self) -> np.ndarray:
+        """Legal action ids, read from legal_action_mask when the game keeps one, else
+        get_available_actions. The engine and its endgame solver both list moves here,
+        so they always agree on what can be played."""
+        legal_mask = self.legal_action_mask()
+        if legal_mask is None:
+            return self.get_available_actions(special_policy=False)
+        return np.flatnonzero(legal_mask)
+
+    def get_winning_actions(self, player_num: int) -> np.ndarray:
+        """
+        Optional Hook
+        Legal action ids that would immediately win the game for the given player,
+        if it were that player's turn.
+
+        Used by the win/block rollout policy (see engine/rollout_policies.py), which
+        plays a winning move when there is one and otherwise blocks an opponent's.
+        Games should answer from tables kept up to date as moves are applied, as the
+        policy asks at every rollout ply.  Returns None if the game does not support it.
+        """
+        return None
+
+    def evaluate(self) -> dict:
+        """
+        Optional Hook
+        Estimates the final scores from the current, unfinished position.
+
+        Used when the engine truncates rollouts (max_rollout_depth): the estimate
+        replaces playing the rest of the game, so it must be on the same scale as
+        get_game_scores, in the format {playerID: Score}.
+        Returns None if the game has no estimate; rollouts are then played out.
+        """
+        return None
+
+    def get_action_priors(self) -> np.ndarray:
+        """
+        Optional Hook
+        Prior weights in [0, 1] over the action ids (action_type.id_count() wide)
+        for the player to move, higher for moves that look good.
+
+        Read when the engine expands a node with a progressive_bias: selection then adds
+        progressive_bias * prior / (visits + 1) to each child, so favoured moves are
+        tried first and the bias fades as real results come in.
+        By default, winning actions (get_winning_actions) weigh 1 and actions that block
+        another player's win weigh 0.5; games without that hook get 1 for the actions of
+        get_available_actions(special_policy=True). Returns None if there is no preference.
+        """
+        if self.action_type is None:
+            return None
+        legal_actions = self.get_available_actions(special_policy=False)
+        priors = np.zeros(self.action_type.id_count())
+        player_num = self.get_current_player()
+        winning_actions = self.get_winning_actions(player_num)
+        if winning_actions is None:
+            preferred_actions = self.get_available_actions(special_policy=True)
+            if len(preferred_actions) == len(legal_actions):
+                return None
+            priors[preferred_actions] = 1
+            return priors
+        for offset in range(1, self.player_count):
+            threats = self.get_winning_actions((player_num + offset) % self.player_count)
+            priors[threats[np.isin(threats, legal_actions)]] = 0.5
+        priors[winning_actions] = 1
+        return priors
+
+    def get_chance_outcome_key(self):
+        """
+        Optional Hook
+        Hashable key of the random outcome of the move just played (dice rolled, tiles
+        drawn), or None if that move had no random result.
+
+        Games that are not deterministic use it to give the engine chance nodes: a move
+        with a random outcome leads to one child per outcome key, each replayed from its
+        own seed (see MonteCarloEngine max_chance_outcomes), so statistics under a child
+        do not mix different draws. Outcomes that play the same should share a key.
+        """
+        return None
+
+    def get_remaining_moves(self) -> int:
+        """
+        Optional Hook
+        Most moves left before the game ends, counting every player's moves.
+
+        The engine hands positions with few moves left to its exact endgame solver
+        (engine/endgame_solver.py) instead of searching them with rollouts.
+        Returns None if the game cannot bound it.
+        """
+        return None
+
+    def get_state_hash(self) -> tuple:
+        """
+        Optional Hook
+        Hashable key of the current position, player to move included, equal for
+        positions reached by different move orders. Return the key itself, not its
+        hash(): keys are compared in full, so two positions never share an entry.
+
+        Lets the endgame solver remember positions it has already solved.
+        Returns None if the game has no key; transpositions are then solved again.
+        """
+        return None
+
+    def encode_state(self) -> np.ndarray:
+        """
+        Optional Hook
+        Fixed length feature vector of the current position, player to move included.
+
+        Used when the engine scores leaves with a leaf evaluator instead of rollouts:
+        the vectors of a batch of leaves are stacked into one array for the evaluator.
+        Returns None if the game has no encoding.
+        """
+        return None
+
     @abstractmethod
-    def update_game_with_action(self, action: str, player: int) -> None:
+    def update_game_with_action(self, action: int, player: int) -> None:
         """
         Hook #2
         Sends action choice and player to game
 
-        After selecting an item from the list of legal actions (see Hook #1),
-        Sends the item back to the game logic. Item is sent back in exactly
-        the same format as received in the list of legal actions.
+        After selecting an action id from the legal actions (see Hook #1),
+        Sends the id back to the game logic.
 
         Also sends active player ID for action
 
         Args:
-            action (list item): selected item from list of legal actions
+            action (int): selected action id from the legal actions
             player (int): player number
         """
         pass
@@ -107,4 +247,25 @@ class BaseGameObject(BaseModel):
         load the saved game state.
         Be sure to use DEEP COPIES on load, as efficiently as possible
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_state_snapshot(self):
+        """
+        Saves the current state with Hook #5 and returns it, leaving the save_game slot
+        as it was. Lets the engine hold states other than the search root.
+        """
+        saved = self.save_game
+        self.save_game_state()
+        snapshot = self.save_game
+        self.save_game = saved
+        return snapshot
+
+    def restore_state_snapshot(self, snapshot) -> None:
+        """
+        Loads a state returned by get_state_snapshot with Hook #6, leaving the save_game
+        slot as it was. The snapshot is not consumed and can be restored again.
+        """
+        saved = self.save_game
+        self.save_game = snapshot
+        self.load_save_game_state()
+        self.save_game = saved
\ No newline at end of file
@@ -0,0 +1,108 @@
+from typing import Any, ClassVar, Iterable
+
+from pydantic import BaseModel
+
+
+def lines_through_cells(lines: Iterable[Iterable[int]], num_cells: int) -> tuple[tuple[int, ...], ...]:
+    """Indices of the lines passing through each cell, indexed by cell."""
+    lines = [set(line) for line in lines]
+    return tuple(tuple(line_id for line_id, line in enumerate(lines) if cell in line) for cell in range(num_cells))
+
+
+class LiveLines(BaseModel):
+    """Per player counts of the win lines each player can still complete.
+
+    A line is live for a player while no opponent has a piece on it.  Each line
+    records which single player holds pieces on it (if any), so placing a piece only
+    touches the lines through that cell.  Once no player has a live line, no one can
+    win and the game is a certain draw.
+
+    It also keeps a threat table: for each player, the live lines that are one piece
+    short of complete, so a rollout policy can find winning and blocking moves
+    without scanning the board.
+    """
+
+    unclaimed: ClassVar[int] = -1
+    blocked: ClassVar[int] = -2
+
+    player_count: int
+    line_count: int
+    line_length: int
+    # Owner of each line: unclaimed, the only player with pieces on it, or blocked
+    line_owners: list[int] = None
+    live_counts: list[int] = None
+    # Number of the owner's pieces on each line
+    line_pieces: list[int] = None
+    # Lines each player owns with one piece missing
+    threats: list[set[int]] = None
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.line_owners is None:
+            self.line_owners = [LiveLines.unclaimed] * self.line_count
+        if self.live_counts is None:
+            self.live_counts = [self.line_count] * self.player_count
+        if self.line_pieces is None:
+            self.line_pieces = [0] * self.line_count
+        if self.threats is None:
+            self.threats = [set() for _ in range(self.player_count)]
+
+    def place(self, player_num: int, line_ids: Iterable[int]) -> None:
+        """Records a piece of player_num on a cell crossed by the given lines."""
+        line_owners = self.line_owners
+        line_pieces = self.line_pieces
+        live_counts = self.live_counts
+        for line_id in line_ids:
+            owner = line_owners[line_id]
+            if owner == LiveLines.unclaimed:
+                line_owners[line_id] = player_num
+                line_pieces[line_id] = 1
+                for other_num in range(self.player_count):
+                    if other_num != player_num:
+                        live_counts[other_num] -= 1
+                if self.line_length == 2:
+                    self.threats[player_num].add(line_id)
+            elif owner == player_num:
+                line_pieces[line_id] += 1
+                if line_pieces[line_id] == self.line_length - 1:
+                    self.threats[player_num].add(line_id)
+                else:
+                    self.threats[player_num].discard(line_id)
+            elif owner != LiveLines.blocked:
+                line_owners[line_id] = LiveLines.blocked
+                live_counts[owner] -= 1
+                self.threats[owner].discard(line_id)
+
+    def any_live(self) -> bool:
+        return any(self.live_counts)
+
+    def estimate_scores(self) -> dict[int, float]:
+        """Static estimate of win (1) / loss (-1) scores for an unfinished game.
+
+        Each player's strength is the sum of squared piece counts over the lines it
+        holds alone, so lines close to complete dominate.  A player scores its margin
+        over the strongest opponent, scaled into (-1, 1).
+        """
+        strengths = [0] * self.player_count
+        for owner, pieces in zip(self.line_owners, self.line_pieces):
+            if owner >= 0:
+                strengths[owner] += pieces * pieces
+        scores = {}
+        for player_num, strength in enumerate(strengths):
+            best_other = max(other for other_num, other in enumerate(strengths) if other_num != player_num)
+            scores[player_num] = (strength - best_other) / (strength + best_other + 1)
+        return scores
+
+    def save(self) -> tuple:
+        return (
+            tuple(self.line_owners),
+            tuple(self.live_counts),
+            tuple(self.line_pieces),
+            tuple(frozenset(threats) for threats in self.threats),
+        )
+
+    def load(self, saved: tuple) -> None:
+        line_owners, live_counts, line_pieces, threats = saved
+        self.line_owners[:] = line_owners
+        self.live_counts[:] = live_counts
+        self.line_pieces[:] = line_pieces
+        self.threats = [set(player_threats) for player_threats in threats]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class RandomService:
+    """Random numbers for the engine and the games, from one numpy Generator.
+
+    Scalar draws are served from a pre-drawn buffer of uniform floats, so picking a
+    rollout move costs a list lookup instead of a numpy call.  Services for worker
+    processes are derived with spawn, which splits the SeedSequence, so a run seeded
+    once is reproducible however its work is spread across processes.
+    """
+
+    def __init__(self, seed: int | np.random.SeedSequence = None, buffer_size: int = 65536):
+        """
+        Args:
+            seed (int | SeedSequence, optional): seed for the generator. Defaults to None, fresh entropy.
+            buffer_size (int, optional): uniform floats drawn per buffer refill. Defaults to 65536.
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.generator = np.random.default_rng(self.seed_sequence)
+        self.buffer_size = buffer_size
+        self._buffer: list[float] = []
+        self._position = 0
+
+    def _refill(self):
+        self._buffer = self.generator.random(self.buffer_size).tolist()
+        self._position = 0
+
+    def random(self) -> float:
+        """A uniform float in [0, 1)"""
+        if self._position == len(self._buffer):
+            self._refill()
+        value = self._buffer[self._position]
+        self._position += 1
+        return value
+
+    def index(self, count: int) -> int:
+        """A uniform integer in [0, count)"""
+        return int(self.random() * count)
+
+    def choice(self, items: Sequence[T]) -> T:
+        return items[self.index(len(items))]
+
+    def sample(self, population: Sequence[T], count: int) -> list[T]:
+        """count distinct items of the population, in random order (partial Fisher-Yates)"""
+        if count > len(population):
+            raise ValueError(f"Cannot sample {count} from only {len(population)} items.")
+        pool = list(population)
+        for position in range(count):
+            swap = position + self.index(len(pool) - position)
+            pool[position], pool[swap] = pool[swap], pool[position]
+        return pool[:count]
+
+    def spawn(self, count: int) -> list[RandomService]:
+        """Independent child services, one per worker"""
+        return [RandomService(seed_sequence, self.buffer_size) for seed_sequence in self.seed_sequence.spawn(count)]
+
+
+_random_service: RandomService = None
+
+
+def get_random_service() -> RandomService:
+    """The process-wide service, created unseeded on first use"""
+    global _random_service
+    if _random_service is None:
+        _random_service = RandomService()
+    return _random_service
+
+
+def set_random_service(random_service: RandomService) -> None:
+    global _random_service
+    _random_service = random_service
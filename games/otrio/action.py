@@ -0,0 +1,22 @@
+from games.game_components.action import GameAction
+from typing import ClassVar
+
+
+class OtrioAction(GameAction):
+    """Otrio action.  One slot per board cell, where a cell is a piece size
+    (0 small, 1 medium, 2 large) at one of the nine board positions.
+    The cell index is size * 9 + row * 3 + col."""
+
+    ACTION_SPACE_SIZE: ClassVar[int] = 27
+
+    @property
+    def cell(self) -> int:
+        return int(self.argmax())
+
+    @property
+    def size(self) -> int:
+        return self.cell // 9
+
+    @property
+    def position(self) -> int:
+        return self.cell % 9
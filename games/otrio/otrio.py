@@ -0,0 +1,281 @@
+from typing import Any, ClassVar
+
+import numpy as np
+
+from games.game_components.base_game_object import BaseGameObject
+from games.game_components.live_lines import LiveLines, lines_through_cells
+from .action import OtrioAction
+from .player import OtrioPlayer
+
+
+def _cell(size: int, position: int) -> int:
+    return size * 9 + position
+
+
+def _build_win_lines() -> tuple[int, ...]:
+    """Builds every Otrio win line as an integer bitmask over the 27 cells.
+
+    A line is won by three pieces of one size in a row, three pieces in a row
+    in ascending or descending size, or all three sizes stacked on one position.
+    """
+    position_lines = [
+        (0, 1, 2),
+        (3, 4, 5),
+        (6, 7, 8),
+        (0, 3, 6),
+        (1, 4, 7),
+        (2, 5, 8),
+        (0, 4, 8),
+        (2, 4, 6),
+    ]
+    lines = []
+    for first, middle, last in position_lines:
+        for size in range(3):
+            lines.append([_cell(size, first), _cell(size, middle), _cell(size, last)])
+        lines.append([_cell(0, first), _cell(1, middle), _cell(2, last)])
+        lines.append([_cell(2, first), _cell(1, middle), _cell(0, last)])
+    for position in range(9):
+        lines.append([_cell(0, position), _cell(1, position), _cell(2, position)])
+    return tuple(sum(1 << cell for cell in line) for line in lines)
+
+
+class Otrio(BaseGameObject):
+    """Otrio, played on 27 cells (three piece sizes on each of nine positions).
+
+    Each player's pieces on the board are held as a single integer bitmask, so
+    placing a piece and checking the win lines through it are a handful of
+    integer operations.  The full game state is a few integers, which makes
+    saving and loading it exact and constant time.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    action_type: ClassVar[type[OtrioAction]] = OtrioAction
+    win_score: ClassVar[int] = 1
+    empty_mark: ClassVar[str] = "."
+    full_mask: ClassVar[int] = (1 << OtrioAction.ACTION_SPACE_SIZE) - 1
+    size_masks: ClassVar[tuple[int, ...]] = tuple(((1 << 9) - 1) << (9 * size) for size in range(3))
+    win_lines: ClassVar[tuple[int, ...]] = _build_win_lines()
+    # Win line masks passing through each cell, indexed by cell
+    win_lines_by_cell: ClassVar[tuple[tuple[int, ...], ...]] = tuple(
+        tuple(line for line in _build_win_lines() if line >> cell & 1) for cell in range(27)
+    )
+    win_line_ids_by_cell: ClassVar[tuple[tuple[int, ...], ...]] = lines_through_cells(
+        ([cell for cell in range(27) if line >> cell & 1] for line in _build_win_lines()), 27
+    )
+
+    player_count: int = 2
+    players: dict[int, OtrioPlayer] = None
+    # Bitmask of the cells held by each player
+    player_masks: list[int] = None
+    occupied_mask: int = 0
+    # Per player legal action masks, kept up to date as cells fill and piece sizes run out
+    legal_masks: np.ndarray = None
+    # Win lines each player can still complete, to call a draw early
+    live_lines: LiveLines = None
+    current_player_num: int = 0
+    winner: int = None
+    turn: int = 0
+    save_game: tuple = None
+
+    def model_post_init(self, __context: Any) -> None:
+        if not 2 <= self.player_count <= 4:
+            raise ValueError("Otrio is played by 2 to 4 players.")
+        if self.players is None:
+            self.players = {player_num: OtrioPlayer(player_number=player_num) for player_num in range(self.player_count)}
+        if self.player_masks is None:
+            self.player_masks = [0] * self.player_count
+        if self.legal_masks is None:
+            self.legal_masks = np.ones((self.player_count, OtrioAction.ACTION_SPACE_SIZE), dtype=bool)
+        if self.live_lines is None:
+            self.live_lines = LiveLines(
+                player_count=self.player_count, line_count=len(Otrio.win_lines), line_length=3
+            )
+        if self.save_game is None:
+            self.save_game_state()
+
+    @property
+    def current_player(self) -> OtrioPlayer:
+        return self.players[self.current_player_num]
+
+    def save_game_state(self) -> None:
+        self.save_game = (
+            tuple(self.player_masks),
+            tuple(tuple(player.pieces) for player in self.players.values()),
+            self.occupied_mask,
+            self.legal_masks.copy(),
+            self.live_lines.save(),
+            self.current_player_num,
+            self.winner,
+            self.game_over,
+            self.turn,
+        )
+
+    def load_save_game_state(self) -> None:
+        player_masks, pieces, self.occupied_mask, legal_masks, live_lines, *counters = self.save_game
+        self.current_player_num, self.winner, self.game_over, self.turn = counters
+        self.player_masks = list(player_masks)
+        np.copyto(self.legal_masks, legal_masks)
+        self.live_lines.load(live_lines)
+        for player, player_pieces in zip(self.players.values(), pieces):
+            player.pieces = list(player_pieces)
+
+    def get_current_player(self) -> int:
+        return self.current_player_num
+
+    def _next_player_num(self, player_num: int) -> int:
+        return (player_num + 1) % self.player_count
+
+    def _legal_cells_mask(self, player_num: int) -> int:
+        """Empty cells the player still has a piece size for."""
+        pieces = self.players[player_num].pieces
+        allowed = 0
+        for size, size_mask in enumerate(Otrio.size_masks):
+            if pieces[size] > 0:
+                allowed |= size_mask
+        return allowed & ~self.occupied_mask & Otrio.full_mask
+
+    def _completing_cells_mask(self, player_num: int, legal_mask: int) -> int:
+        """Legal cells that would complete a win line for the given player."""
+        player_mask = self.player_masks[player_num]
+        completing = 0
+        for line in Otrio.win_lines:
+            missing = line & ~player_mask
+            # A single missing bit means the player holds the other two cells of the line
+            if missing and not missing & (missing - 1) and missing & legal_mask:
+                completing |= missing
+        return completing
+
+    @staticmethod
+    def _cells_from_mask(mask: int) -> list[int]:
+        cells = []
+        while mask:
+            low_bit = mask & -mask
+            cells.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return cells
+
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
+        """Action ids (cells) of the empty cells the current player has a piece for.
+
+        With special_policy, returns only the winning cells for the current player if any,
+        otherwise the cells that block the next player's win, if any.
+        """
+        legal_mask = self._legal_cells_mask(self.current_player_num)
+
+        if special_policy:
+            special_mask = self._completing_cells_mask(self.current_player_num, legal_mask)
+            if not special_mask:
+                special_mask = self._completing_cells_mask(self._next_player_num(self.current_player_num), legal_mask)
+            if special_mask:
+                legal_mask = special_mask
+
+        return np.array(self._cells_from_mask(legal_mask), dtype=int)
+
+    def legal_action_mask(self) -> np.ndarray:
+        return self.legal_masks[self.current_player_num]
+
+    def get_winning_actions(self, player_num: int) -> np.ndarray:
+        """Cells that complete a line for the player, read from the threat table."""
+        player_mask = self.player_masks[player_num]
+        cells = set()
+        for line_id in self.live_lines.threats[player_num]:
+            cell = (Otrio.win_lines[line_id] & ~player_mask).bit_length() - 1
+            if self.legal_masks[player_num, cell]:
+                cells.add(cell)
+        return np.array(sorted(cells), dtype=int)
+
+    def update_game_with_action(self, action: int, player: int = None) -> None:
+        cell = int(action)
+        player_num = self.current_player_num
+        cell_bit = 1 << cell
+        size = cell // 9
+
+        pieces = self.players[player_num].pieces
+        pieces[size] -= 1
+        if pieces[size] == 0:
+            self.legal_masks[player_num, size * 9 : size * 9 + 9] = False
+        self.legal_masks[:, cell] = False
+        player_mask = self.player_masks[player_num] | cell_bit
+        self.player_masks[player_num] = player_mask
+        self.occupied_mask |= cell_bit
+        self.live_lines.place(player_num, Otrio.win_line_ids_by_cell[cell])
+        self.turn += 1
+
+        for line in Otrio.win_lines_by_cell[cell]:
+            if player_mask & line == line:
+                self.winner = player_num
+                self.game_over = True
+                break
+
+        self.current_player_num = self._next_player_num(player_num)
+        # The game also ends when the next player has no piece that fits an empty cell,
+        # or as a draw when no player can complete any line
+        if not self.legal_masks[self.current_player_num].any() or not self.live_lines.any_live():
+            self.game_over = True
+
+    def is_game_over(self) -> bool:
+        return self.game_over
+
+    def get_game_scores(self) -> dict[int, int]:
+        if self.winner is None:
+            return {player_num: 0 for player_num in self.players}
+        return {player_num: 1 if player_num == self.winner else -1 for player_num in self.players}
+
+    def evaluate(self) -> dict[int, float]:
+        """Estimated scores from the lines each player still holds alone."""
+        if self.game_over:
+            return self.get_game_scores()
+        return self.live_lines.estimate_scores()
+
+    def get_remaining_moves(self) -> int:
+        empty_cells = OtrioAction.ACTION_SPACE_SIZE - self.occupied_mask.bit_count()
+        return min(empty_cells, sum(sum(player.pieces) for player in self.players.values()))
+
+    def get_state_hash(self) -> tuple:
+        # Pieces left follow from the cells each player holds
+        return (tuple(self.player_masks), self.current_player_num)
+
+    def encode_state(self) -> np.ndarray:
+        """One plane of held cells per player, then the player to move one-hot."""
+        cell_bits = np.arange(OtrioAction.ACTION_SPACE_SIZE)
+        planes = (np.array(self.player_masks)[:, None] >> cell_bits) & 1
+        to_move = np.arange(self.player_count) == self.current_player_num
+        return np.concatenate((planes.ravel(), to_move)).astype(np.float32)
+
+    def _cell_marks(self) -> list[str]:
+        marks = [Otrio.empty_mark] * OtrioAction.ACTION_SPACE_SIZE
+        for player_num, player_mask in enumerate(self.player_masks):
+            for cell in self._cells_from_mask(player_mask):
+                marks[cell] = str(player_num)
+        return marks
+
+    @property
+    def board(self) -> str:
+        marks = self._cell_marks()
+        rows = []
+        for row in range(3):
+            rows.append(
+                "\t\t".join(
+                    "|".join(marks[_cell(size, row * 3 + col)] for col in range(3)) for size in range(3)
+                )
+            )
+        return "\n        Small\t\tMedium\t\tLarge\n        " + "\n        ".join(rows)
+
+    def draw_board(self) -> None:
+        print(self.board)
+
+    def play_game(self):
+        while not self.is_game_over():
+            cell = int(input("Select a cell (size * 9 + row * 3 + col).  "))
+            self.update_game_with_action(cell, self.current_player_num)
+            self.draw_board()
+        for player_num, score in self.get_game_scores().items():
+            print(f"{player_num}:  {score}")
+
+        return self.get_game_scores()
+
+
+if __name__ == "__main__":
+    game = Otrio(player_count=2)
+    game.play_game()
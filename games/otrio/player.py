@@ -0,0 +1,7 @@
+from games.game_components.player import Player
+from pydantic import Field
+
+
+class OtrioPlayer(Player):
+    # Remaining pieces for each size, indexed small, medium, large
+    pieces: list[int] = Field(default_factory=lambda: [3, 3, 3])
@@ -0,0 +1,40 @@
+from games.game_components.action import GameAction
+from typing import ClassVar
+
+
+class SagradaAction(GameAction):
+    """Sagrada action.  Drafting a die (color, value) from the draft pool and placing it
+    on one of the 20 window cells is one slot, at (color * 6 + value - 1) * 20 + cell.
+    The final slot is a pass, for when no die in the pool can be legally placed."""
+
+    DIE_FACES: ClassVar[int] = 6
+    WINDOW_CELLS: ClassVar[int] = 20
+    PASS: ClassVar[int] = 600
+    ACTION_SPACE_SIZE: ClassVar[int] = 601
+
+    @staticmethod
+    def decode_id(action_id: int) -> tuple[int, int, int]:
+        """Die color, die value and window cell of a placement action id."""
+        die, cell = divmod(action_id, SagradaAction.WINDOW_CELLS)
+        color, value = divmod(die, SagradaAction.DIE_FACES)
+        return color, value + 1, cell
+
+    @property
+    def action_id(self) -> int:
+        return int(self.argmax())
+
+    @property
+    def is_pass(self) -> bool:
+        return self.action_id == SagradaAction.PASS
+
+    @property
+    def die_color(self) -> int:
+        return self.action_id // (SagradaAction.DIE_FACES * SagradaAction.WINDOW_CELLS)
+
+    @property
+    def die_value(self) -> int:
+        return self.action_id // SagradaAction.WINDOW_CELLS % SagradaAction.DIE_FACES + 1
+
+    @property
+    def cell(self) -> int:
+        return self.action_id % SagradaAction.WINDOW_CELLS
@@ -0,0 +1,8 @@
+from games.game_components.player import Player
+
+
+class SagradaPlayer(Player):
+    window_name: str
+    # Color whose dice values score the player's private objective
+    private_color: int
+    favor_tokens: int = 0
@@ -0,0 +1,357 @@
+from typing import Any, ClassVar
+
+import numpy as np
+
+from games.game_components.base_game_object import BaseGameObject
+from games.game_components.random_service import get_random_service
+from .action import SagradaAction
+from .player import SagradaPlayer
+
+RED = 0
+YELLOW = 1
+GREEN = 2
+BLUE = 3
+PURPLE = 4
+
+COLOR_LETTERS = "RYGBP"
+WINDOW_ROWS = 4
+WINDOW_COLS = 5
+
+ORTHOGONAL_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+ALL_OFFSETS = ORTHOGONAL_OFFSETS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# Window patterns as rows of restrictions: a color letter, a die value, or a space for none
+WINDOW_PATTERNS = {
+    "Fulgor del Cielo": (
+        [" BR  ", " 45 B", "B2 R5", "6R31 "],
+        5,
+    ),
+    "Luz Celestial": (
+        ["  R5 ", "P4 G3", "6  B ", " Y2  "],
+        3,
+    ),
+    "Shadow Thief": (
+        ["6P  5", "5 P  ", "R6 P ", "YR543"],
+        5,
+    ),
+    "Sun Catcher": (
+        [" B2 Y", " 4 R ", "  5Y ", "G3  P"],
+        3,
+    ),
+}
+
+
+def _shift_neighbours(grid: np.ndarray, offsets: tuple[tuple[int, int], ...]) -> np.ndarray:
+    """For each cell, whether any cell at the given (row, col) offsets is set.
+    Works on the last two axes, so stacks of grids are handled in one pass."""
+    rows, cols = grid.shape[-2:]
+    padded = np.pad(grid, [(0, 0)] * (grid.ndim - 2) + [(1, 1), (1, 1)])
+    neighbours = np.zeros(grid.shape, dtype=bool)
+    for row_offset, col_offset in offsets:
+        neighbours |= padded[..., 1 + row_offset : 1 + row_offset + rows, 1 + col_offset : 1 + col_offset + cols]
+    return neighbours
+
+
+def _parse_window(rows: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Parses a window pattern into color and value restriction grids (0 for no restriction)."""
+    colors = np.zeros((WINDOW_ROWS, WINDOW_COLS), dtype=np.int8)
+    values = np.zeros((WINDOW_ROWS, WINDOW_COLS), dtype=np.int8)
+    for row_num, row in enumerate(rows):
+        for col_num, restriction in enumerate(row):
+            if restriction.isdigit():
+                values[row_num, col_num] = int(restriction)
+            elif restriction != " ":
+                colors[row_num, col_num] = COLOR_LETTERS.index(restriction) + 1
+    return colors, values
+
+
+class Sagrada(BaseGameObject):
+    """Sagrada, without tool cards.
+
+    Each round the dice are drafted in snake order, each player taking two dice and
+    placing each on their window immediately.  Windows are held as integer grids of die
+    color (color + 1, 0 for empty) and die value, and the draft pool as counts per
+    (color, value).  Legal placements for every die in the pool are computed at once
+    as a boolean mask over (color, value, cell).
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    action_type: ClassVar[type[SagradaAction]] = SagradaAction
+    deterministic: ClassVar[bool] = False
+    total_rounds: ClassVar[int] = 10
+    dice_per_color: ClassVar[int] = 18
+    color_ids: ClassVar[np.ndarray] = np.arange(1, 6).reshape(5, 1, 1)
+    value_ids: ClassVar[np.ndarray] = np.arange(1, 7).reshape(6, 1, 1)
+    edge_cells: ClassVar[np.ndarray] = ~np.pad(
+        np.ones((WINDOW_ROWS - 2, WINDOW_COLS - 2), dtype=bool), 1, constant_values=False
+    )
+    # Public objective points
+    row_color_variety_points: ClassVar[int] = 6
+    column_shade_variety_points: ClassVar[int] = 4
+    shade_variety_points: ClassVar[int] = 5
+    # Expected private objective points of a drafted die: one color in five, average value 3.5
+    expected_private_points_per_die: ClassVar[float] = 3.5 / 5
+
+    player_count: int = 2
+    players: dict[int, SagradaPlayer] = None
+    # Per player window restrictions, shape (players, rows, cols)
+    pattern_colors: np.ndarray = None
+    pattern_values: np.ndarray = None
+    # Per player (color, value, row, col) placements allowed by the window restrictions
+    pattern_allowed: np.ndarray = None
+    # Per player placed dice, shape (players, rows, cols)
+    dice_colors: np.ndarray = None
+    dice_values: np.ndarray = None
+    # Dice available to draft this round, counts by (color, value)
+    draft_pool: np.ndarray = None
+    # Dice left in the bag, counts by color
+    dice_bag: np.ndarray = None
+    current_round: int = 0
+    turn_index: int = 0
+    current_player_num: int = 0
+    save_game: tuple = None
+
+    def model_post_init(self, __context: Any) -> None:
+        if not 1 <= self.player_count <= len(WINDOW_PATTERNS):
+            raise ValueError(f"Sagrada is played by 1 to {len(WINDOW_PATTERNS)} players.")
+        if self.players is None:
+            random_service = get_random_service()
+            window_names = random_service.sample(list(WINDOW_PATTERNS), self.player_count)
+            private_colors = random_service.sample(range(len(COLOR_LETTERS)), self.player_count)
+            self.players = {
+                player_num: SagradaPlayer(
+                    player_number=player_num,
+                    window_name=window_names[player_num],
+                    private_color=private_colors[player_num],
+                    favor_tokens=WINDOW_PATTERNS[window_names[player_num]][1],
+                )
+                for player_num in range(self.player_count)
+            }
+        if self.pattern_colors is None:
+            patterns = [_parse_window(WINDOW_PATTERNS[player.window_name][0]) for player in self.players.values()]
+            self.pattern_colors = np.stack([colors for colors, _ in patterns])
+            self.pattern_values = np.stack([values for _, values in patterns])
+        if self.pattern_allowed is None:
+            color_allowed = (self.pattern_colors[:, None] == 0) | (self.pattern_colors[:, None] == Sagrada.color_ids)
+            value_allowed = (self.pattern_values[:, None] == 0) | (self.pattern_values[:, None] == Sagrada.value_ids)
+            self.pattern_allowed = color_allowed[:, :, None] & value_allowed[:, None, :]
+        if self.dice_colors is None:
+            self.dice_colors = np.zeros((self.player_count, WINDOW_ROWS, WINDOW_COLS), dtype=np.int8)
+            self.dice_values = np.zeros((self.player_count, WINDOW_ROWS, WINDOW_COLS), dtype=np.int8)
+        if self.dice_bag is None:
+            self.dice_bag = np.full(len(COLOR_LETTERS), Sagrada.dice_per_color, dtype=np.int16)
+            self.draft_pool = np.zeros((len(COLOR_LETTERS), SagradaAction.DIE_FACES), dtype=np.int16)
+            self.start_round()
+        if self.save_game is None:
+            self.save_game_state()
+
+    @property
+    def current_player(self) -> SagradaPlayer:
+        return self.players[self.current_player_num]
+
+    @property
+    def turn_order(self) -> list[int]:
+        """Snake draft order for the current round; the start player rotates each round."""
+        start_player_num = (self.current_round - 1) % self.player_count
+        order = [(start_player_num + i) % self.player_count for i in range(self.player_count)]
+        return order + order[::-1]
+
+    def save_game_state(self) -> None:
+        self.save_game = (
+            self.dice_colors.copy(),
+            self.dice_values.copy(),
+            self.draft_pool.copy(),
+            self.dice_bag.copy(),
+            self.current_round,
+            self.turn_index,
+            self.current_player_num,
+            self.game_over,
+        )
+
+    def load_save_game_state(self) -> None:
+        dice_colors, dice_values, draft_pool, dice_bag, *counters = self.save_game
+        np.copyto(self.dice_colors, dice_colors)
+        np.copyto(self.dice_values, dice_values)
+        np.copyto(self.draft_pool, draft_pool)
+        np.copyto(self.dice_bag, dice_bag)
+        self.current_round, self.turn_index, self.current_player_num, self.game_over = counters
+
+    def get_current_player(self) -> int:
+        return self.current_player_num
+
+    def start_round(self) -> None:
+        """Begins a round: discards any leftover die and drafts 2 * players + 1 dice from the bag."""
+        self.current_round += 1
+        self.turn_index = 0
+        self.draft_pool[:] = 0
+        dice_count = min(2 * self.player_count + 1, int(self.dice_bag.sum()))
+        random_service = get_random_service()
+        colors = np.array(
+            random_service.sample(np.repeat(np.arange(len(COLOR_LETTERS)), self.dice_bag).tolist(), dice_count), dtype=int
+        )
+        values = np.array([1 + random_service.index(SagradaAction.DIE_FACES) for _ in range(dice_count)], dtype=int)
+        np.add.at(self.draft_pool, (colors, values - 1), 1)
+        self.dice_bag -= np.bincount(colors, minlength=len(COLOR_LETTERS)).astype(self.dice_bag.dtype)
+        self.current_player_num = self.turn_order[0]
+
+    def legal_placement_mask(self, player_num: int) -> np.ndarray:
+        """Legal placements of every die in the draft pool for the player.
+
+        A die must match the cell's color or value restriction, must not be orthogonally
+        adjacent to a die of the same color or value, and must touch a placed die
+        (diagonals included).  The first die must be placed on an edge or corner cell.
+
+        Returns:
+            np.ndarray: boolean mask of shape (colors, values, cells)
+        """
+        colors = self.dice_colors[player_num]
+        values = self.dice_values[player_num]
+        occupied = colors > 0
+        if occupied.any():
+            position_allowed = ~occupied & _shift_neighbours(occupied, ALL_OFFSETS)
+        else:
+            position_allowed = Sagrada.edge_cells
+        color_conflict = _shift_neighbours(colors == Sagrada.color_ids, ORTHOGONAL_OFFSETS)
+        value_conflict = _shift_neighbours(values == Sagrada.value_ids, ORTHOGONAL_OFFSETS)
+        legal = (
+            self.pattern_allowed[player_num]
+            & position_allowed
+            & ~color_conflict[:, None]
+            & ~value_conflict[None, :]
+            & (self.draft_pool > 0)[:, :, None, None]
+        )
+        return legal.reshape(len(COLOR_LETTERS), SagradaAction.DIE_FACES, SagradaAction.WINDOW_CELLS)
+
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
+        """Action ids of every legal (die, cell) placement for the current player,
+        or of a pass if there is none.
+
+        Args:
+            special_policy (bool, optional):  Not used. Defaults to False.
+        """
+        action_ids = np.flatnonzero(self.legal_placement_mask(self.current_player_num))
+        if len(action_ids) == 0:
+            return np.array([SagradaAction.PASS])
+        return action_ids
+
+    def legal_action_mask(self) -> np.ndarray:
+        placement_mask = self.legal_placement_mask(self.current_player_num).ravel()
+        return np.append(placement_mask, not placement_mask.any())
+
+    def update_game_with_action(self, action: int, player: int = None) -> None:
+        """Drafts and places the die (or passes), then moves to the next turn in the snake
+        order.  Once every player has drafted twice the round ends, and after the final round
+        the game is over."""
+        if action != SagradaAction.PASS:
+            color, value, cell = SagradaAction.decode_id(action)
+            row, col = divmod(cell, WINDOW_COLS)
+            self.draft_pool[color, value - 1] -= 1
+            self.dice_colors[self.current_player_num, row, col] = color + 1
+            self.dice_values[self.current_player_num, row, col] = value
+
+        self.turn_index += 1
+        if self.turn_index < 2 * self.player_count:
+            self.current_player_num = self.turn_order[self.turn_index]
+        elif self.current_round < Sagrada.total_rounds:
+            self.start_round()
+        else:
+            self.game_over = True
+
+    def get_chance_outcome_key(self) -> bytes:
+        """The new round's draft pool, when the move ended a round and dice were drawn."""
+        if self.turn_index == 0 and not self.game_over:
+            return self.draft_pool.tobytes()
+        return None
+
+    def is_game_over(self) -> bool:
+        return self.game_over
+
+    def _score_player(self, player_num: int) -> int:
+        """Private objective (sum of values in the player's color), public objectives
+        (row color variety, column shade variety, shade variety), remaining favor tokens,
+        minus one point per empty cell."""
+        colors = self.dice_colors[player_num]
+        values = self.dice_values[player_num]
+        player = self.players[player_num]
+
+        private_points = int(values[colors == player.private_color + 1].sum())
+        rows_with_every_color = int(((colors == Sagrada.color_ids).any(axis=2).sum(axis=0) == WINDOW_COLS).sum())
+        columns_with_every_value = int(((values == Sagrada.value_ids).any(axis=1).sum(axis=0) == WINDOW_ROWS).sum())
+        shade_sets = int((values == Sagrada.value_ids).sum(axis=(1, 2)).min())
+        empty_cells = int((colors == 0).sum())
+
+        return (
+            private_points
+            + Sagrada.row_color_variety_points * rows_with_every_color
+            + Sagrada.column_shade_variety_points * columns_with_every_value
+            + Sagrada.shade_variety_points * shade_sets
+            + player.favor_tokens
+            - empty_cells
+        )
+
+    def get_game_scores(self) -> dict[int, int]:
+        return {player_num: self._score_player(player_num) for player_num in self.players}
+
+    def evaluate(self) -> dict[int, float]:
+        """Current scores, plus the expected value of the placements each player has left:
+        every placement fills an empty cell (removing its penalty) and may add to the
+        private objective."""
+        if self.game_over:
+            return self.get_game_scores()
+        rounds_after_this = Sagrada.total_rounds - self.current_round
+        turns_left_this_round = self.turn_order[self.turn_index :]
+        scores = {}
+        for player_num in self.players:
+            placements_left = 2 * rounds_after_this + turns_left_this_round.count(player_num)
+            empty_cells = int((self.dice_colors[player_num] == 0).sum())
+            expected_placements = min(empty_cells, placements_left)
+            scores[player_num] = self._score_player(player_num) + expected_placements * (
+                1 + Sagrada.expected_private_points_per_die
+            )
+        return scores
+
+    def _window_rows(self, player_num: int) -> list[str]:
+        rows = []
+        for row in range(WINDOW_ROWS):
+            cells = []
+            for col in range(WINDOW_COLS):
+                color = self.dice_colors[player_num, row, col]
+                if color:
+                    cells.append(f"{COLOR_LETTERS[color - 1]}{self.dice_values[player_num, row, col]}")
+                elif self.pattern_colors[player_num, row, col]:
+                    cells.append(f"{COLOR_LETTERS[self.pattern_colors[player_num, row, col] - 1].lower()} ")
+                elif self.pattern_values[player_num, row, col]:
+                    cells.append(f"{self.pattern_values[player_num, row, col]} ")
+                else:
+                    cells.append("  ")
+            rows.append("|" + "|".join(cells) + "|")
+        return rows
+
+    def draw_board(self) -> None:
+        pool = [
+            f"{COLOR_LETTERS[color]}{value + 1}"
+            for color, value in zip(*np.nonzero(self.draft_pool))
+            for _ in range(self.draft_pool[color, value])
+        ]
+        print(f"\nRound {self.current_round}  Draft pool: {' '.join(pool)}")
+        for player_num, player in self.players.items():
+            print(f"\nPlayer {player_num} ({player.window_name})")
+            print("\n".join(self._window_rows(player_num)))
+
+    def play_game(self):
+        while not self.is_game_over():
+            self.draw_board()
+            actions = self.get_available_actions()
+            print(actions)
+            action_id = int(input("Select an action id.  "))
+            self.update_game_with_action(action_id, self.current_player_num)
+        for player_num, score in self.get_game_scores().items():
+            print(f"{player_num}:  {score}")
+
+        return self.get_game_scores()
+
+
+if __name__ == "__main__":
+    game = Sagrada(player_count=2)
+    game.play_game()
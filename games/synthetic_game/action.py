@@ -0,0 +1,23 @@
+from functools import cache
+from typing import ClassVar
+
+from games.game_components.action import GameAction
+
+
+class SyntheticAction(GameAction):
+    """Synthetic game action.  One slot per branch, so ACTION_SPACE_SIZE is the game's
+    branching_factor; synthetic_action_type gives the class for other factors."""
+
+    ACTION_SPACE_SIZE: ClassVar[int] = 8
+
+    @property
+    def branch(self) -> int:
+        return int(self.argmax())
+
+
+@cache
+def synthetic_action_type(branching_factor: int) -> type[SyntheticAction]:
+    """SyntheticAction subclass as wide as the branching factor, one per factor."""
+    if branching_factor == SyntheticAction.ACTION_SPACE_SIZE:
+        return SyntheticAction
+    return type(f"SyntheticAction{branching_factor}", (SyntheticAction,), {"ACTION_SPACE_SIZE": branching_factor})
@@ -0,0 +1,141 @@
+from typing import Any, ClassVar
+
+import numpy as np
+
+from games.game_components.base_game_object import BaseGameObject
+from games.synthetic_game.action import SyntheticAction, synthetic_action_type
+
+MASK_64 = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    """splitmix64 finalizer, used to derive child states and scores from a state key."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class SyntheticGame(BaseGameObject):
+    """
+    Synthetic game for engine benchmarks, generalizing SimpleArrayGame.
+
+    Game rules:
+    Every position has branching_factor actions, and the game ends after depth plies.
+    Players move in turn.  The game tree is a pure function of the seed: a position is
+    a 64 bit key, and each action hashes it into the child key.  A transposition_rate
+    share of moves lands on one of a small pool of keys for the next ply, so different
+    move orders reach the same position.  Terminal scores are drawn from the final key
+    using the chosen score_distribution.
+
+    Every hook is constant time, except update_game_with_action, which spends
+    rollout_cost extra hash rounds to stand in for the cost of real game logic.
+
+    Action id i is branch i.  The branching factor is a setting of each game, so
+    action_type is a property of the instance rather than of the class.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    score_distributions: ClassVar[tuple[str, ...]] = ("win_loss", "uniform", "normal")
+    transposition_salt: ClassVar[int] = 0x5DEECE66D
+
+    player_count: int = 2
+    branching_factor: int = 8
+    depth: int = 20
+    transposition_rate: float = 0.0
+    rollout_cost: int = 0
+    score_distribution: str = "win_loss"
+    seed: int = 0
+    state_key: int = None
+    ply: int = 0
+    current_player_num: int = 0
+    actions: np.ndarray = None
+    actions_mask: np.ndarray = None
+    save_game: tuple = None
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.score_distribution not in SyntheticGame.score_distributions:
+            raise ValueError(f"score_distribution must be one of {SyntheticGame.score_distributions}")
+        if self.state_key is None:
+            self.state_key = _mix(self.seed)
+        if self.actions is None:
+            self.actions = np.arange(self.branching_factor)
+            self.actions.flags.writeable = False
+            self.actions_mask = np.ones(self.branching_factor, dtype=bool)
+            self.actions_mask.flags.writeable = False
+        if self.save_game is None:
+            self.save_game_state()
+
+    @property
+    def action_type(self) -> type[SyntheticAction]:
+        return synthetic_action_type(self.branching_factor)
+
+    def save_game_state(self) -> None:
+        self.save_game = (self.state_key, self.ply, self.current_player_num)
+
+    def load_save_game_state(self) -> None:
+        self.state_key, self.ply, self.current_player_num = self.save_game
+
+    def get_current_player(self) -> int:
+        return self.current_player_num
+
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
+        """The same shared, read-only array of action ids at every position.
+
+        Args:
+            special_policy (bool, optional):  Not used. Defaults to False.
+        """
+        return self.actions
+
+    def legal_action_mask(self) -> np.ndarray:
+        return self.actions_mask
+
+    def update_game_with_action(self, action: int, player: int = None) -> None:
+        state_key = _mix(self.state_key ^ _mix(int(action) + self.seed))
+        for _ in range(self.rollout_cost):
+            state_key = _mix(state_key)
+        if (_mix(state_key ^ SyntheticGame.transposition_salt) & 0xFFFF) < self.transposition_rate * 0x10000:
+            state_key = _mix((self.ply + 1) * self.branching_factor + state_key % self.branching_factor + self.seed)
+        self.state_key = state_key
+        self.ply += 1
+        self.current_player_num = (self.current_player_num + 1) % self.player_count
+
+    def is_game_over(self) -> bool:
+        return self.ply >= self.depth
+
+    def _uniform(self, player_num: int, draw: int = 0) -> float:
+        return _mix(self.state_key + player_num * 0x100 + draw) / MASK_64
+
+    def get_game_scores(self) -> dict[int, float]:
+        if self.score_distribution == "win_loss":
+            winner = self.state_key % self.player_count
+            return {player_num: 1 if player_num == winner else -1 for player_num in range(self.player_count)}
+        if self.score_distribution == "uniform":
+            return {player_num: self._uniform(player_num) for player_num in range(self.player_count)}
+        # Irwin-Hall approximation of a standard normal
+        return {
+            player_num: sum(self._uniform(player_num, draw) for draw in range(12)) - 6
+            for player_num in range(self.player_count)
+        }
+
+    def evaluate(self) -> dict[int, float]:
+        """Scores drawn from the current state key, as if the game ended here.  As cheap
+        and as noisy as a real static evaluator, for benchmarking truncated rollouts."""
+        return self.get_game_scores()
+
+    def get_remaining_moves(self) -> int:
+        return self.depth - self.ply
+
+    def get_state_hash(self) -> tuple:
+        return (self.state_key, self.ply)
+
+    def encode_state(self) -> np.ndarray:
+        """The 64 bits of the state key, the share of plies played and the player to move
+        one-hot.  Carries no signal about the scores; for benchmarking leaf evaluators."""
+        key_bits = np.unpackbits(np.array([self.state_key], dtype=">u8").view(np.uint8))
+        to_move = np.arange(self.player_count) == self.current_player_num
+        return np.concatenate((key_bits, [self.ply / self.depth], to_move)).astype(np.float32)
+
+    def draw_board(self) -> None:
+        print(f"Ply {self.ply}/{self.depth}  State {self.state_key:016x}")
@@ -1,6 +1,7 @@
 from typing import Any
 
 from games.game_components.base_game_object import BaseGameObject
+from games.game_components.live_lines import LiveLines, lines_through_cells
 from .player import TicTacToePlayer
 from typing import ClassVar
 from .action import TicTacToeAction
@@ -8,9 +9,20 @@ import numpy as np
 from pydantic import Field
 
 
+def _wins_by_position(win_conditions: dict[str, np.ndarray]) -> dict[int, list[str]]:
+    return {
+        position: [name for name, condition in win_conditions.items() if position in condition]
+        for position in range(TicTacToeAction.ACTION_SPACE_SIZE)
+    }
+
+
 class TicTacToe(BaseGameObject):
     """Tic tac toe game"""
 
+    model_config = {"arbitrary_types_allowed": True}
+
+    action_type: ClassVar[type[TicTacToeAction]] = TicTacToeAction
+    win_score: ClassVar[int] = 1
     empty_space: ClassVar[int] = -1
     player_count: int = 2
     positions: list[int] = Field(
@@ -18,6 +30,9 @@ class TicTacToe(BaseGameObject):
         * TicTacToeAction.ACTION_SPACE_SIZE
     )
     current_player_num: int = 0
+    # Legal action mask, kept up to date as positions are filled
+    open_positions: np.ndarray = None
+    moves_remaining: int = TicTacToeAction.ACTION_SPACE_SIZE
     win_conditions: ClassVar[dict[str, np.ndarray[int]]] = {
         "top_row": np.array([0, 1, 2]),
         "mid_row": np.array([3, 4, 5]),
@@ -28,20 +43,19 @@ class TicTacToe(BaseGameObject):
         "left_diag": np.array([0, 4, 8]),
         "right_diag": np.array([2, 4, 6]),
     }
-    wins_by_position: ClassVar[dict[int, list[str]]] = {
-        0: ["top_row", "left_diag", "left_col"],
-        1: ["mid_row", "mid_col"],
-        2: ["bot_row", "right_diag", "right_col"],
-        3: ["top_row", "mid_col"],
-        4: ["mid_row", "mid_col", "left_diag", "right_diag"],
-        5: ["bot_row", "mid_col"],
-        6: ["top_row", "right_diag", "right_col"],
-        7: ["mid_row", "right_col"],
-        8: ["bot_row", "left_diag", "left_col"],
-    }
+    win_lines: ClassVar[tuple[tuple[int, ...], ...]] = tuple(
+        tuple(condition.tolist()) for condition in win_conditions.values()
+    )
+    # Win conditions through each position, so a move only checks its own lines
+    wins_by_position: ClassVar[dict[int, list[str]]] = _wins_by_position(win_conditions)
+    win_line_ids_by_position: ClassVar[tuple[tuple[int, ...], ...]] = lines_through_cells(
+        win_conditions.values(), TicTacToeAction.ACTION_SPACE_SIZE
+    )
     player_marks: ClassVar[dict[int, str]] = {0: "X", 1: "O"}
     players: dict[int, TicTacToePlayer] = None
-    save_game: dict = None
+    # Win lines each player can still complete, to call a draw early
+    live_lines: LiveLines = None
+    save_game: tuple = None
     num_to_win: ClassVar[int] = 3
 
     @property
@@ -56,16 +70,39 @@ class TicTacToe(BaseGameObject):
                 )
                 for player_num in range(self.player_count)
             }
+        if self.open_positions is None:
+            self.open_positions = np.array(self.positions) == TicTacToe.empty_space
+        if self.live_lines is None:
+            self.live_lines = LiveLines(
+                player_count=self.player_count,
+                line_count=len(self.win_conditions),
+                line_length=TicTacToe.num_to_win,
+            )
+            for position, player_num in enumerate(self.positions):
+                if player_num != TicTacToe.empty_space:
+                    self.live_lines.place(player_num, self.win_line_ids_by_position[position])
         if self.save_game is None:
-            self.save_game = self.model_dump()
-
-    def save_game_state(self) -> dict:
-        self.save_game = self.model_dump()
+            self.save_game_state()
+
+    def save_game_state(self):
+        self.save_game = (
+            tuple(self.positions),
+            self.open_positions.copy(),
+            self.live_lines.save(),
+            tuple(player.player_score for player in self.players.values()),
+            self.current_player_num,
+            self.moves_remaining,
+            self.game_over,
+        )
 
     def load_save_game_state(self):
-        save_game = self.save_game
-        self.__init__(**save_game)
-        self.save_game = save_game
+        positions, open_positions, live_lines, scores, *counters = self.save_game
+        self.current_player_num, self.moves_remaining, self.game_over = counters
+        self.positions = list(positions)
+        np.copyto(self.open_positions, open_positions)
+        self.live_lines.load(live_lines)
+        for player, score in zip(self.players.values(), scores):
+            player.player_score = score
 
     @property
     def board(self):
@@ -88,10 +125,8 @@ class TicTacToe(BaseGameObject):
     def get_current_player(self) -> int:
         return self.current_player_num
 
-    def get_available_actions(self, special_policy: bool = False) -> list:
-        """Gets available moves in a dictionary.
-        The bot will only ever need the keys; values should be unknown
-        """
+    def get_available_actions(self, special_policy: bool = False) -> np.ndarray:
+        """Gets available moves as action ids, which are the open board positions."""
         legal_positions = [
             i
             for i, position in enumerate(self.positions)
@@ -118,9 +153,7 @@ class TicTacToe(BaseGameObject):
                         TicTacToe.empty_space in condition_state
                         and condition_state.count(next_player_num) == 2
                     ):
-                        special_policy_actions += [
-                            self.generate_action_from_position(position)
-                        ]
+                        special_policy_actions.append(position)
                         break
 
             if len(special_policy_actions) > 0:
@@ -128,19 +161,31 @@ class TicTacToe(BaseGameObject):
                 # print(
                 #    f"Available win positions for {self.player_marks[current_player]}, Special policy legal actions: {special_policy_actions}"
                 # )
-                return special_policy_actions
+                return np.array(special_policy_actions, dtype=int)
+
+        return np.array(legal_positions, dtype=int)
 
-        legal_actions = [self.generate_action_from_position(i) for i in legal_positions]
+    def legal_action_mask(self) -> np.ndarray:
+        return self.open_positions
 
-        return legal_actions
+    def get_winning_actions(self, player_num: int) -> np.ndarray:
+        """Open positions that complete a line for the player, read from the threat table."""
+        positions = {
+            position
+            for line_id in self.live_lines.threats[player_num]
+            for position in self.win_lines[line_id]
+            if self.positions[position] == TicTacToe.empty_space
+        }
+        return np.array(sorted(positions), dtype=int)
 
-    def update_game_with_action(
-        self, action: TicTacToeAction, player: TicTacToePlayer = None
-    ):
-        """Makes a move on the board and draws it"""
+    def update_game_with_action(self, action: int, player: TicTacToePlayer = None):
+        """Makes a move on the board and checks whether it ended the game"""
 
-        self.positions[action.position] = self.current_player_num
-        # self.game_over = self.check_game_over()
+        self.positions[action] = self.current_player_num
+        self.open_positions[action] = False
+        self.live_lines.place(self.current_player_num, self.win_line_ids_by_position[action])
+        self.moves_remaining -= 1
+        self.check_game_over(action)
 
         self.current_player_num = (self.current_player_num + 1) % self.player_count
 
@@ -148,31 +193,29 @@ class TicTacToe(BaseGameObject):
         return [self.positions[num] for num in win_condition]
 
     def is_game_over(self):
-        return self.check_game_over()
+        return self.game_over
 
-    def check_game_over(self):
-        """Checks for the eight win conditions, and whether there are moves left.
+    def check_game_over(self, position: int):
+        """Checks the win conditions through the position just played, and whether
+        there are moves left.  The game is also a draw as soon as no player can
+        complete any line.  Sets game_over and the player scores when the game ends.
 
-        Returns:
-            bool: Over or not
+        Args:
+            position (int): position of the last move
         """
-        if sum(self.positions) < -2:
-            return False
-        for win_condition in self.win_conditions.values():
-            condition_state = self.get_condition_state(win_condition)
-            prior_player_num = (self.current_player_num + 1) % self.player_count
-            if (
-                condition_state.count(condition_state[0]) == TicTacToe.num_to_win
-                and condition_state[0] == prior_player_num
-            ):
-                self.current_player.player_score = -1
-                self.players[prior_player_num].player_score = 1
-                return True
-        if all([pos != TicTacToe.empty_space for pos in self.positions]):
-            self.players[0].player_score = 0
-            self.players[1].player_score = 0
-            return True
-        return False
+        player_num = self.positions[position]
+        for name in self.wins_by_position[position]:
+            condition_state = self.get_condition_state(self.win_conditions[name])
+            if condition_state.count(player_num) == TicTacToe.num_to_win:
+                for player in self.players.values():
+                    player.player_score = -1
+                self.players[player_num].player_score = 1
+                self.game_over = True
+                return
+        if self.moves_remaining == 0 or not self.live_lines.any_live():
+            for player in self.players.values():
+                player.player_score = 0
+            self.game_over = True
 
     @property
     def scores(self):
@@ -184,22 +227,34 @@ class TicTacToe(BaseGameObject):
     def get_game_scores(self):
         return self.scores
 
+    def evaluate(self) -> dict[int, float]:
+        """Estimated scores from the lines each player still holds alone."""
+        if self.game_over:
+            return self.scores
+        return self.live_lines.estimate_scores()
+
+    def get_remaining_moves(self) -> int:
+        return self.moves_remaining
+
+    def get_state_hash(self) -> tuple:
+        return (tuple(self.positions), self.current_player_num)
+
+    def encode_state(self) -> np.ndarray:
+        """One occupancy plane per player, then the player to move one-hot."""
+        player_nums = np.arange(self.player_count)
+        planes = np.array(self.positions) == player_nums[:, None]
+        return np.concatenate((planes.ravel(), player_nums == self.current_player_num)).astype(np.float32)
+
     def play_game(self):
         while not self.is_game_over():
             pos = int(input("Select a move.  "))
-            action = self.generate_action_from_position(pos)
-            self.update_game_with_action(action, self.current_player_num)
+            self.update_game_with_action(pos, self.current_player_num)
             print(self.board)
         for player_num, player in self.players.items():
             print(f"{player_num}:  {player.player_score}")
 
         return self.scores
 
-    def generate_action_from_position(self, position: int):
-        action = np.zeros(TicTacToeAction.ACTION_SPACE_SIZE, dtype=int)
-        action[position] = 1
-        return action.view(TicTacToeAction)
-
 
 if __name__ == "__main__":
     game = TicTacToe(player_count=2)
@@ -5,4 +5,5 @@ GAMES_MAP = {
     "otrio": "Otrio",
     "azul": "Azul",
     "sagrada": "Sagrada",
+    "synthetic_game": "SyntheticGame",
 }
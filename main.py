@@ -1,6 +1,7 @@
 import sys
 from engine.game_multiprocessor import GameMultiprocessor
 from engine.game_engine import GameEngine
+from engine.cli_options import add_search_arguments, search_options_from_args
 import argparse
 from icecream import install
 
@@ -25,6 +26,7 @@ def parseArguments():
         type=str,
         default="no_decay",
     )
+    add_search_arguments(parser)
 
     # Parse arguments
     args = parser.parse_args()
@@ -40,6 +42,7 @@ if __name__ == "__main__":
     -v = verbosity (default False)
     -g = games (default 1)
     -d = sim decay (default none)
+    Search options (-r, -m, -e, --ponder, ...): see -h
     """
 
     # Parse the arguments
@@ -51,9 +54,12 @@ if __name__ == "__main__":
     verbose = args.__dict__["v"]
     num_games = args.__dict__["g"]
     decay = args.__dict__["d"]
+    rollout_policy = args.__dict__["r"]
+    seed = args.__dict__["seed"]
+    search_options = search_options_from_args(args)
 
     print(
-        f"Initializing game: {game_name}, # sims: {sims}, # player_count: {player_count}, verbose: {verbose}, num_games: {num_games}, decay: {decay}"
+        f"Initializing game: {game_name}, # sims: {sims}, # player_count: {player_count}, verbose: {verbose}, num_games: {num_games}, decay: {decay}, rollout policy: {rollout_policy}, search options: {search_options}"
     )
 
-    GameMultiprocessor(game_name, sims, player_count, verbose, num_games, decay).playout_simulations()
+    GameMultiprocessor(game_name, sims, player_count, verbose, num_games, decay, rollout_policy, search_options, seed).playout_simulations()
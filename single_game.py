@@ -1,5 +1,6 @@
 import sys
 from engine.game_engine import GameEngine
+from engine.cli_options import add_search_arguments, search_options_from_args
 import argparse
 import sys
 from pyinstrument import Profiler
@@ -25,6 +26,7 @@ def parseArguments():
         type=str,
         default="no_decay",
     )
+    add_search_arguments(parser)
 
     # Parse arguments
     args = parser.parse_args()
@@ -40,6 +42,7 @@ if __name__ == "__main__":
     -v = verbosity (default False)
     -g = games (default 1)
     -d = sim decay (default none)
+    Search options (-r, -m, -e, --ponder, ...): see -h
     """
 
     # Parse the arguments
@@ -51,6 +54,9 @@ if __name__ == "__main__":
     verbose = args.__dict__["v"]
     num_games = args.__dict__["g"]
     decay = args.__dict__["d"]
+    rollout_policy = args.__dict__["r"]
+    seed = args.__dict__["seed"]
+    search_options = search_options_from_args(args)
 
     # game_name = 'tic_tac_toe'
     # sims = 100
@@ -60,13 +66,13 @@ if __name__ == "__main__":
     # decay = None
 
     print(
-        f"Initializing game: {game_name}, # sims: {sims}, # player_count: {player_count}, verbose: {verbose}, num_games: {num_games}, decay: {decay}"
+        f"Initializing game: {game_name}, # sims: {sims}, # player_count: {player_count}, verbose: {verbose}, num_games: {num_games}, decay: {decay}, rollout policy: {rollout_policy}, search options: {search_options}"
     )
 
     # timestamp = datetime.now().strftime("%m%d%Y_%H%M%S")
     # sys.stdout = open(f"logs/{game_name}_{sims}_{timestamp}.log", "w")
 
-    GameEngine(game_name, sims, player_count, verbose, decay).play_game_by_turns(sims)
+    GameEngine(game_name, sims, player_count, verbose, decay, rollout_policy, search_options, seed).play_game_by_turns(sims)
 
 profiler.stop()
 
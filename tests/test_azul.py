@@ -0,0 +1,85 @@
+import pytest
+
+from games.azul.azul import AzulGame
+from games.azul.player_board import ALL, PlayerBoard, Star
+from games.azul.tile_container import BLUE, GREEN, ORANGE, PURPLE, RED, YELLOW
+from games.game_components.random_service import RandomService, set_random_service
+
+
+def fill(board: PlayerBoard, color: int, positions: list[int]):
+    """Places tiles on a star and scores them, as the player does."""
+    for position in positions:
+        board.add_tile_to_star(color, color if color != ALL else RED, position)
+        board.stars[color].score_points_for_position_placed(position)
+
+
+def chance_keys(seed: int) -> list:
+    """Chance keys of a new game, its first round's draw, a move taking tiles, and the
+    next round's draw"""
+    set_random_service(RandomService(seed))
+    game = AzulGame(player_count=2)
+    keys = [game.get_chance_outcome_key()]
+    game.start_round()
+    keys.append(game.get_chance_outcome_key())
+    game.update_game_with_action(int(game.get_available_actions()[0]), game.current_player_num)
+    keys.append(game.get_chance_outcome_key())
+    game.start_round()
+    keys.append(game.get_chance_outcome_key())
+    return keys
+
+
+@pytest.fixture()
+def board():
+    board = PlayerBoard()
+    # A finished red star, half a blue star and a tile at position 1 everywhere
+    fill(board, RED, range(1, Star.STAR_SIZE + 1))
+    fill(board, BLUE, [1, 2, 3])
+    for color in [ORANGE, YELLOW, GREEN, PURPLE, ALL]:
+        fill(board, color, [1])
+    return board
+
+
+class TestProjectedPoints:
+    def test_empty_board(self):
+        assert PlayerBoard().projected_points() == 0
+
+    def test_partial_star(self):
+        board = PlayerBoard()
+        fill(board, BLUE, [1, 2, 3])
+        # Half the blue star's completion points, plus one of seven stars toward
+        # each of the position 1-3 multistar bonuses
+        bonus = sum(position * PlayerBoard.FILL_ALL_POS_BONUS / 7 for position in [1, 2, 3])
+        assert board.projected_points() == pytest.approx(Star.STAR_POINTS[BLUE] / 2 + bonus)
+
+    def test_finished_stars_and_bonuses_are_not_projected(self, board: PlayerBoard):
+        assert board.stars[RED].star_full_points_received
+        stars = Star.STAR_POINTS[BLUE] / 2 + sum(
+            Star.STAR_POINTS[color] / Star.STAR_SIZE for color in [ORANGE, YELLOW, GREEN, PURPLE, ALL]
+        )
+        # Position 1 is on every star and already scored; red and blue hold 2 and 3,
+        # red alone holds 4
+        bonus = PlayerBoard.FILL_ALL_POS_BONUS * (2 * 2 + 3 * 2 + 4 * 1) / 7
+        assert board.projected_points() == pytest.approx(stars + bonus)
+
+    def test_evaluate_adds_projection_to_score(self, board: PlayerBoard):
+        game = AzulGame(player_count=2)
+        game.players[0].player_board = board
+        # Penalties for leftover tiles are already taken off the score
+        game.players[0].player_score = 8
+        assert game.evaluate() == {
+            0: pytest.approx(8 + board.projected_points()),
+            1: game.players[1].player_score,
+        }
+
+
+class TestChanceOutcomeKey:
+    def test_key_follows_the_draws(self):
+        new_game, first_draw, take, second_draw = chance_keys(seed=1)
+        # Only moves that drew tiles from the bag have a key
+        assert new_game is None and take is None
+        assert first_draw is not None and second_draw is not None
+        assert second_draw != first_draw
+
+    def test_same_seed_replays_the_same_keys(self):
+        assert chance_keys(seed=1) == chance_keys(seed=1)
+        assert chance_keys(seed=1)[1] != chance_keys(seed=2)[1]
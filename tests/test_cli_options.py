@@ -0,0 +1,25 @@
+import argparse
+
+from engine.cli_options import add_search_arguments, search_options_from_args
+from engine.game_engine import GameEngine
+from engine.selection_policies import SELECTION_POLICIES
+
+
+def parse(*argv: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    add_search_arguments(parser)
+    return parser.parse_args(argv)
+
+
+class TestCliOptions:
+    def test_defaults_build_an_engine(self):
+        engine = GameEngine("tic_tac_toe", sims=10, search_options=search_options_from_args(parse()))
+        engine.play_game_by_turns(10)
+        assert engine.game.is_game_over()
+
+    def test_choices_follow_the_engine_tables(self):
+        for selection in SELECTION_POLICIES:
+            assert search_options_from_args(parse("--selection", selection))["selection"] == selection
+        options = search_options_from_args(parse("--root-policy", "sequential_halving", "--gc-mode", "freeze"))
+        assert options["root_policy"] == "sequential_halving"
+        assert options["gc_mode"] == "freeze"
@@ -0,0 +1,55 @@
+import pytest
+
+from games.connect_four.connect_four import ConnectFour
+
+
+@pytest.fixture()
+def game():
+    return ConnectFour(player_count=2)
+
+
+def play_columns(game: ConnectFour, columns: list[int]):
+    for column in columns:
+        game.update_game_with_action(column, game.get_current_player())
+
+
+class TestConnectFour:
+    def test_win_conditions_by_position(self):
+        for position, conditions in ConnectFour.win_conditions_by_position.items():
+            assert all(position in condition for condition in conditions)
+        assert sum(len(conditions) for conditions in ConnectFour.win_conditions_by_position.values()) == 69 * 4
+
+    def test_column_win(self, game: ConnectFour):
+        play_columns(game, [0, 1, 0, 1, 0, 1])
+        assert not game.is_game_over()
+        play_columns(game, [0])
+        assert game.is_game_over()
+        assert game.get_game_scores() == {0: 1, 1: -1}
+
+    def test_save_and_load_game_over(self, game: ConnectFour):
+        play_columns(game, [0, 1, 0, 1, 0, 1])
+        game.save_game_state()
+        play_columns(game, [0])
+        assert game.is_game_over()
+        game.load_save_game_state()
+        assert not game.is_game_over()
+        assert game.moves_remaining == ConnectFour.num_positions - 6
+
+    def test_special_policy_blocks(self, game: ConnectFour):
+        play_columns(game, [0, 0, 1, 1, 2])
+        assert game.get_available_actions(special_policy=True).tolist() == [3]
+
+    def test_special_policy_skips_unplayable_threats(self, game: ConnectFour):
+        # X holds 28, 29 and 30, but 38 below the fourth cell is still empty
+        play_columns(game, [4, 0, 0, 1, 1, 5, 2, 6, 2])
+        assert game.get_available_actions(special_policy=True).tolist() == list(range(ConnectFour.num_columns))
+        play_columns(game, [3])
+        assert game.get_available_actions(special_policy=True).tolist() == [3]
+
+    def test_encode_state(self, game: ConnectFour):
+        play_columns(game, [3])
+        encoded = game.encode_state()
+        assert encoded.shape == (2 * ConnectFour.num_positions + 2,)
+        assert encoded[: ConnectFour.num_positions].sum() == 1
+        assert encoded[ConnectFour.num_positions : 2 * ConnectFour.num_positions].sum() == 0
+        assert encoded[-2:].tolist() == [0, 1]
@@ -0,0 +1,106 @@
+import numpy as np
+
+from engine.endgame_solver import EndgameSolver
+from engine.monte_carlo_engine import MonteCarloEngine
+from games.synthetic_game.synthetic_game import SyntheticGame
+from games.tic_tac_toe.tic_tac_toe import TicTacToe
+
+
+class MaskedTicTacToe(TicTacToe):
+    """Tic tac toe with corner 2 never playable, told to the engine only through the mask"""
+
+    def legal_action_mask(self) -> np.ndarray:
+        mask = np.array(self.positions) == TicTacToe.empty_space
+        mask[2] = False
+        return mask
+
+
+class OffsetTicTacToe(TicTacToe):
+    """Tic tac toe that numbers its players 1 and 2"""
+
+    def get_current_player(self) -> int:
+        return super().get_current_player() + 1
+
+    def update_game_with_action(self, action: int, player: int):
+        super().update_game_with_action(action, player - 1)
+
+    def get_game_scores(self) -> dict:
+        return {player + 1: score for player, score in super().get_game_scores().items()}
+
+
+def max_n_scores(game: SyntheticGame) -> dict:
+    if game.is_game_over():
+        return game.get_game_scores()
+    player = game.get_current_player()
+    snapshot = game.get_state_snapshot()
+    best = None
+    for action in game.get_available_actions():
+        game.update_game_with_action(action, player)
+        scores = max_n_scores(game)
+        game.restore_state_snapshot(snapshot)
+        if best is None or scores[player] > best[player]:
+            best = scores
+    return best
+
+
+class TestEndgameSolver:
+    def test_tic_tac_toe_is_a_draw(self):
+        game = TicTacToe(player_count=2)
+        action, value = EndgameSolver(max_nodes=1_000_000, time_limit=60).solve(game)
+        assert value == 0
+        assert game.moves_remaining == 9
+        assert game.positions == [TicTacToe.empty_space] * 9
+
+    def test_finds_the_win(self):
+        game = TicTacToe(player_count=2)
+        for position in (0, 3, 1, 5, 4, 7):
+            game.update_game_with_action(position, game.get_current_player())
+        action, value = EndgameSolver().solve(game)
+        assert action in (2, 8)
+        assert value == 2
+
+    def test_player_ids_other_than_zero_and_one(self):
+        game = OffsetTicTacToe(player_count=2)
+        for position in (0, 3, 1, 5, 4, 7):
+            game.update_game_with_action(position, game.get_current_player())
+        action, value = EndgameSolver().solve(game)
+        assert action in (2, 8)
+        assert value == 2
+
+    def test_positions_are_keyed_in_full(self):
+        game = TicTacToe(player_count=2)
+        for position in (0, 3, 1, 5):
+            game.update_game_with_action(position, game.get_current_player())
+        solver = EndgameSolver()
+        solver.solve(game)
+        assert (tuple(game.positions), game.get_current_player()) in solver.table
+        for order in ((0, 3, 1, 5), (1, 5, 0, 3)):
+            replay = TicTacToe(player_count=2)
+            for position in order:
+                replay.update_game_with_action(position, replay.get_current_player())
+            assert replay.get_state_hash() == game.get_state_hash()
+
+    def test_reads_the_legal_action_mask(self):
+        game = MaskedTicTacToe(player_count=2)
+        for position in (0, 3, 1, 5, 4, 7):
+            game.update_game_with_action(position, game.get_current_player())
+        action, value = EndgameSolver().solve(game)
+        assert action == 8
+        assert value == 2
+
+    def test_max_n_for_three_players(self):
+        game = SyntheticGame(player_count=3, branching_factor=3, depth=5, score_distribution="uniform")
+        action, value = EndgameSolver().solve(game)
+        assert value == max_n_scores(game)[0]
+
+    def test_gives_up_at_node_limit(self):
+        game = TicTacToe(player_count=2)
+        assert EndgameSolver(max_nodes=10).solve(game) is None
+        assert game.moves_remaining == 9
+
+    def test_engine_hands_off_the_endgame(self):
+        game = TicTacToe(player_count=2)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, endgame_moves=9, endgame_time_limit=60)
+        montecarlo.select_and_return_best_real_action(num_sims=100, game=game, node_player=0, parent=montecarlo.root)
+        assert montecarlo.simulations_run == 0
+        assert montecarlo.root.number_of_visits == 0
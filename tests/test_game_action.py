@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from games.azul.action import AzulAction
+from games.game_components.action import InternedGameAction
+from games.tic_tac_toe.action import TicTacToeAction
+
+
+class PairAction(InternedGameAction):
+    ACTION_SPACE_SIZE = 2
+    MAX_ACTION_IDS = 3
+
+
+class TestGameAction:
+    def test_action_table_is_shared_and_read_only(self):
+        table = TicTacToeAction.action_table()
+        assert table is TicTacToeAction.action_table()
+        assert table.shape == (9, 9)
+        with pytest.raises(ValueError):
+            table[0, 0] = 5
+
+    def test_ids_round_trip(self):
+        action = TicTacToeAction.from_id(4)
+        assert isinstance(action, TicTacToeAction)
+        assert action.position == 4
+        assert TicTacToeAction.to_id(action) == 4
+
+    def test_interned_actions(self):
+        first = AzulAction()
+        first[AzulAction.FACTORY_TAKE_COLOR_START + 2] = 3
+        same = AzulAction()
+        same[AzulAction.FACTORY_TAKE_COLOR_START + 2] = 3
+        other = AzulAction()
+        other[AzulAction.BONUS_START] = 1
+
+        first_id = AzulAction.intern(first)
+        assert AzulAction.intern(same) == first_id
+        assert AzulAction.intern(other) != first_id
+        assert np.array_equal(AzulAction.from_id(first_id), first)
+        assert not AzulAction.from_id(first_id).flags.writeable
+
+    def test_id_count(self):
+        assert TicTacToeAction.id_count() == TicTacToeAction.ACTION_SPACE_SIZE
+        assert AzulAction.id_count() == AzulAction.MAX_ACTION_IDS
+
+    def test_interned_ids_are_bounded(self):
+        ids = [PairAction.intern(np.array(pair)) for pair in ([0, 1], [1, 0], [1, 1], [0, 1])]
+        assert ids == [0, 1, 2, 0]
+        assert max(ids) < PairAction.id_count()
+        with pytest.raises(ValueError):
+            PairAction.intern(np.array([2, 2]))
@@ -0,0 +1,34 @@
+from games.game_components.live_lines import LiveLines, lines_through_cells
+from games.tic_tac_toe.tic_tac_toe import TicTacToe
+
+
+class TestLiveLines:
+    def test_lines_through_cells(self):
+        assert lines_through_cells([[0, 1], [1, 2]], 3) == ((0,), (0, 1), (1,))
+
+    def test_place_blocks_lines(self):
+        live_lines = LiveLines(player_count=2, line_count=2, line_length=3)
+        live_lines.place(0, [0, 1])
+        assert live_lines.live_counts == [2, 0]
+        live_lines.place(1, [1])
+        assert live_lines.live_counts == [1, 0]
+        assert live_lines.line_owners == [0, LiveLines.blocked]
+        live_lines.place(1, [0])
+        assert not live_lines.any_live()
+
+    def test_tic_tac_toe_early_draw(self):
+        game = TicTacToe(player_count=2)
+        # X O X / X O O / O X . : every line is blocked with one position left
+        for position in [0, 1, 2, 4, 3, 5, 7, 6]:
+            assert not game.is_game_over()
+            game.update_game_with_action(position, game.get_current_player())
+        assert game.is_game_over()
+        assert game.moves_remaining == 1
+        assert game.get_game_scores() == {0: 0, 1: 0}
+
+    def test_save_and_load(self):
+        game = TicTacToe(player_count=2)
+        game.save_game_state()
+        game.update_game_with_action(4, game.get_current_player())
+        game.load_save_game_state()
+        assert game.live_lines.live_counts == [8, 8]
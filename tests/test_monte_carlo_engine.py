@@ -0,0 +1,390 @@
+import numpy as np
+import pytest
+
+from engine import rollout_workers
+from engine.game_engine import GameEngine
+from engine.game_multiprocessor import GameMultiprocessor
+from engine.leaf_evaluators import LeafEvaluator, LinearLeafEvaluator
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.monte_carlo_node import NodePool
+from games.connect_four.connect_four import ConnectFour
+from games.game_components.random_service import RandomService
+from games.sagrada.sagrada import Sagrada
+from games.synthetic_game.synthetic_game import SyntheticGame
+from games.tic_tac_toe.tic_tac_toe import TicTacToe
+
+
+
+
+class TestTruncatedRollouts:
+    def test_rollout_stops_at_ply_limit(self):
+        game = SyntheticGame(depth=20)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, max_rollout_depth=3)
+        montecarlo.game_copy = game
+        scores = montecarlo._rollout_from_selected_node()
+        assert game.ply == 3
+        assert scores == game.evaluate()
+
+    def test_rollout_stops_at_round_limit(self):
+        game = Sagrada(player_count=2)
+        montecarlo = MonteCarloEngine(
+            start_player=0, verbose=False, max_rollout_depth=1, rollout_depth_unit="rounds"
+        )
+        montecarlo.game_copy = game
+        montecarlo._rollout_from_selected_node()
+        assert game.current_round == 2
+        assert not game.is_game_over()
+
+    def test_games_without_evaluate_play_out(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(SyntheticGame, "evaluate", lambda self: None)
+        game = SyntheticGame(depth=10)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, max_rollout_depth=3)
+        montecarlo.game_copy = game
+        montecarlo._rollout_from_selected_node()
+        assert game.is_game_over()
+
+    def test_unknown_depth_unit(self):
+        with pytest.raises(ValueError):
+            MonteCarloEngine(start_player=0, verbose=False, rollout_depth_unit="turns")
+
+
+class TestLeafRollouts:
+    def run_search(self, sims: int, **engine_options) -> MonteCarloEngine:
+        game = SyntheticGame(branching_factor=4, depth=8)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(0), **engine_options)
+        montecarlo.select_and_return_best_real_action(num_sims=sims, game=game, node_player=0, parent=montecarlo.root)
+        assert game.ply == 0
+        return montecarlo
+
+    def test_mean_backup_counts_one_visit_per_leaf(self):
+        montecarlo = self.run_search(20, rollouts_per_leaf=4)
+        assert montecarlo.root.number_of_visits == 20
+
+    def test_all_backup_counts_every_rollout(self):
+        montecarlo = self.run_search(20, rollouts_per_leaf=4, rollout_backup="all")
+        assert montecarlo.root.number_of_visits == 80
+
+    def test_process_pool(self):
+        montecarlo = self.run_search(5, rollouts_per_leaf=4, rollout_backup="all", rollout_processes=2)
+        assert montecarlo.root.number_of_visits == 20
+
+    def test_shared_process_pool_is_left_open(self):
+        game = SyntheticGame(branching_factor=4, depth=8)
+        options = {"rollouts_per_leaf": 4, "rollout_backup": "all", "rollout_processes": 2}
+        rollout_pool = rollout_workers.start_pool(2, game, MonteCarloEngine(0, False, **options).rollout_options())
+        try:
+            for _ in range(2):
+                montecarlo = MonteCarloEngine(start_player=0, verbose=False, rollout_pool=rollout_pool, **options)
+                montecarlo.select_and_return_best_real_action(num_sims=5, game=game, node_player=0, parent=montecarlo.root)
+                assert montecarlo.root.number_of_visits == 20
+        finally:
+            rollout_pool.close()
+            rollout_pool.join()
+
+    def test_game_engine_starts_one_pool_per_game(self, monkeypatch):
+        started = []
+        start_pool = rollout_workers.start_pool
+        monkeypatch.setattr(rollout_workers, "start_pool", lambda *args: started.append(args) or start_pool(*args))
+        engine = GameEngine(
+            "tic_tac_toe", sims=5, player_count=2, seed=0, search_options={"rollouts_per_leaf": 2, "rollout_processes": 2}
+        )
+        engine.play_game_by_turns(5)
+        assert len(started) == 1
+        assert engine.rollout_pool is None
+
+    def test_no_process_pool_in_a_series_of_games(self):
+        with pytest.raises(ValueError):
+            GameMultiprocessor("tic_tac_toe", 5, 2, False, 2, None, search_options={"rollout_processes": 2})
+
+    def test_state_snapshot_leaves_save_slot(self):
+        game = SyntheticGame()
+        root_save = game.save_game
+        game.update_game_with_action(1)
+        snapshot = game.get_state_snapshot()
+        game.update_game_with_action(2)
+        game.restore_state_snapshot(snapshot)
+        assert game.ply == 1
+        assert game.save_game is root_save
+
+
+class TestNodeBudget:
+    def test_tree_stays_within_budget(self):
+        game = SyntheticGame(branching_factor=4, depth=12)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(0), max_nodes=200)
+        montecarlo.select_and_return_best_real_action(num_sims=500, game=game, node_player=0, parent=montecarlo.root)
+        nodes = montecarlo.root.count_subtree_nodes()
+        assert nodes == montecarlo.node_count
+        assert montecarlo.peak_node_count <= 200 + game.branching_factor
+        assert montecarlo.root.number_of_visits == 500
+
+    def test_collapsed_nodes_keep_their_statistics(self):
+        game = SyntheticGame(branching_factor=4, depth=12)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(0), max_nodes=100)
+        montecarlo.select_and_return_best_real_action(num_sims=300, game=game, node_player=0, parent=montecarlo.root)
+        # Every visit of the root went through exactly one of its children
+        assert sum(child.number_of_visits for child in montecarlo.root.children) == 300
+
+
+class TestSolver:
+    def won_position(self) -> TicTacToe:
+        # X to move, and X wins at 2 (top row) or 8 (diagonal)
+        game = TicTacToe(player_count=2)
+        for position in (0, 3, 1, 5, 4, 7):
+            game.update_game_with_action(position, game.get_current_player())
+        game.save_game_state()
+        return game
+
+    def test_search_ends_once_root_is_proven(self):
+        game = self.won_position()
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False)
+        action = montecarlo.select_and_return_best_real_action(num_sims=500, game=game, node_player=0, parent=montecarlo.root)
+        assert action in (2, 8)
+        assert montecarlo.root.proven_scores == {0: 1, 1: -1}
+        assert montecarlo.simulations_run < 500
+
+    def test_solver_off(self):
+        game = self.won_position()
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, solver=False)
+        montecarlo.select_and_return_best_real_action(num_sims=50, game=game, node_player=0, parent=montecarlo.root)
+        assert montecarlo.root.proven_scores is None
+        assert montecarlo.simulations_run == 50
+
+    def test_games_with_chance_are_not_proven(self):
+        game = Sagrada(player_count=2)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, max_rollout_depth=1)
+        montecarlo.select_and_return_best_real_action(num_sims=5, game=game, node_player=0, parent=montecarlo.root)
+        assert not montecarlo.solving
+
+
+class TestStateCache:
+    def run_search(self, **engine_options) -> MonteCarloEngine:
+        game = SyntheticGame(branching_factor=3, depth=12)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(7), **engine_options)
+        montecarlo.select_and_return_best_real_action(num_sims=300, game=game, node_player=0, parent=montecarlo.root)
+        assert game.ply == 0
+        return montecarlo
+
+    def test_cached_search_matches_replayed_search(self):
+        replayed = self.run_search()
+        cached = self.run_search(state_cache_size=20, state_cache_interval=2)
+        assert cached.state_cache.hits > 0
+        assert [child.number_of_visits for child in cached.root.children] == [
+            child.number_of_visits for child in replayed.root.children
+        ]
+        assert cached.root.total_score == replayed.root.total_score
+
+    def test_cache_is_cleared_after_search(self):
+        cached = self.run_search(state_cache_size=20, state_cache_interval=2)
+        assert len(cached.state_cache.cached_nodes) == 0
+        assert all(child.state_snapshot is None for child in cached.root.children)
+
+    def test_pruning_evicts_collapsed_nodes(self, monkeypatch: pytest.MonkeyPatch):
+        prune = MonteCarloEngine._prune_cold_subtrees
+        cache_sizes = []
+
+        def checked_prune(montecarlo: MonteCarloEngine):
+            prune(montecarlo)
+            live_nodes = set()
+            stack = [montecarlo.search_root]
+            while stack:
+                node = stack.pop()
+                live_nodes.add(node)
+                stack.extend(node.children)
+            cached_nodes = montecarlo.state_cache.cached_nodes
+            assert all(node in live_nodes and node.state_snapshot is not None for node in cached_nodes)
+            assert len(cached_nodes) <= montecarlo.node_count
+            cache_sizes.append(len(cached_nodes))
+
+        monkeypatch.setattr(MonteCarloEngine, "_prune_cold_subtrees", checked_prune)
+        self.run_search(state_cache_size=200, state_cache_interval=1, max_nodes=60)
+        assert cache_sizes
+
+
+class TestDenseChildren:
+    def run_search(self, node_pool: NodePool, **engine_options) -> MonteCarloEngine:
+        game = ConnectFour(player_count=2)
+        montecarlo = MonteCarloEngine(
+            start_player=0, verbose=False, node_pool=node_pool, random_service=RandomService(3), **engine_options
+        )
+        montecarlo.select_and_return_best_real_action(num_sims=400, game=game, node_player=0, parent=montecarlo.root)
+        return montecarlo
+
+    def test_dense_search_matches_list_search(self):
+        plain = self.run_search(NodePool())
+        dense = self.run_search(NodePool(action_space_size=ConnectFour.action_type.ACTION_SPACE_SIZE))
+        assert [child.number_of_visits for child in dense.root.children] == [
+            child.number_of_visits for child in plain.root.children
+        ]
+
+    def test_rows_match_children_after_pruning(self):
+        dense = self.run_search(NodePool(action_space_size=ConnectFour.action_type.ACTION_SPACE_SIZE), max_nodes=200)
+        stack = [dense.root]
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                assert node.child_visits[child.node_action] == child.number_of_visits
+                assert node.child_totals[child.node_action] == child.total_score
+            stack.extend(node.children)
+
+
+class TestProgressiveBias:
+    def must_block_position(self) -> TicTacToe:
+        # O to move, and must block X at 2
+        game = TicTacToe(player_count=2)
+        for position in (0, 4, 1):
+            game.update_game_with_action(position, game.get_current_player())
+        game.save_game_state()
+        return game
+
+    def test_priors_from_threats(self):
+        priors = self.must_block_position().get_action_priors()
+        assert priors[2] == 0.5
+        assert priors.sum() == 0.5
+
+    def test_favoured_move_searched_most(self):
+        game = self.must_block_position()
+        montecarlo = MonteCarloEngine(
+            start_player=1, verbose=False, random_service=RandomService(0), progressive_bias=2, solver=False
+        )
+        montecarlo.select_and_return_best_real_action(num_sims=30, game=game, node_player=1, parent=montecarlo.root)
+        most_visited = max(montecarlo.root.children, key=lambda child: child.number_of_visits)
+        assert most_visited.node_action == 2
+        assert most_visited.prior == 0.5
+
+
+class TestSequentialHalving:
+    def run_search(self, sims: int) -> MonteCarloEngine:
+        game = SyntheticGame(branching_factor=8, depth=6)
+        montecarlo = MonteCarloEngine(
+            start_player=0,
+            verbose=False,
+            random_service=RandomService(0),
+            root_policy="sequential_halving",
+            solver=False,
+        )
+        montecarlo.select_and_return_best_real_action(num_sims=sims, game=game, node_player=0, parent=montecarlo.root)
+        return montecarlo
+
+    def test_budget_split_over_halving_rounds(self):
+        montecarlo = self.run_search(48)
+        visits = sorted(child.number_of_visits for child in montecarlo.root.children)
+        # 3 rounds of 16 sims: 8 children get 2, then 4 get 4 more, then 2 get 8 more
+        assert visits == [2, 2, 2, 2, 6, 6, 14, 14]
+        assert len(montecarlo.halving_candidates) == 2
+
+    def test_last_child_takes_the_rest(self):
+        # Rounds of 20 sims: 8 children get 2, 4 get 5, 2 get 10, and the last one the 4 left
+        montecarlo = self.run_search(60)
+        assert montecarlo.root.number_of_visits == 60
+        assert max(child.number_of_visits for child in montecarlo.root.children) == 2 + 5 + 10 + 4
+
+    def test_unknown_root_policy(self):
+        with pytest.raises(ValueError):
+            MonteCarloEngine(start_player=0, verbose=False, root_policy="thompson")
+
+
+class TestChanceNodes:
+    def round_end_position(self) -> Sagrada:
+        # The last draft of round 1: every move starts round 2 with a new draw of dice
+        game = Sagrada(player_count=2)
+        for _ in range(3):
+            game.update_game_with_action(game.get_available_actions()[0], game.get_current_player())
+        game.save_game_state()
+        return game
+
+    def test_outcomes_branch_under_moves(self):
+        game = self.round_end_position()
+        montecarlo = MonteCarloEngine(
+            start_player=game.get_current_player(),
+            verbose=False,
+            random_service=RandomService(0),
+            max_rollout_depth=1,
+            rollout_depth_unit="rounds",
+            max_chance_outcomes=2,
+        )
+        montecarlo.select_and_return_best_real_action(
+            num_sims=60, game=game, node_player=game.get_current_player(), parent=montecarlo.root
+        )
+        visited = [child for child in montecarlo.root.children if child.number_of_visits > 0]
+        assert visited
+        for child in visited:
+            assert 1 <= len(child.children) <= 2
+            assert all(outcome.outcome_key is not None for outcome in child.children)
+            assert sum(outcome.number_of_visits for outcome in child.children) == child.number_of_visits
+
+    def test_outcome_replays_from_seed(self):
+        game = self.round_end_position()
+        montecarlo = MonteCarloEngine(start_player=game.get_current_player(), verbose=False, random_service=RandomService(1))
+        montecarlo.game_copy = game
+        montecarlo.root.add_child(
+            montecarlo.node_pool.acquire(
+                parent=montecarlo.root,
+                node_action=int(game.get_available_actions()[0]),
+                depth=1,
+                player=game.get_current_player(),
+            )
+        )
+        child = montecarlo.root.children[0]
+        outcome = montecarlo._move_to_chance_outcome(child, game.get_current_player())
+        game.load_save_game_state()
+        montecarlo.max_chance_outcomes = 1
+        assert montecarlo._move_to_chance_outcome(child, game.get_current_player()) is outcome
+        assert game.draft_pool.tobytes() == outcome.outcome_key
+
+
+class RecordingEvaluator(LeafEvaluator):
+    """Scores every leaf 0 and keeps the batches it was called with"""
+
+    def __init__(self):
+        self.batches = []
+
+    def evaluate(self, batch: np.ndarray) -> np.ndarray:
+        self.batches.append(batch)
+        return np.zeros((len(batch), 2))
+
+
+class TestLeafEvaluator:
+    def test_leaves_are_evaluated_in_batches(self):
+        game = SyntheticGame(depth=20)
+        evaluator = RecordingEvaluator()
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, leaf_evaluator=evaluator, evaluation_batch_size=16)
+        montecarlo.select_and_return_best_real_action(num_sims=100, game=game, node_player=0, parent=montecarlo.root)
+        assert [len(batch) for batch in evaluator.batches] == [16] * 6 + [4]
+        assert montecarlo.root.number_of_visits == 100
+        # Every virtual loss was taken back
+        assert montecarlo.root.total_score == 0
+        assert montecarlo.root.sum_of_squares == 0
+
+    def test_virtual_loss_spreads_the_batch(self):
+        game = SyntheticGame(depth=20)
+        evaluator = RecordingEvaluator()
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, leaf_evaluator=evaluator, evaluation_batch_size=8)
+        montecarlo.select_and_return_best_real_action(num_sims=24, game=game, node_player=0, parent=montecarlo.root)
+        for batch in evaluator.batches:
+            assert len(np.unique(batch, axis=0)) == len(batch)
+
+    def test_terminal_leaves_are_proven(self):
+        game = TestSolver().won_position()
+        evaluator = LinearLeafEvaluator(np.zeros((game.encode_state().size, 2)))
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, leaf_evaluator=evaluator, evaluation_batch_size=4)
+        action = montecarlo.select_and_return_best_real_action(num_sims=500, game=game, node_player=0, parent=montecarlo.root)
+        assert action in (2, 8)
+        assert montecarlo.root.proven_scores == {0: 1, 1: -1}
+
+    def test_game_without_encoding(self):
+        game = Sagrada(player_count=2)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, leaf_evaluator=RecordingEvaluator())
+        with pytest.raises(ValueError):
+            montecarlo.select_and_return_best_real_action(num_sims=1, game=game, node_player=0, parent=montecarlo.root)
+
+
+class TestSearchReport:
+    @pytest.mark.parametrize("verbose", [False, True])
+    def test_statistics_only_when_verbose(self, capsys, verbose: bool):
+        game = TicTacToe(player_count=2)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=verbose, state_cache_size=10)
+        montecarlo.select_and_return_best_real_action(num_sims=50, game=game, node_player=0, parent=montecarlo.root)
+        summaries = [line for line in capsys.readouterr().out.splitlines() if line.startswith("Tree nodes")]
+        assert len(summaries) == int(verbose)
+        if verbose:
+            assert "GC pauses" in summaries[0] and "State cache hits" in summaries[0]
@@ -0,0 +1,116 @@
+import gc
+import weakref
+
+import pytest
+
+from engine.monte_carlo_node import DenseMonteCarloNode, MonteCarloNode, NodePool
+from games.azul.action import AzulAction
+from games.connect_four.connect_four import ConnectFour
+from games.sagrada.action import SagradaAction
+
+
+class TestMonteCarloNode:
+    def test_tree_freed_by_refcount(self):
+        root = MonteCarloNode()
+        child = MonteCarloNode(parent=root, depth=1)
+        root.children.append(child)
+        grandchild = MonteCarloNode(parent=child, depth=2)
+        child.children.append(grandchild)
+        assert grandchild.parent is child
+        assert grandchild.get_ancestors() == {root, child, grandchild}
+
+        child_ref = weakref.ref(child)
+        del child, grandchild
+        gc.disable()
+        try:
+            del root
+            assert child_ref() is None
+        finally:
+            gc.enable()
+
+    def test_pool_reuses_nodes(self):
+        pool = NodePool()
+        root = pool.acquire(player=0)
+        child = pool.acquire(parent=root, node_action=3, depth=1, player=1)
+        root.children.append(child)
+        child.number_of_visits = 5
+        pool.release_subtree(root)
+        assert len(pool.free_nodes) == 2
+
+        reused = pool.acquire(node_action=1, player=0)
+        assert reused in (root, child)
+        assert reused.number_of_visits == 0
+        assert reused.parent is None
+        assert reused.children == []
+
+    def test_release_descendants_only(self):
+        pool = NodePool()
+        root = pool.acquire(player=0)
+        root.children.append(pool.acquire(parent=root, depth=1, player=1))
+        pool.release_subtree(root, include_root=False)
+        assert root.children == []
+        assert len(pool.free_nodes) == 1
+
+    def test_reroot(self):
+        pool = NodePool()
+        root = pool.acquire(player=0)
+        kept = pool.acquire(parent=root, node_action=0, depth=1, player=0)
+        dropped = pool.acquire(parent=root, node_action=1, depth=1, player=0)
+        root.children.extend([kept, dropped])
+        kept.children.append(pool.acquire(parent=kept, node_action=2, depth=2, player=1))
+        kept.number_of_visits = 4
+        assert pool.reroot(root, kept) is kept
+        assert kept.parent is None
+        assert kept.number_of_visits == 4 and len(kept.children) == 1
+        assert len(pool.free_nodes) == 2
+
+    def test_prove_from_children(self):
+        root = MonteCarloNode(player=1)
+        children = [MonteCarloNode(parent=root, node_action=action, depth=1, player=0) for action in range(3)]
+        root.children = children
+        children[0].proven_scores = {0: 0, 1: 0}
+        assert not root.prove_from_children()
+        children[1].proven_scores = {0: -1, 1: 1}
+        children[2].proven_scores = {0: 0, 1: 0}
+        assert root.prove_from_children()
+        assert root.proven_scores == {0: 0, 1: 0}
+
+    def test_prove_won_position_early(self):
+        root = MonteCarloNode(player=1)
+        children = [MonteCarloNode(parent=root, node_action=action, depth=1, player=0) for action in range(3)]
+        root.children = children
+        children[1].proven_scores = {0: 1, 1: -1}
+        assert not root.prove_from_children()
+        assert root.prove_from_children(win_score=1)
+        assert root.proven_scores == {0: 1, 1: -1}
+
+
+class TestDenseMonteCarloNode:
+    def test_rows_follow_children(self):
+        root = DenseMonteCarloNode(7, player=1)
+        for action in (2, 5):
+            root.add_child(DenseMonteCarloNode(7, parent=root, node_action=action, depth=1, player=0))
+        assert root.get_child(5) is root.children[1]
+        assert root.get_child(3) is None
+        root.get_child(5).record_visit(2, 1.5, 1.25, simulation=1)
+        assert root.child_visits[5] == 2
+        assert root.child_totals[5] == 1.5
+        assert root.best_child(real_move=True) is root.children[1]
+
+    def test_pool_clears_rows_on_release(self):
+        pool = NodePool(action_space_size=7)
+        root = pool.acquire(player=0)
+        root.add_child(pool.acquire(parent=root, node_action=3, depth=1, player=0))
+        pool.release_subtree(root, include_root=False)
+        assert root.get_child(3) is None
+        assert (root.child_index == -1).all()
+
+    def test_dense_pool_width(self):
+        pool = NodePool.dense(ConnectFour.action_type)
+        assert pool.acquire(player=0).child_index.shape == (ConnectFour.action_type.ACTION_SPACE_SIZE,)
+
+    @pytest.mark.parametrize("action_type", [None, AzulAction, SagradaAction])
+    def test_dense_pool_refused(self, action_type):
+        # No action space, interned ids, and rows wider than MAX_DENSE_WIDTH
+        with pytest.raises(ValueError):
+            NodePool.dense(action_type)
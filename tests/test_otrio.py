@@ -0,0 +1,69 @@
+import pytest
+
+from games.otrio.otrio import Otrio
+
+
+@pytest.fixture()
+def game():
+    return Otrio(player_count=2)
+
+
+def play_cells(game: Otrio, cells: list[int]):
+    for cell in cells:
+        game.update_game_with_action(cell, game.get_current_player())
+
+
+class TestOtrio:
+    def test_win_lines(self):
+        # 24 same-size lines, 16 ascending/descending lines and 9 stacked positions
+        assert len(Otrio.win_lines) == 49
+        assert len(set(Otrio.win_lines)) == 49
+
+    def test_available_actions(self, game: Otrio):
+        assert list(game.get_available_actions()) == list(range(27))
+        play_cells(game, [0])
+        assert 0 not in list(game.get_available_actions())
+
+    def test_same_size_row_win(self, game: Otrio):
+        play_cells(game, [0, 9, 1, 10, 2])
+        assert game.is_game_over()
+        assert game.get_game_scores() == {0: 1, 1: -1}
+
+    def test_stacked_position_win(self, game: Otrio):
+        play_cells(game, [4, 0, 13, 1, 22])
+        assert game.is_game_over()
+        assert game.get_game_scores() == {0: 1, 1: -1}
+
+    def test_out_of_pieces(self, game: Otrio):
+        # player 0 places all three small pieces without completing a line
+        play_cells(game, [0, 9, 1, 14, 5, 19])
+        assert game.players[0].pieces == [0, 3, 3]
+        assert all(cell // 9 != 0 for cell in game.get_available_actions())
+
+    def test_special_policy_wins_then_blocks(self, game: Otrio):
+        play_cells(game, [0, 9, 1])
+        # player 1 must block the small top row
+        assert list(game.get_available_actions(special_policy=True)) == [2]
+        play_cells(game, [2, 16, 10])
+        # player 0 has no win, player 1 threatens the medium top row and a descending row
+        assert list(game.get_available_actions(special_policy=True)) == [11, 18]
+
+    def test_save_and_load_restores_exact_state(self, game: Otrio):
+        play_cells(game, [0, 9])
+        game.save_game_state()
+        saved_masks = list(game.player_masks)
+        play_cells(game, [1, 10, 2])
+        assert game.is_game_over()
+
+        game.load_save_game_state()
+        assert game.player_masks == saved_masks
+        assert game.players[0].pieces == [2, 3, 3]
+        assert game.get_current_player() == 0
+        assert not game.is_game_over()
+        assert game.get_game_scores() == {0: 0, 1: 0}
+
+    def test_legal_action_mask_matches_available_actions(self, game: Otrio):
+        play_cells(game, [0, 9, 1, 14, 5, 19])
+        assert list(game.get_available_actions()) == list(game.legal_action_mask().nonzero()[0])
+        game.load_save_game_state()
+        assert game.legal_action_mask().all()
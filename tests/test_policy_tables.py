@@ -0,0 +1,77 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.game_engine import GameEngine
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.policy_tables import check_table_action_type, distill_turn_logs, load_policy_table, save_policy_table
+from engine.rollout_policies import TableRolloutPolicy
+from games.azul.action import AzulAction
+from games.azul.azul import AzulGame
+from games.game_components.random_service import RandomService
+from games.tic_tac_toe.tic_tac_toe import TicTacToe
+
+
+@pytest.fixture()
+def turn_log(tmp_path) -> str:
+    # Two games in the GameMultiprocessor layout; the second ends a turn earlier
+    log_path = tmp_path / "tic_tac_toe_turn_log.csv"
+    pd.DataFrame(
+        [
+            {"Game": 0, "Player 0": 1, "Player 1": -1, "T1 P0": 4, "T2 P1": 0, "T3 P0": 8},
+            {"Game": 1, "Player 0": -1, "Player 1": 1, "T1 P0": 0, "T2 P1": 4},
+        ]
+    ).to_csv(log_path, index=False)
+    return str(log_path)
+
+
+class TestPolicyTables:
+    def test_distill_by_player(self, turn_log: str):
+        table = distill_turn_logs([turn_log], action_space_size=9, chunksize=1)
+        assert table.shape == (2, 9)
+        assert table[0, 4] == 1 and table[0, 8] == 1 and table[0, 0] == -1
+        assert table[1, 0] == -1 and table[1, 4] == 1
+        # Actions never played score the row's mean over all its moves
+        assert table[0, 1] == pytest.approx(1 / 3)
+        assert table[1, 1] == 0
+
+    def test_distill_pooled(self, turn_log: str):
+        table = distill_turn_logs([turn_log], by_player=False)
+        assert table.shape == (1, 9)
+        assert table[0, 4] == 1 and table[0, 0] == -1
+
+    def test_saved_table_is_memory_mapped(self, turn_log: str, tmp_path):
+        path = str(tmp_path / "tables" / "TicTacToe.npy")
+        save_policy_table(distill_turn_logs([turn_log]), path)
+        table = load_policy_table(path)
+        assert isinstance(table, np.memmap)
+        assert table[0, 4] == 1
+
+    def test_table_policy(self, turn_log: str, tmp_path):
+        path = str(tmp_path / "TicTacToe.npy")
+        save_policy_table(distill_turn_logs([turn_log], action_space_size=9), path)
+        policy = TableRolloutPolicy(path, temperature=0.01)
+        game = TicTacToe(player_count=2)
+        assert policy.choose_action(game, game.get_available_actions(), RandomService(0)) in (4, 8)
+        assert pickle.loads(pickle.dumps(policy)).table is None
+
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, rollout_policy=TableRolloutPolicy(path))
+        action = montecarlo.select_and_return_best_real_action(num_sims=50, game=game, node_player=0, parent=montecarlo.root)
+        assert action in range(9)
+
+    def test_game_engine_logs_turns(self):
+        engine = GameEngine("tic_tac_toe", sims=10, player_count=2, seed=0)
+        engine.play_game_by_turns(10)
+        assert [entry["Turn"] for entry in engine.game_log] == list(range(1, engine.turn + 1))
+        assert engine.get_game_scores() == engine.game.get_game_scores()
+
+    def test_interned_action_ids_are_refused(self, turn_log: str, tmp_path):
+        check_table_action_type(TicTacToe.action_type)
+        with pytest.raises(ValueError):
+            check_table_action_type(AzulAction)
+        path = str(tmp_path / "AzulGame.npy")
+        save_policy_table(distill_turn_logs([turn_log]), path)
+        with pytest.raises(ValueError):
+            TableRolloutPolicy(path).choose_action(AzulGame(player_count=2), np.array([0, 1]), RandomService(0))
@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from engine.game_engine import GameEngine
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.ponderer import Ponderer
+from games.connect_four.connect_four import ConnectFour
+from games.game_components.random_service import RandomService
+from games.sagrada.sagrada import Sagrada
+
+
+class TestPonderer:
+    def test_ponders_until_stopped(self):
+        game = ConnectFour(player_count=2)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(0))
+        ponderer = Ponderer(montecarlo)
+        ponderer.start(game, montecarlo.root)
+        deadline = time.perf_counter() + 5
+        while montecarlo.root.number_of_visits < 20 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        simulations = ponderer.stop()
+        assert simulations >= 20
+        assert montecarlo.root.number_of_visits == simulations
+        # The thread searched a copy of the game
+        assert game.moves_remaining == ConnectFour.num_positions
+
+    def test_stop_without_start(self):
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False)
+        assert Ponderer(montecarlo).stop() == 0
+
+    def test_games_with_chance_are_not_pondered(self):
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False)
+        with pytest.raises(ValueError):
+            Ponderer(montecarlo).start(Sagrada(player_count=2), montecarlo.root)
+
+    def test_game_engine_plays_with_pondering(self):
+        engine = GameEngine("tic_tac_toe", sims=30, player_count=2, seed=0, search_options={"ponder": True})
+        engine.play_game_by_turns(30)
+        assert engine.game.is_game_over()
+        assert len(engine.game_log) == engine.turn
+
+    def test_consecutive_turns_with_pondering(self, monkeypatch):
+        # With one player, every turn searches the tree pondered after the last one
+        engine = GameEngine("synthetic_game", sims=30, player_count=1, seed=0, search_options={"ponder": True})
+        ponderers = []
+        start_pondering = engine._start_pondering
+
+        def record_ponderer(tree):
+            ponderers.append(start_pondering(tree))
+            return ponderers[-1]
+
+        search = MonteCarloEngine.select_and_return_best_real_action
+
+        def search_alone(montecarlo, *args, **kwargs):
+            assert all(ponderer.thread is None for ponderer in ponderers)
+            return search(montecarlo, *args, **kwargs)
+
+        monkeypatch.setattr(engine, "_start_pondering", record_ponderer)
+        monkeypatch.setattr(MonteCarloEngine, "select_and_return_best_real_action", search_alone)
+        engine.play_game_by_turns(30)
+        assert engine.game.is_game_over()
+        assert len(ponderers) == engine.turn - 1
+
+    @pytest.mark.parametrize("game_name", ["connect_four", "otrio"])
+    def test_pondering_with_node_budget(self, game_name: str):
+        # Pruning collapses nodes that pondering may later keep as a search root
+        engine = GameEngine(
+            game_name, sims=100, player_count=2, seed=0, search_options={"ponder": True, "max_nodes": 60}
+        )
+        engine.play_game_by_turns(100)
+        assert engine.game.is_game_over()
+
+    def test_collapsed_search_root_is_expanded(self):
+        game = ConnectFour(player_count=2)
+        montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(0))
+        # Visited but without children, as a collapsed node kept from an earlier turn
+        montecarlo.root.record_visit(5, 0, 0, 0)
+        search_root = montecarlo.node_pool.acquire(player=0)
+        search_root.record_visit(5, 0, 0, 0)
+        action = montecarlo.select_and_return_best_real_action(
+            num_sims=20, game=game, node_player=0, parent=search_root
+        )
+        assert action in range(7)
+        assert len(search_root.children) == 7
+
+    def test_pondering_engine_holds_no_pooled_node(self):
+        engine = GameEngine("connect_four", sims=10, player_count=2, seed=0, search_options={"ponder": True})
+        tree = engine.node_pool.acquire(player=0)
+        ponderer = engine._start_pondering(tree)
+        ponderer.stop()
+        assert ponderer.montecarlo.root is tree
+        assert not any(node is tree for node in engine.node_pool.free_nodes)
@@ -0,0 +1,34 @@
+from engine.monte_carlo_engine import MonteCarloEngine
+from games.game_components.random_service import RandomService
+from games.synthetic_game.synthetic_game import SyntheticGame
+
+
+class TestRandomService:
+    def test_seeded_draws_repeat(self):
+        first, second = RandomService(7, buffer_size=16), RandomService(7, buffer_size=16)
+        assert [first.index(10) for _ in range(50)] == [second.index(10) for _ in range(50)]
+
+    def test_index_range(self):
+        random_service = RandomService(0, buffer_size=8)
+        assert {random_service.index(3) for _ in range(100)} == {0, 1, 2}
+
+    def test_sample_is_distinct(self):
+        random_service = RandomService(0)
+        sample = random_service.sample(range(10), 4)
+        assert len(set(sample)) == 4
+        assert set(sample) <= set(range(10))
+
+    def test_spawned_services_differ(self):
+        first, second = RandomService(0).spawn(2)
+        assert [first.random() for _ in range(5)] != [second.random() for _ in range(5)]
+
+    def test_seeded_search_repeats(self):
+        visits = []
+        for _ in range(2):
+            game = SyntheticGame(branching_factor=4, depth=10)
+            montecarlo = MonteCarloEngine(start_player=0, verbose=False, random_service=RandomService(3))
+            montecarlo.select_and_return_best_real_action(
+                num_sims=200, game=game, node_player=0, parent=montecarlo.root
+            )
+            visits.append([child.number_of_visits for child in montecarlo.root.children])
+        assert visits[0] == visits[1]
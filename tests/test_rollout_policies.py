@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.rollout_policies import (
+    ROLLOUT_POLICIES,
+    EpsilonGreedyRolloutPolicy,
+    MastRolloutPolicy,
+    WinBlockRolloutPolicy,
+)
+from games.connect_four.connect_four import ConnectFour
+from games.game_components.random_service import RandomService
+from games.synthetic_game.synthetic_game import SyntheticGame
+from games.tic_tac_toe.tic_tac_toe import TicTacToe
+
+
+def play_positions(game: TicTacToe, positions: list[int]):
+    for position in positions:
+        game.update_game_with_action(position, game.get_current_player())
+
+
+class TestRolloutPolicies:
+    def test_win_block_takes_win(self):
+        game = TicTacToe(player_count=2)
+        # X holds 0 and 1, O holds 3 and 4, X to move
+        play_positions(game, [0, 3, 1, 4])
+        assert WinBlockRolloutPolicy().choose_action(game, game.get_available_actions(), RandomService(0)) == 2
+
+    def test_win_block_blocks(self):
+        game = TicTacToe(player_count=2)
+        # X holds 0 and 8, O holds 3 and 4, X to move with no win of its own
+        play_positions(game, [0, 3, 8, 4])
+        assert WinBlockRolloutPolicy().choose_action(game, game.get_available_actions(), RandomService(0)) == 5
+
+    def test_falls_back_without_hook(self):
+        game = SyntheticGame()
+        action = WinBlockRolloutPolicy().choose_action(game, game.get_available_actions(), RandomService(0))
+        assert action in game.get_available_actions()
+
+    def test_epsilon_greedy_plays_legal_connect_four_columns(self):
+        game = ConnectFour(player_count=2)
+        # Fill column 6 and leave X a threat at 31, over the empty cell 38
+        for column in [6, 6, 6, 6, 6, 6, 4, 0, 0, 1, 1, 5, 2, 5, 2]:
+            game.update_game_with_action(column, game.get_current_player())
+        policy = EpsilonGreedyRolloutPolicy(epsilon=0)
+        random_service = RandomService(0)
+        legal_actions = game.get_available_actions()
+        assert 6 not in legal_actions
+        for _ in range(20):
+            assert policy.choose_action(game, legal_actions, random_service) in legal_actions
+
+    # The table policy needs a distilled table, see test_policy_tables
+    @pytest.mark.parametrize("policy_name", [name for name in ROLLOUT_POLICIES if name != "table"])
+    def test_search_with_policy(self, policy_name: str):
+        game = TicTacToe(player_count=2)
+        montecarlo = MonteCarloEngine(
+            start_player=0,
+            verbose=False,
+            random_service=RandomService(0),
+            rollout_policy=ROLLOUT_POLICIES[policy_name](),
+        )
+        action = montecarlo.select_and_return_best_real_action(
+            num_sims=50, game=game, node_player=0, parent=montecarlo.root
+        )
+        assert action in range(9)
+        assert game.positions == [TicTacToe.empty_space] * 9
+
+
+class TestMastRolloutPolicy:
+    def test_record_result(self):
+        policy = MastRolloutPolicy()
+        policy.record_result([(0, 4), (1, 0), (0, 8)], {0: 1, 1: -1})
+        policy.record_result([(0, 4), (1, 2)], {0: -1, 1: 1})
+        assert policy.action_values(0, np.array([4, 8])).tolist() == [0, 1]
+        # Actions not played yet score the player's mean over all actions
+        assert policy.action_values(1, np.array([0, 2, 5])).tolist() == [-1, 1, 0]
+
+    def test_prefers_winning_actions(self):
+        game = TicTacToe(player_count=2)
+        policy = MastRolloutPolicy(temperature=0.01)
+        policy.record_result([(0, 4)], {0: 1, 1: -1})
+        policy.record_result([(0, 0)], {0: -1, 1: 1})
+        assert policy.choose_action(game, game.get_available_actions(), RandomService(0)) == 4
+        greedy = MastRolloutPolicy(epsilon=0.0)
+        greedy.record_result([(0, 4)], {0: 1, 1: -1})
+        greedy.record_result([(0, 0)], {0: -1, 1: 1})
+        assert greedy.choose_action(game, game.get_available_actions(), RandomService(0)) == 4
+
+    def test_table_carries_over_between_searches(self):
+        policy = MastRolloutPolicy()
+        game = TicTacToe(player_count=2)
+        for _ in range(2):
+            montecarlo = MonteCarloEngine(start_player=0, verbose=False, rollout_policy=policy, solver=False)
+            montecarlo.select_and_return_best_real_action(num_sims=50, game=game, node_player=0, parent=montecarlo.root)
+            moves = policy.move_counts.sum()
+            assert moves > 0
+        # Both searches' moves are in the table: each simulation plays at least 5 moves
+        assert moves >= 2 * 50 * 5
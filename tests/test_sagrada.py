@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from games.sagrada.action import SagradaAction
+from games.sagrada.sagrada import Sagrada, BLUE, GREEN, RED
+
+
+@pytest.fixture()
+def game():
+    game = Sagrada(player_count=2)
+    # A window with no restrictions and a known draft pool
+    game.pattern_allowed[:] = True
+    game.draft_pool[:] = 0
+    game.draft_pool[RED, 2] = 1
+    game.draft_pool[RED, 4] = 1
+    game.draft_pool[BLUE, 2] = 1
+    game.draft_pool[GREEN, 5] = 1
+    game.save_game_state()
+    return game
+
+
+def action_id(color: int, value: int, cell: int) -> int:
+    return (color * SagradaAction.DIE_FACES + value - 1) * SagradaAction.WINDOW_CELLS + cell
+
+
+def place(game: Sagrada, color: int, value: int, cell: int):
+    game.update_game_with_action(action_id(color, value, cell), game.get_current_player())
+
+
+class TestSagrada:
+    def test_first_die_on_edge(self, game: Sagrada):
+        cells = {SagradaAction.decode_id(action)[2] for action in game.get_available_actions()}
+        # The six inner cells of the 4x5 window are excluded
+        assert cells == set(range(20)) - {6, 7, 8, 11, 12, 13}
+
+    def test_adjacency_rules(self, game: Sagrada):
+        game.current_player_num = 0
+        place(game, RED, 3, 0)
+        game.current_player_num = 0
+        mask = game.legal_placement_mask(0)
+        # Only cells touching the placed die, diagonals included
+        assert set(np.flatnonzero(mask.any(axis=(0, 1)))) == {1, 5, 6}
+        # Orthogonal neighbours cannot share color or value
+        assert not mask[RED, 4, 1] and not mask[BLUE, 2, 5]
+        # Diagonal neighbours can
+        assert mask[RED, 4, 6] and mask[BLUE, 2, 6]
+        assert mask[GREEN, 5, 1]
+
+    def test_pattern_restrictions(self):
+        game = Sagrada(player_count=1)
+        restricted = game.pattern_colors[0] > 0
+        mask = game.legal_placement_mask(0)
+        colors_allowed = mask.any(axis=1).reshape(5, 4, 5)
+        for color in range(5):
+            wrong_color = restricted & (game.pattern_colors[0] != color + 1)
+            assert not colors_allowed[color][wrong_color].any()
+
+    def test_pass_when_no_placement(self, game: Sagrada):
+        game.draft_pool[:] = 0
+        assert list(game.get_available_actions()) == [SagradaAction.PASS]
+        assert list(np.flatnonzero(game.legal_action_mask())) == [SagradaAction.PASS]
+
+    def test_legal_action_mask_matches_available_actions(self, game: Sagrada):
+        assert np.array_equal(np.flatnonzero(game.legal_action_mask()), game.get_available_actions())
+
+    def test_save_and_load(self, game: Sagrada):
+        player = game.get_current_player()
+        place(game, RED, 3, 0)
+        assert game.dice_colors[player, 0, 0] == RED + 1
+        game.load_save_game_state()
+        assert game.dice_colors.sum() == 0
+        assert game.draft_pool[RED, 2] == 1
+        assert game.get_current_player() == player
+
+    def test_random_game_ends(self):
+        game = Sagrada(player_count=3)
+        while not game.is_game_over():
+            actions = game.get_available_actions()
+            game.update_game_with_action(actions[np.random.randint(len(actions))], game.get_current_player())
+        assert game.current_round == Sagrada.total_rounds
+        assert set(game.get_game_scores()) == {0, 1, 2}
@@ -0,0 +1,60 @@
+import pytest
+
+from engine.monte_carlo_engine import MonteCarloEngine
+from engine.monte_carlo_node import MonteCarloNode
+from engine.selection_policies import ScoreNormalizer, UCBTunedSelectionPolicy, UCBVSelectionPolicy
+from games.game_components.random_service import RandomService
+from games.synthetic_game.synthetic_game import SyntheticGame
+
+
+def visited_children(samples: list[list[float]]) -> MonteCarloNode:
+    root = MonteCarloNode(player=1)
+    for action, scores in enumerate(samples):
+        child = MonteCarloNode(parent=root, node_action=action, depth=1, player=0)
+        for score in scores:
+            child.record_visit(1, score, score * score, simulation=1)
+            root.record_visit(1, -score, score * score, simulation=1)
+        root.add_child(child)
+    return root
+
+
+class TestScoreNormalizer:
+    def test_scale(self):
+        normalizer = ScoreNormalizer()
+        normalizer.update({0: 10, 1: 40})
+        normalizer.update({0: 30, 1: 40})
+        assert normalizer.scale(0) == (10, 20)
+        # No range yet
+        assert normalizer.scale(1) == (40, 1.0)
+
+
+class TestSelectionPolicies:
+    @pytest.mark.parametrize("policy_type", [UCBTunedSelectionPolicy, UCBVSelectionPolicy])
+    def test_unvisited_child_first(self, policy_type):
+        root = visited_children([[20, 30], []])
+        policy = policy_type()
+        policy.normalizer.update({0: 0})
+        policy.normalizer.update({0: 40})
+        assert root.best_child(selection=policy) is root.children[1]
+
+    @pytest.mark.parametrize("policy_type", [UCBTunedSelectionPolicy, UCBVSelectionPolicy])
+    def test_steady_child_explored_less(self, policy_type):
+        # Same mean and visits; the noisy child has more left to learn
+        root = visited_children([[20, 20] * 200, [0, 40] * 200])
+        policy = policy_type()
+        policy.normalizer.update({0: 0})
+        policy.normalizer.update({0: 40})
+        assert root.best_child(selection=policy) is root.children[1]
+
+    def test_engine_tracks_squares(self):
+        game = SyntheticGame(branching_factor=3, depth=6, score_distribution="normal")
+        montecarlo = MonteCarloEngine(
+            start_player=0, verbose=False, selection="ucb_tuned", random_service=RandomService(0)
+        )
+        montecarlo.select_and_return_best_real_action(num_sims=100, game=game, node_player=0, parent=montecarlo.root)
+        for child in montecarlo.root.children:
+            assert child.sum_of_squares * child.number_of_visits >= child.total_score**2 - 1e-9
+
+    def test_unknown_selection(self):
+        with pytest.raises(ValueError):
+            MonteCarloEngine(start_player=0, verbose=False, selection="ucb2")
@@ -0,0 +1,61 @@
+import pytest
+
+from engine.monte_carlo_node import NodePool
+from games.synthetic_game.action import SyntheticAction
+from games.synthetic_game.synthetic_game import SyntheticGame
+
+
+def play(game: SyntheticGame, actions: list[int]) -> SyntheticGame:
+    for action in actions:
+        game.update_game_with_action(action, game.get_current_player())
+    return game
+
+
+class TestSyntheticGame:
+    def test_game_ends_at_depth(self):
+        game = play(SyntheticGame(branching_factor=3, depth=5, player_count=3), [0, 1, 2, 0])
+        assert not game.is_game_over()
+        assert game.get_current_player() == 1
+        play(game, [1])
+        assert game.is_game_over()
+        assert len(game.get_available_actions()) == 3
+
+    def test_seeded_tree_is_deterministic(self):
+        first = play(SyntheticGame(seed=7, depth=4), [1, 2, 3, 4])
+        second = play(SyntheticGame(seed=7, depth=4), [1, 2, 3, 4])
+        other_seed = play(SyntheticGame(seed=8, depth=4), [1, 2, 3, 4])
+        assert first.state_key == second.state_key
+        assert first.state_key != other_seed.state_key
+
+    def test_full_transposition_rate_merges_positions(self):
+        reached = {play(SyntheticGame(transposition_rate=1.0), [a, b]).state_key for a in range(8) for b in range(8)}
+        assert len(reached) <= 8
+
+    @pytest.mark.parametrize("score_distribution", SyntheticGame.score_distributions)
+    def test_score_distributions(self, score_distribution: str):
+        game = play(SyntheticGame(depth=2, score_distribution=score_distribution), [0, 0])
+        scores = game.get_game_scores()
+        assert set(scores) == {0, 1}
+        if score_distribution == "win_loss":
+            assert sorted(scores.values()) == [-1, 1]
+
+    def test_save_and_load(self):
+        game = play(SyntheticGame(), [3])
+        game.save_game_state()
+        state_key = game.state_key
+        play(game, [1, 2])
+        game.load_save_game_state()
+        assert (game.state_key, game.ply, game.get_current_player()) == (state_key, 1, 1)
+
+    @pytest.mark.parametrize("branching_factor", [3, 8, 12])
+    def test_action_type_is_as_wide_as_the_branching_factor(self, branching_factor: int):
+        game = SyntheticGame(branching_factor=branching_factor)
+        action_type = game.action_type
+        assert issubclass(action_type, SyntheticAction)
+        assert action_type.ACTION_SPACE_SIZE == branching_factor
+        assert action_type is SyntheticGame(branching_factor=branching_factor, seed=1).action_type
+        assert [action_type.from_id(action).branch for action in game.get_available_actions()] == list(
+            range(branching_factor)
+        )
+        pool = NodePool.dense(action_type)
+        assert pool.acquire(player=0).child_index.shape == (branching_factor,)